@@ -21,6 +21,10 @@ class AnalysisConfig:
     upper_percentile: float = 99.0  # Upper percentile threshold
     # Which metrics to filter (None means all numeric columns)
     metrics_to_filter: Optional[List[str]] = None
+    # Share of a month's or year's days with ground observations needed to compare
+    # its total; keep equal to GriddedDataConfig.min_valid_day_fraction so both
+    # sides of a monthly or yearly comparison are filtered by the same rule
+    min_valid_day_fraction: float = 0.8
     
     def __post_init__(self):
         # Validate percentile values
@@ -40,6 +44,10 @@ class DataConfig:
     start_year: int = 1980
     end_year: int = 2024
     data_dir: str = "Data"
+    # Skip stations whose Meteostat daily inventory cannot cover the period, or
+    # spans less than min_inventory_coverage of its days
+    prune_by_inventory: bool = True
+    min_inventory_coverage: float = 0.0
     
     def __post_init__(self):
         if self.end_year < self.start_year:
@@ -55,6 +63,27 @@ class GroundDataConfig(DataConfig):
     huc_id: Optional[str] = None  # None means all HUCs
     metadata_filename: str = "stations_metadata.csv"
     data_filename: str = "ground_daily_precipitation.csv"
+    # National station inventory, fetched once and re-fetched when older than
+    # inventory_max_age_days; station selections are filtered from it locally
+    # and their station IDs cached per selection (states, HUC, polygon) under
+    # selection_cache_dir
+    inventory_filename: str = "stations_inventory.csv"
+    inventory_max_age_days: int = 30
+    selection_cache_dir: str = "station_selections"
+    max_concurrent_downloads: int = 8  # Stations downloaded from Meteostat at once
+    download_retries: int = 3  # Retries of a failed station download
+    # Only fetch what the saved ground matrix is missing: new stations and the
+    # days after each station's watermark, re-fetching refresh_overlap_days
+    # before it to pick up late corrections
+    incremental_refresh: bool = True
+    refresh_overlap_days: int = 7
+    watermark_filename: str = "ground_watermarks.json"
+    # Directory of bulk station archives read by ArchiveGroundDataFetcher instead
+    # of the Meteostat API: "meteostat" (<station>.csv.gz) or "ghcn" (.dly files
+    # plus ghcnd-stations.txt, matched to stations within ghcn_match_km)
+    archive_dir: Optional[str] = None
+    archive_format: str = "meteostat"
+    ghcn_match_km: float = 2.0
 
     def get_metadata_path(self) -> str:
         return str(Path(self.data_dir) / self.metadata_filename)
@@ -62,6 +91,15 @@ class GroundDataConfig(DataConfig):
     def get_data_path(self) -> str:
         return str(Path(self.data_dir) / self.data_filename)
 
+    def get_watermark_path(self) -> str:
+        return str(Path(self.data_dir) / self.watermark_filename)
+
+    def get_inventory_path(self) -> str:
+        return str(Path(self.data_dir) / self.inventory_filename)
+
+    def get_selection_path(self, key: str) -> str:
+        return str(Path(self.data_dir) / self.selection_cache_dir / f"{key}.csv")
+
 @dataclass
 class GriddedDatasetConfig:
     """Configuration for a single gridded dataset"""
@@ -72,6 +110,16 @@ class GriddedDatasetConfig:
     enabled: bool = False
     time_scale: str = "daily"  # Added: daily, hourly, 3hourly, monthly
     date_range: Optional[Tuple[int, Optional[int]]] = None
+    # Native grid used for sampling; discovered from Earth Engine and cached when not set
+    native_crs: Optional[str] = None
+    native_scale: Optional[float] = None  # Nominal pixel size in meters
+    native_transform: Optional[List[float]] = None
+    # Local mirror of the dataset (NetCDF/GeoTIFF file, directory, glob or Zarr store);
+    # when set the dataset is read from disk instead of Earth Engine
+    local_path: Optional[str] = None
+    # Images arrive at a fixed cadence (time_scale) without gaps, so dates can be generated
+    # client-side; only set for products known to have one image per day/month
+    regular_cadence: bool = False
 
     def get_filename(self) -> str:
         return f"{self.name.lower()}_precipitation.csv"
@@ -81,6 +129,28 @@ class GriddedDataConfig(DataConfig):
     """Configuration for gridded data fetching"""
     datasets: Dict[str, GriddedDatasetConfig] = None
     ee_project_id: str = "ee-sauravbhattarai1999"  # Default project ID
+    max_concurrent_requests: int = 8  # Upper bound on Earth Engine requests in flight
+    max_concurrent_datasets: int = 3  # Datasets fetched at once, sharing the request budget
+    date_index_refresh_hours: float = 24  # Age after which collection date indexes are extended
+    use_cache: bool = True  # Reuse cached results for matching dataset/years/stations
+    cache_max_mb: int = 2048  # Size bound of the fetch cache
+    use_memo: bool = True  # Answer repeated identical Earth Engine computations from disk
+    memo_max_mb: int = 1024  # Size bound of the getInfo memo
+    memo_ttl_hours: Optional[float] = 24 * 30  # Expiry of memoized responses, None for no expiry
+    # Samples reaching into the last memo_recent_days are never memoized: recent
+    # periods of operational and preliminary products are still being filled in
+    memo_recent_days: int = 90
+    output_resolution: str = "daily"  # 'daily', 'monthly' or 'yearly'; coarser sums are computed in Earth Engine
+    min_valid_day_fraction: float = 0.8  # Share of valid days a monthly/yearly sum needs to be kept
+    restrict_to_ground_coverage: bool = False  # Only sample stations and months with ground observations
+    min_ground_coverage: float = 0.0  # Share of days with ground observations a station needs to be sampled
+    ground_data_filename: str = "ground_daily_precipitation.csv"  # Ground matrix the coverage plan is read from
+    stack_daily_datasets: bool = False  # Sample enabled daily datasets together, one request per date block
+    fetch_mode: str = "interactive"  # 'interactive' (getInfo requests) or 'export' (batch table exports)
+    export_bucket: Optional[str] = None  # Cloud Storage bucket receiving export mode tables (required)
+    export_poll_seconds: float = 30  # Interval between export task status checks
+    export_timeout_hours: Optional[float] = 24  # Tasks still pending after this long count as failed
+    bulk_pixel_ratio: float = 4.0  # Download pixel blocks when the station box has at most this many pixels per station (0 disables)
     
     def __post_init__(self):
         super().__post_init__()
@@ -90,7 +160,8 @@ class GriddedDataConfig(DataConfig):
                     name='ERA5',
                     collection_name="ECMWF/ERA5_LAND/DAILY_AGGR",
                     variable_name="total_precipitation_sum",
-                    conversion_factor=1000  # Convert to mm
+                    conversion_factor=1000,  # Convert to mm
+                    regular_cadence=True
                 ),
                 'DAYMET': GriddedDatasetConfig(
                     name='DAYMET',
@@ -100,13 +171,15 @@ class GriddedDataConfig(DataConfig):
                 'PRISM': GriddedDatasetConfig(
                     name='PRISM',
                     collection_name="OREGONSTATE/PRISM/AN81d",
-                    variable_name="ppt"
+                    variable_name="ppt",
+                    regular_cadence=True
                 ),
                 'CHIRPS': GriddedDatasetConfig(
                     name='CHIRPS',
                     collection_name="UCSB-CHG/CHIRPS/DAILY",
                     variable_name="precipitation",
                     time_scale="daily",
+                    regular_cadence=True
                     # Already in mm/day, no conversion needed
                 ),
                 'FLDAS': GriddedDatasetConfig(
@@ -114,7 +187,8 @@ class GriddedDataConfig(DataConfig):
                     collection_name="NASA/FLDAS/NOAH01/C/GL/M/V001",
                     variable_name="Rainf_f_tavg",
                     conversion_factor=86400,  # Convert kg/m²/s to mm/day
-                    time_scale="monthly"
+                    time_scale="monthly",
+                    regular_cadence=True
                 ),
                 'GSMAP': GriddedDatasetConfig(
                     name='GSMAP',
@@ -144,5 +218,13 @@ class GriddedDataConfig(DataConfig):
     def get_enabled_datasets(self) -> List[GriddedDatasetConfig]:
         return [ds for ds in self.datasets.values() if ds.enabled]
 
+    def get_local_datasets(self) -> List[GriddedDatasetConfig]:
+        """Enabled datasets read from local archives"""
+        return [ds for ds in self.get_enabled_datasets() if ds.local_path]
+
+    def get_remote_datasets(self) -> List[GriddedDatasetConfig]:
+        """Enabled datasets fetched from Earth Engine"""
+        return [ds for ds in self.get_enabled_datasets() if not ds.local_path]
+
     def is_valid(self) -> bool:
         return any(ds.enabled for ds in self.datasets.values())
\ No newline at end of file
@@ -7,6 +7,8 @@ from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from src.data.ground_fetcher import GroundDataFetcher
 from src.data.gridded_fetcher import GriddedDataFetcher
+from src.data.local_raster_fetcher import LocalRasterFetcher
+from src.data.station_archive import ArchiveGroundDataFetcher
 from utils.utils import compare_datasets
 
 logger = logging.getLogger(__name__)
@@ -80,7 +82,11 @@ class DataFetchingController(QObject):
                 self.status_updated.emit("Fetching ground data...")
                 logger.info("Fetching ground data")
                 
-                fetcher = GroundDataFetcher(ground_config)
+                # Station records come from local bulk archives when configured
+                if ground_config.archive_dir:
+                    fetcher = ArchiveGroundDataFetcher(ground_config)
+                else:
+                    fetcher = GroundDataFetcher(ground_config)
                 
                 # If polygon is provided, set it for filtering
                 if polygon_feature:
@@ -101,27 +107,38 @@ class DataFetchingController(QObject):
                     self.status_updated.emit("Fetching gridded data...")
                     logger.info("Fetching gridded data")
                     
-                    fetcher = GriddedDataFetcher(gridded_config)
+                    # Set up progress tracking; datasets are fetched concurrently,
+                    # so overall progress sums the latest progress of each one
+                    dataset_progress = {}
+                    base_step = current_step
                     
-                    # Set up progress tracking
                     def progress_callback(dataset, progress):
-                        nonlocal current_step
-                        # Increment step for completed datasets
-                        if progress == 100:
-                            current_step += 1
+                        dataset_progress[dataset] = progress
                         # Calculate overall progress
-                        dataset_progress = progress / 100
-                        overall_progress = (current_step + dataset_progress) / total_steps
+                        overall_progress = (base_step + sum(dataset_progress.values()) / 100) / total_steps
                         self.progress_updated.emit(int(overall_progress * 100))
                         
                         # Update status
                         self.status_updated.emit(f"Fetching {dataset} data: {progress}%")
                     
-                    # Register callback
-                    fetcher.set_progress_callback(progress_callback)
+                    gridded_results = {}
+                    
+                    # Datasets with a local mirror are read from disk
+                    if gridded_config.get_local_datasets():
+                        local_fetcher = LocalRasterFetcher(gridded_config)
+                        local_fetcher.set_progress_callback(progress_callback)
+                        gridded_results.update(local_fetcher.process())
+                    
+                    # The remaining datasets come from Earth Engine
+                    if gridded_config.get_remote_datasets():
+                        fetcher = GriddedDataFetcher(gridded_config)
+                        
+                        # Register callback
+                        fetcher.set_progress_callback(progress_callback)
+                        
+                        # Process data
+                        gridded_results.update(fetcher.process())
                     
-                    # Process data
-                    gridded_results = fetcher.process()
                     self.gridded_data = gridded_results
                     results.update(gridded_results)
                     
@@ -5,6 +5,7 @@ import sys
 import logging
 from PyQt5.QtWidgets import QApplication
 from ui.app_window import ClimateDataApp
+from utils.ee_session import get_session
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +19,17 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+def start_earth_engine_session():
+    """Start the shared Earth Engine session with the configured project ID"""
+    try:
+        from utils.config_manager import ConfigManager
+        project_id = ConfigManager.get_earth_engine_config().get('project_id')
+    except Exception as e:
+        logger.warning(f"Could not read Earth Engine configuration: {str(e)}")
+        project_id = None
+        
+    get_session().start_background(project_id or "ee-sauravbhattarai1999")
+
 def main():
     """
     Main entry point for the Climate Data Fetcher application.
@@ -26,6 +38,9 @@ def main():
     try:
         logger.info("Starting Climate Data Fetcher Application")
         
+        # Initialize Earth Engine in the background while the UI starts
+        start_earth_engine_session()
+        
         # Create QApplication instance
         app = QApplication(sys.argv)
         app.setApplicationName("Climate Data Fetcher")
@@ -1,7 +1,7 @@
 from typing import Dict, List, Tuple, Callable, Optional, Any
 import pandas as pd
-import numpy as np
 from pathlib import Path
+import json
 import warnings
 import logging
 from utils.statistical_utils import (
@@ -123,48 +123,49 @@ class GriddedDataAnalyzer:
         self._update_status(f"Analyzing {dataset_name}...")
         
         try:
-            # Check if this is FLDAS (monthly dataset)
-            is_monthly_dataset = dataset_name == "FLDAS"
+            # FLDAS is monthly; other datasets may have been fetched as monthly or
+            # yearly sums (output_resolution) and are compared at that resolution
+            resolution = 'monthly' if dataset_name == "FLDAS" else self.infer_resolution(gridded_data)
             
-            # Preprocess data
-            ground, gridded = self.preprocess_data(self.ground_data, gridded_data)
-            
-            # For FLDAS, aggregate ground data to monthly before comparison
-            if is_monthly_dataset:
-                self._update_status("FLDAS detected - aggregating ground data to monthly...")
-                ground = self.aggregate_to_monthly(ground)
-                
-                # Also check if gridded data needs resampling to monthly
-                if not self.is_monthly_data(gridded):
-                    gridded = self.aggregate_to_monthly(gridded)
-            
-            # Create output directory
-            output_dir = self.create_dataset_folder(dataset_name)
-            
-            # Continue with existing analysis process, but skip daily stats for monthly data
-            if is_monthly_dataset:
-                # Skip daily stats, only compute monthly and yearly stats
-                self._update_status("Computing monthly statistics for FLDAS...")
-                monthly_stats = calculate_stats_for_all_stations(ground, gridded)
+            if resolution != 'daily':
+                # Skip daily stats, aggregate ground data to the dataset's resolution
+                self._update_status(f"{dataset_name} is {resolution} - aggregating ground data to {resolution}...")
+                ground = self.aggregate_ground(self.ground_data, resolution)
+                ground, gridded = self.preprocess_data(ground, gridded_data)
+                
+                # Create output directory
+                output_dir = self.create_dataset_folder(dataset_name)
+                
+                self._update_status(f"Computing {resolution} statistics for {dataset_name}...")
+                period_stats = calculate_stats_for_all_stations(ground, gridded)
                 
                 # Apply filtering if configured
                 if hasattr(self, 'analysis_config') and self.analysis_config.filter_extremes:
                     self._update_status(f"Filtering extreme values ({self.analysis_config.lower_percentile}-{self.analysis_config.upper_percentile} percentiles)...")
-                    monthly_stats = filter_extreme_stats(
-                        monthly_stats,
+                    period_stats = filter_extreme_stats(
+                        period_stats,
                         lower_percentile=self.analysis_config.lower_percentile,
                         upper_percentile=self.analysis_config.upper_percentile,
                         columns_to_filter=self.analysis_config.metrics_to_filter
                     )
                 
-                monthly_stats.to_csv(output_dir / 'monthly_stats.csv')
+                period_stats.to_csv(output_dir / f'{resolution}_stats.csv')
                 
                 # Add metadata about temporal resolution
                 with open(output_dir / 'temporal_info.json', 'w') as f:
                     json.dump({
-                        'temporal_resolution': 'monthly',
-                        'note': 'Ground data aggregated to monthly for comparison with FLDAS'
+                        'temporal_resolution': resolution,
+                        'note': f'Ground data aggregated to {resolution} for comparison with {dataset_name}'
                     }, f)
+                
+                summary = {
+                    'n_stations': len(ground.columns),
+                    'start_date': ground.index.min(),
+                    'end_date': ground.index.max(),
+                    'total_periods': len(ground),
+                    'temporal_resolution': resolution
+                }
+                pd.DataFrame([summary]).to_csv(output_dir / 'analysis_summary.csv', index=False)
             else:
                 # Preprocess data
                 ground, gridded = self.preprocess_data(self.ground_data, gridded_data)
@@ -292,6 +293,42 @@ class GriddedDataAnalyzer:
             self._update_status(f"Error analyzing {dataset_name}: {str(e)}")
             return {}
     
+    def aggregate_ground(self, ground: pd.DataFrame, resolution: str) -> pd.DataFrame:
+        """
+        Aggregate daily ground data to monthly or yearly sums labelled by period start
+        
+        Periods with observations on fewer than ``min_valid_day_fraction`` of their
+        calendar days are left out, the rule Earth Engine composites are masked by.
+        """
+        config = getattr(self, 'analysis_config', None) or AnalysisConfig()
+        periods = ground.index.to_period('M' if resolution == 'monthly' else 'Y')
+        grouped = ground.groupby(periods)
+        sums = grouped.sum(min_count=1)
+        counts = grouped.count()
+        
+        period_days = (sums.index.end_time.normalize() - sums.index.start_time).days + 1
+        valid = counts.ge(config.min_valid_day_fraction * period_days.to_numpy(), axis=0)
+        aggregated = sums.where(valid)
+        aggregated.index = aggregated.index.to_timestamp()
+        return aggregated
+    
+    def infer_resolution(self, df: pd.DataFrame) -> str:
+        """Temporal resolution of a gridded dataset: 'daily', 'monthly' or 'yearly'"""
+        if self.is_yearly_data(df):
+            return 'yearly'
+        if self.is_monthly_data(df):
+            return 'monthly'
+        return 'daily'
+    
+    def is_yearly_data(self, df: pd.DataFrame) -> bool:
+        """Check if dataframe appears to have yearly data"""
+        # A single January row could just as well be a short daily or monthly series
+        if len(df) < 2:
+            return False
+            
+        expected_years = df.index.max().year - df.index.min().year + 1
+        return (df.index.month == 1).all() and (df.index.day == 1).all() and len(df) <= expected_years
+        
     def is_monthly_data(self, df: pd.DataFrame) -> bool:
         """Check if dataframe appears to have monthly data"""
         # Check if the index has approximately one entry per month
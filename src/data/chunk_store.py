@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class ChunkStore:
+    """
+    On-disk checkpoint store for a single gridded dataset fetch.
+
+    Each chunk (one dataset-month) is written to its own file as soon as it is
+    fetched, and a JSON manifest records which chunks are complete. Each request
+    signature (collection, band, stations, ...) gets its own subdirectory, and the
+    manifest repeats the signature so mismatching chunks are never reused.
+    Chunks can also carry a tag (e.g. the stations sampled in the month); a
+    chunk saved under a different tag than the current one counts as missing.
+    """
+
+    MANIFEST_FILENAME = "manifest.json"
+
+    def __init__(self, root_dir: str, dataset_name: str, signature: Dict[str, Any],
+                 chunk_tags: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            root_dir: Directory holding the chunk stores of all datasets
+            dataset_name: Name of the dataset, used as the store subdirectory
+            signature: JSON-serialisable description of the request
+            chunk_tags: Current tag of each chunk key, if chunks are tagged
+        """
+        self.dataset_name = dataset_name
+        self.chunk_tags = chunk_tags or {}
+        signature_hash = hashlib.sha1(json.dumps(signature, sort_keys=True).encode('utf-8')).hexdigest()
+        self.directory = Path(root_dir) / dataset_name / signature_hash[:16]
+        self.signature = signature
+        self._lock = threading.Lock()
+        self._manifest = self._load_manifest()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / self.MANIFEST_FILENAME
+
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the manifest, resetting the store if it was built for another request"""
+        if self.manifest_path.exists():
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    manifest = json.load(f)
+                if manifest.get('signature') == self.signature:
+                    logger.info(f"Resuming {self.dataset_name} from {len(manifest.get('chunks', {}))} "
+                                f"checkpointed chunks in {self.directory}")
+                    return manifest
+                logger.info(f"Discarding {self.dataset_name} checkpoints made for a different request")
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Invalid chunk manifest {self.manifest_path}, starting over: {str(e)}")
+
+        self.clear()
+        return {'signature': self.signature, 'chunks': {}}
+
+    def _write_manifest(self) -> None:
+        """Atomically replace the manifest file"""
+        tmp_path = self.manifest_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _chunk_path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def _is_current(self, key: str, entry: Dict[str, Any]) -> bool:
+        return entry.get('tag') == self.chunk_tags.get(key)
+
+    def completed_keys(self) -> Set[str]:
+        """Keys of all completed chunks saved under their current tag"""
+        with self._lock:
+            return {key for key, entry in self._manifest['chunks'].items() if self._is_current(key, entry)}
+
+    def has(self, key: str) -> bool:
+        """Check whether a chunk has been completed under its current tag"""
+        with self._lock:
+            entry = self._manifest['chunks'].get(key)
+            return entry is not None and self._is_current(key, entry)
+
+    def missing(self, keys: Iterable[str]) -> List[str]:
+        """Keys from ``keys`` that have not been completed, in order"""
+        completed = self.completed_keys()
+        return [key for key in keys if key not in completed]
+
+    def save_chunk(self, key: str, data: pd.DataFrame) -> None:
+        """
+        Persist a completed chunk and record it in the manifest
+
+        Args:
+            key: Chunk key (e.g. '1980-01')
+            data: Date-indexed frame with stations as columns
+        """
+        path = self._chunk_path(key)
+        tmp_path = path.with_suffix('.tmp')
+        data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._manifest['chunks'][key] = {'file': path.name, 'rows': len(data),
+                                             'tag': self.chunk_tags.get(key)}
+            self._write_manifest()
+
+    def load_chunk(self, key: str) -> Optional[pd.DataFrame]:
+        """Load a completed chunk, or None if it is missing or unreadable"""
+        if not self.has(key):
+            return None
+
+        try:
+            return pd.read_pickle(self._chunk_path(key))
+        except Exception as e:
+            logger.warning(f"Could not read chunk {key} of {self.dataset_name}: {str(e)}")
+            with self._lock:
+                self._manifest['chunks'].pop(key, None)
+                self._write_manifest()
+            return None
+
+    def clear(self) -> None:
+        """Remove every chunk and the manifest"""
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def discard(self) -> None:
+        """Remove the store directory once its chunks are no longer needed"""
+        if self.directory.exists():
+            shutil.rmtree(self.directory)
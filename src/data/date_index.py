@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import copy
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class CollectionDateIndex:
+    """
+    Persistent index of the image timestamps of each Earth Engine collection.
+
+    Each entry records the first and last ``system:time_start`` (ms) of a
+    collection and, for collections without a regular cadence, the full list
+    of timestamps. Entries are only extended with timestamps after the last
+    known one, so the full-record scan happens once per collection.
+
+    Entry layout::
+
+        {'first': ms, 'last': ms, 'timestamps': [ms, ...] or None, 'checked': epoch seconds}
+    """
+
+    FILENAME = "collection_dates.json"
+
+    def __init__(self, data_dir: str):
+        self.path = Path(data_dir) / self.FILENAME
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Invalid collection date index {self.path}, ignoring it: {str(e)}")
+            return {}
+
+    def get(self, collection_name: str) -> Optional[Dict[str, Any]]:
+        """Copy of the indexed entry of a collection, or None"""
+        with self._lock:
+            entry = self._entries.get(collection_name)
+            return copy.deepcopy(entry) if entry is not None else None
+
+    def put(self, collection_name: str, entry: Dict[str, Any]) -> None:
+        """Store the entry of a collection"""
+        with self._lock:
+            self._entries[collection_name] = entry
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+# Conditional import for Earth Engine
+try:
+    import ee
+    EARTH_ENGINE_AVAILABLE = True
+except ImportError:
+    EARTH_ENGINE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class EEBackend(ABC):
+    """
+    Abstract Earth Engine backend used by the gridded fetchers.
+
+    A backend exposes the subset of the ``ee`` namespace the fetchers build their
+    requests from (ImageCollection, Image, Feature, FeatureCollection, Geometry,
+    Date, String, List, Dictionary, Filter, Projection) plus ``initialize``.
+    Results are only materialised by ``getInfo()`` calls on the objects it returns.
+    """
+
+    @abstractmethod
+    def initialize(self, project_id: Optional[str] = None) -> None:
+        """Prepare the backend for requests"""
+        pass
+
+class EarthEngineBackend(EEBackend):
+    """Backend delegating to the earthengine-api module"""
+
+    def __init__(self):
+        if not EARTH_ENGINE_AVAILABLE:
+            raise ImportError("Earth Engine API not available. Install with: pip install earthengine-api")
+
+    def initialize(self, project_id: Optional[str] = None) -> None:
+        if project_id:
+            ee.Initialize(project=project_id)
+        else:
+            ee.Initialize()
+
+    def __getattr__(self, name):
+        return getattr(ee, name)
+
+def get_default_backend() -> Optional[EEBackend]:
+    """The earthengine-api backend, or None when the package is not installed"""
+    if not EARTH_ENGINE_AVAILABLE:
+        return None
+    return EarthEngineBackend()
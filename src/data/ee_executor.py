@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.data.ee_memo import GetInfoMemo
+
+logger = logging.getLogger(__name__)
+
+# Error fragments that indicate a transient, throttling-type failure worth retrying.
+# Memory and computation timeouts are not retried here: the callers shrink the
+# request instead.
+RETRYABLE_ERROR_PATTERNS = (
+    'too many concurrent aggregations',
+    'too many requests',
+    'quota',
+    'rate limit',
+    'rate exceeded',
+    '429',
+    '503',
+    'service unavailable',
+    'backend error',
+    'connection reset',
+    'connection aborted',
+)
+
+def is_retryable_error(error: Exception) -> bool:
+    """Check whether an Earth Engine error is transient and worth retrying"""
+    message = str(error).lower()
+    return any(pattern in message for pattern in RETRYABLE_ERROR_PATTERNS)
+
+@dataclass
+class RequestTiming:
+    """Timing record for a single executed request"""
+    label: str
+    latency: float
+    attempts: int
+    success: bool
+
+class EERequestExecutor:
+    """
+    Runs Earth Engine requests on a thread pool with bounded, adaptive concurrency.
+
+    At most ``concurrency`` requests are in flight at once. Throttling errors are
+    retried with jittered exponential backoff and halve the concurrency limit;
+    a run of fast successes raises it again by one, up to ``max_concurrency``.
+    """
+
+    def __init__(self, max_concurrency: int = 8, initial_concurrency: Optional[int] = None,
+                 min_concurrency: int = 1, max_retries: int = 5, base_delay: float = 1.0,
+                 max_delay: float = 60.0, latency_tolerance: float = 2.0,
+                 memo: Optional[GetInfoMemo] = None):
+        """
+        Args:
+            max_concurrency: Upper bound on requests in flight
+            initial_concurrency: Starting limit (defaults to half of max_concurrency)
+            min_concurrency: Lower bound on requests in flight
+            max_retries: Retries per request for retryable errors
+            base_delay: Base backoff delay in seconds
+            max_delay: Maximum backoff delay in seconds
+            latency_tolerance: Concurrency only grows while the average latency stays
+                below this multiple of the best latency observed
+            memo: Optional getInfo memo consulted by get_info before any request is made
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        if initial_concurrency is None:
+            initial_concurrency = max(self.min_concurrency, self.max_concurrency // 2)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.latency_tolerance = latency_tolerance
+        self.memo = memo
+
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                        thread_name_prefix="ee-request")
+        self._condition = threading.Condition()
+        self._concurrency = min(self.max_concurrency, max(self.min_concurrency, initial_concurrency))
+        self._in_flight = 0
+        self._success_streak = 0
+        self._avg_latency: Optional[float] = None
+        self._best_latency: Optional[float] = None
+        self._timings: List[RequestTiming] = []
+
+    @property
+    def concurrency(self) -> int:
+        """Current limit on requests in flight"""
+        return self._concurrency
+
+    def submit(self, fn: Callable[[], Any], label: str = "") -> Future:
+        """
+        Schedule a request
+
+        Args:
+            fn: Zero-argument callable performing the blocking EE call.
+                It must not itself wait on this executor.
+            label: Name used in timing reports and log messages
+
+        Returns:
+            Future resolving to the callable's return value
+        """
+        return self._pool.submit(self._run, fn, label)
+
+    def get_info(self, ee_object, label: str = "", ttl: Optional[float] = None,
+                 bypass_memo: bool = False, memoize: bool = True) -> Future:
+        """
+        Schedule ``ee_object.getInfo()``
+
+        Results memoized for the same computation are returned without a request.
+
+        Args:
+            ee_object: Earth Engine object to compute
+            label: Name used in timing reports and log messages
+            ttl: Seconds a memoized result stays valid, defaults to the memo's TTL
+            bypass_memo: Always send the request (the fresh result is still memoized)
+            memoize: When False the memo is neither read nor written
+        """
+        use_memo = memoize and self.memo is not None and self.memo.enabled
+        key = self.memo.key_for(ee_object) if use_memo else None
+        if key is None:
+            return self.submit(ee_object.getInfo, label)
+
+        if not bypass_memo:
+            found, response = self.memo.lookup(key)
+            if found:
+                future = Future()
+                future.set_result(response)
+                return future
+
+        return self.submit(lambda: self.memo.compute(key, ee_object, ttl), label)
+
+    def _acquire_slot(self) -> None:
+        with self._condition:
+            while self._in_flight >= self._concurrency:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def _release_slot(self) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def _run(self, fn: Callable[[], Any], label: str) -> Any:
+        attempt = 0
+        started = time.perf_counter()
+
+        while True:
+            attempt += 1
+            self._acquire_slot()
+            call_started = time.perf_counter()
+            try:
+                result = fn()
+            except Exception as e:
+                self._release_slot()
+                if not is_retryable_error(e) or attempt > self.max_retries:
+                    self._record(RequestTiming(label, time.perf_counter() - started, attempt, False))
+                    raise
+
+                self._on_throttled()
+                delay = self._backoff_delay(attempt)
+                logger.warning(f"Retrying EE request {label or ''} in {delay:.1f}s "
+                               f"(attempt {attempt}/{self.max_retries}): {str(e)}")
+                time.sleep(delay)
+                continue
+
+            self._release_slot()
+            self._on_success(time.perf_counter() - call_started)
+            self._record(RequestTiming(label, time.perf_counter() - started, attempt, True))
+            return result
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with jitter"""
+        cap = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(cap / 2, cap)
+
+    def _on_success(self, latency: float) -> None:
+        with self._condition:
+            if self._avg_latency is None:
+                self._avg_latency = latency
+            else:
+                self._avg_latency = 0.8 * self._avg_latency + 0.2 * latency
+            if self._best_latency is None or latency < self._best_latency:
+                self._best_latency = latency
+
+            # Additive increase once a full window of requests succeeded without
+            # latency degrading
+            self._success_streak += 1
+            if (self._success_streak >= self._concurrency
+                    and self._concurrency < self.max_concurrency
+                    and self._avg_latency <= self._best_latency * self.latency_tolerance):
+                self._concurrency += 1
+                self._success_streak = 0
+                logger.debug(f"EE request concurrency raised to {self._concurrency}")
+                self._condition.notify_all()
+            elif (self._avg_latency > self._best_latency * self.latency_tolerance * 2
+                    and self._concurrency > self.min_concurrency):
+                # Back off when the server is clearly slowing down under load
+                self._concurrency -= 1
+                self._success_streak = 0
+                self._avg_latency = self._best_latency * self.latency_tolerance
+                logger.debug(f"EE request concurrency lowered to {self._concurrency}")
+
+    def _on_throttled(self) -> None:
+        with self._condition:
+            # Multiplicative decrease on throttling errors
+            self._success_streak = 0
+            new_limit = max(self.min_concurrency, self._concurrency // 2)
+            if new_limit != self._concurrency:
+                self._concurrency = new_limit
+                logger.info(f"EE request concurrency lowered to {self._concurrency}")
+
+    def _record(self, timing: RequestTiming) -> None:
+        with self._condition:
+            self._timings.append(timing)
+        logger.debug(f"EE request {timing.label} finished in {timing.latency:.2f}s "
+                     f"after {timing.attempts} attempt(s), success={timing.success}")
+
+    def get_timings(self) -> List[RequestTiming]:
+        """Per-request timing records collected so far"""
+        with self._condition:
+            return list(self._timings)
+
+    def get_stats(self, label_prefix: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Summary of request timings collected so far
+
+        Args:
+            label_prefix: Only include requests whose label starts with this prefix
+        """
+        timings = self.get_timings()
+        if label_prefix is not None:
+            timings = [t for t in timings if t.label.startswith(label_prefix)]
+        latencies = np.array([t.latency for t in timings]) if timings else np.array([0.0])
+
+        return {
+            'requests': len(timings),
+            'failed': sum(1 for t in timings if not t.success),
+            'retries': sum(t.attempts - 1 for t in timings),
+            'mean_latency': float(latencies.mean()),
+            'p50_latency': float(np.percentile(latencies, 50)),
+            'p95_latency': float(np.percentile(latencies, 95)),
+            'concurrency': self._concurrency
+        }
+
+    def reset_stats(self) -> None:
+        """Clear collected timing records"""
+        with self._condition:
+            self._timings = []
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool"""
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class GetInfoMemo:
+    """
+    Disk-backed memo of Earth Engine ``getInfo`` results.
+
+    Entries are keyed on a hash of the serialized computation graph of the
+    requested object, so identical computations are only ever sent to Earth
+    Engine once. Responses are stored as gzipped JSON with an optional TTL, and
+    the memo is kept under ``max_bytes`` by evicting least recently used entries.
+    Objects that cannot be serialized are always computed. The index is written
+    at most every ``flush_interval`` seconds and on ``flush()``/``close()``.
+    """
+
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 ** 3,
+                 default_ttl: Optional[float] = None, enabled: bool = True,
+                 flush_interval: float = 30.0):
+        """
+        Args:
+            cache_dir: Directory holding memoized responses and the index
+            max_bytes: Size bound of the memo on disk
+            default_ttl: Seconds an entry stays valid, None for no expiry
+            enabled: When False every call goes to Earth Engine and nothing is stored
+            flush_interval: Seconds between index writes triggered by stores
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.enabled = enabled
+        self.flush_interval = flush_interval
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Serialises index snapshots and writes, which happen outside _lock
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._last_flush = time.time()
+        self._index = self._load_index()
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / self.INDEX_FILENAME
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Invalid getInfo memo index {self.index_path}, starting empty: {str(e)}")
+            return {}
+
+        return {key: entry for key, entry in index.items()
+                if (self.cache_dir / entry['file']).exists()}
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        with tempfile.NamedTemporaryFile('w', dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            json.dump(index, f)
+        os.replace(f.name, self.index_path)
+
+    @staticmethod
+    def key_for(ee_object: Any) -> Optional[str]:
+        """Hash of the serialized computation graph, or None if it cannot be serialized"""
+        serialize = getattr(ee_object, 'serialize', None)
+        if serialize is None:
+            return None
+        try:
+            serialized = serialize()
+        except Exception as e:
+            logger.debug(f"Cannot serialize EE object for memoization: {str(e)}")
+            return None
+        return hashlib.sha256(str(serialized).encode('utf-8')).hexdigest()
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        Memoized response for a key
+
+        Returns:
+            Tuple of (found, response)
+        """
+        with self._lock:
+            entry = self._index.get(key)
+        if entry is None:
+            self._count(hit=False)
+            return False, None
+
+        if entry.get('expires') is not None and time.time() > entry['expires']:
+            self._remove(key)
+            self._count(hit=False)
+            return False, None
+
+        try:
+            with gzip.open(self.cache_dir / entry['file'], 'rt', encoding='utf-8') as f:
+                response = json.load(f)
+        except Exception as e:
+            logger.warning(f"Dropping unreadable getInfo memo entry {key}: {str(e)}")
+            self._remove(key)
+            self._count(hit=False)
+            return False, None
+
+        with self._lock:
+            if key in self._index:
+                self._index[key]['last_access'] = time.time()
+                self._dirty = True
+            self.hits += 1
+        return True, response
+
+    def _count(self, hit: bool) -> None:
+        """Record a lookup; lookups run on executor threads"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def compute(self, key: str, ee_object: Any, ttl: Optional[float] = None) -> Any:
+        """Run ``ee_object.getInfo()`` and store the result under ``key``"""
+        response = ee_object.getInfo()
+        self.store(key, response, ttl)
+        return response
+
+    def store(self, key: str, response: Any, ttl: Optional[float] = None) -> None:
+        """Persist a decoded getInfo response"""
+        try:
+            payload = json.dumps(response).encode('utf-8')
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Response is not JSON-serialisable, not memoizing: {str(e)}")
+            return
+        # Threads memoizing the same computation each write their own temporary file
+        path = self.cache_dir / f"{key}.json.gz"
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix='.tmp', delete=False) as f:
+            with gzip.GzipFile(fileobj=f, mode='wb') as gz:
+                gz.write(payload)
+        os.replace(f.name, path)
+
+        ttl = self.default_ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            self._index[key] = {
+                'file': path.name,
+                'size': path.stat().st_size,
+                'created': now,
+                'last_access': now,
+                'expires': now + ttl if ttl is not None else None
+            }
+            self._evict(keep=key)
+            self._dirty = True
+        self._flush_if_due()
+
+    def get_info(self, ee_object: Any, ttl: Optional[float] = None, bypass: bool = False) -> Any:
+        """
+        ``ee_object.getInfo()``, answered from the memo when possible
+
+        Args:
+            ee_object: Earth Engine object to compute
+            ttl: Seconds the result stays valid, defaults to default_ttl
+            bypass: Always compute, but still store the fresh result
+        """
+        key = self.key_for(ee_object) if self.enabled else None
+        if key is None:
+            return ee_object.getInfo()
+
+        if not bypass:
+            found, response = self.lookup(key)
+            if found:
+                return response
+
+        return self.compute(key, ee_object, ttl)
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            entry = self._index.pop(key, None)
+            if entry is not None:
+                (self.cache_dir / entry['file']).unlink(missing_ok=True)
+                self._dirty = True
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Evict expired, then least recently used entries until the memo fits max_bytes (lock held)"""
+        now = time.time()
+        for key, entry in list(self._index.items()):
+            if key != keep and entry.get('expires') is not None and now > entry['expires']:
+                (self.cache_dir / entry['file']).unlink(missing_ok=True)
+                del self._index[key]
+
+        total = sum(entry['size'] for entry in self._index.values())
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            (self.cache_dir / entry['file']).unlink(missing_ok=True)
+            del self._index[key]
+            total -= entry['size']
+
+    def _flush_if_due(self) -> None:
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist index changes and access times recorded since the last write"""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                snapshot = {key: dict(entry) for key, entry in self._index.items()}
+                self._dirty = False
+                self._last_flush = time.time()
+            self._write_index(snapshot)
+
+    def close(self) -> None:
+        """Write any pending index changes"""
+        self.flush()
+
+    def size(self) -> int:
+        """Total size of memoized responses in bytes"""
+        with self._lock:
+            return sum(entry['size'] for entry in self._index.values())
+
+    def clear(self) -> None:
+        """Remove every memoized response"""
+        with self._lock:
+            for entry in self._index.values():
+                (self.cache_dir / entry['file']).unlink(missing_ok=True)
+            self._index = {}
+            self._dirty = True
+        self.flush()
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import logging
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+try:
+    from google.cloud import storage
+    GCS_AVAILABLE = True
+except ImportError:
+    GCS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Task states as reported by Earth Engine
+COMPLETED = 'COMPLETED'
+FAILED_STATES = ('FAILED', 'CANCELLED', 'CANCEL_REQUESTED')
+
+def export_description(*parts: Any) -> str:
+    """Task description made of the allowed characters (letters, digits, '-', '_'), at most 100 long"""
+    return re.sub(r'[^A-Za-z0-9_-]', '_', '_'.join(str(part) for part in parts))[:100]
+
+class ExportTaskBackend(ABC):
+    """Submits table exports and reads back their results"""
+
+    @abstractmethod
+    def submit(self, collection: Any, description: str) -> str:
+        """Start exporting a FeatureCollection as a table, returning the task ID"""
+
+    @abstractmethod
+    def status(self, task_id: str) -> Dict[str, Any]:
+        """Task status with at least 'state' and, for failures, 'error_message'"""
+
+    @abstractmethod
+    def read_table(self, task_id: str) -> pd.DataFrame:
+        """Exported table of a completed task"""
+
+    @abstractmethod
+    def cancel(self, task_id: str) -> None:
+        """Stop a task that is no longer waited for"""
+
+class EarthEngineExportBackend(ExportTaskBackend):
+    """Exports tables to Cloud Storage with Earth Engine batch tasks"""
+
+    def __init__(self, ee: Any, bucket: str, prefix: str = "gridded_exports",
+                 project_id: Optional[str] = None):
+        """
+        Args:
+            ee: Earth Engine backend
+            bucket: Cloud Storage bucket receiving the exported CSV files
+            prefix: Object name prefix of the exports
+            project_id: Cloud project used to read the bucket
+        """
+        if not GCS_AVAILABLE:
+            raise ImportError("google-cloud-storage is required to read exported tables. "
+                              "Install with: pip install google-cloud-storage")
+        self.ee = ee
+        self.bucket = bucket
+        self.prefix = prefix
+        self._client = storage.Client(project=project_id)
+        self._tasks: Dict[str, Tuple[Any, str]] = {}
+
+    def submit(self, collection: Any, description: str) -> str:
+        file_prefix = f"{self.prefix}/{description}"
+        task = self.ee.batch.Export.table.toCloudStorage(
+            collection=collection,
+            description=description,
+            bucket=self.bucket,
+            fileNamePrefix=file_prefix,
+            fileFormat='CSV'
+        )
+        task.start()
+        self._tasks[task.id] = (task, file_prefix)
+        return task.id
+
+    def status(self, task_id: str) -> Dict[str, Any]:
+        task, _ = self._tasks[task_id]
+        return task.status()
+
+    def read_table(self, task_id: str) -> pd.DataFrame:
+        _, file_prefix = self._tasks[task_id]
+        blobs = [blob for blob in self._client.bucket(self.bucket).list_blobs(prefix=file_prefix)
+                 if blob.name.endswith('.csv')]
+        if not blobs:
+            raise FileNotFoundError(f"No exported table under gs://{self.bucket}/{file_prefix}")
+        return pd.concat([pd.read_csv(io.BytesIO(blob.download_as_bytes())) for blob in blobs],
+                         ignore_index=True)
+
+    def cancel(self, task_id: str) -> None:
+        self.ee.data.cancelTask(task_id)
+
+class LocalExportBackend(ExportTaskBackend):
+    """
+    Local stand-in for the batch task API.
+
+    Each "task" evaluates its collection with ``getInfo`` on a worker thread and
+    writes the features' properties to a CSV file, so task submission, polling
+    and ingest can be exercised without Cloud Storage (e.g. with the offline
+    Earth Engine backend).
+    """
+
+    def __init__(self, export_dir: str, max_workers: int = 4):
+        self.export_dir = Path(export_dir)
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export-task")
+        self._tasks: Dict[str, Tuple[Future, Path]] = {}
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def submit(self, collection: Any, description: str) -> str:
+        with self._lock:
+            self._next_id += 1
+            task_id = f"LOCAL_{self._next_id:06d}"
+        path = self.export_dir / f"{description}.csv"
+
+        def run():
+            features = collection.getInfo().get('features', [])
+            pd.DataFrame([feature['properties'] for feature in features]).to_csv(path, index=False)
+
+        self._tasks[task_id] = (self._pool.submit(run), path)
+        return task_id
+
+    def status(self, task_id: str) -> Dict[str, Any]:
+        future, _ = self._tasks[task_id]
+        if not future.done():
+            return {'id': task_id, 'state': 'RUNNING'}
+        error = future.exception()
+        if error is not None:
+            return {'id': task_id, 'state': 'FAILED', 'error_message': str(error)}
+        return {'id': task_id, 'state': COMPLETED}
+
+    def read_table(self, task_id: str) -> pd.DataFrame:
+        _, path = self._tasks[task_id]
+        try:
+            return pd.read_csv(path)
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+
+    def cancel(self, task_id: str) -> None:
+        # Local tasks use no batch quota; a running evaluation cannot be interrupted
+        pass
+
+class ExportTaskManager:
+    """
+    Runs a set of table exports to completion.
+
+    Every task is submitted up front. Statuses are polled concurrently each
+    round, and finished tables are read concurrently and then handed to the
+    caller one at a time from the calling thread. Tasks still pending after
+    ``timeout`` seconds are cancelled and reported as failed.
+    """
+
+    def __init__(self, backend: ExportTaskBackend, poll_interval: float = 30.0, max_workers: int = 8,
+                 timeout: Optional[float] = None):
+        """
+        Args:
+            backend: Task API to use
+            poll_interval: Seconds between polling rounds
+            max_workers: Threads polling statuses and reading tables
+            timeout: Seconds to wait for all tasks, None to wait indefinitely
+        """
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.max_workers = max_workers
+        self.timeout = timeout
+
+    def _poll(self, task_id: str) -> Dict[str, Any]:
+        try:
+            return self.backend.status(task_id)
+        except Exception as e:
+            logger.warning(f"Could not poll export task {task_id}, retrying next round: {str(e)}")
+            return {'id': task_id, 'state': 'UNKNOWN'}
+
+    def run(self, tasks: Dict[str, Tuple[Any, str]],
+            on_complete: Callable[[str, pd.DataFrame], None],
+            on_failed: Callable[[str, str], None]) -> None:
+        """
+        Export every collection and wait for the results
+
+        Args:
+            tasks: Maps a caller key to (FeatureCollection, task description)
+            on_complete: Called with (key, table) for each completed task
+            on_failed: Called with (key, error message) for each failed task
+        """
+        pending = {}
+        for key, (collection, description) in tasks.items():
+            try:
+                pending[key] = self.backend.submit(collection, description)
+            except Exception as e:
+                on_failed(key, f"submission failed: {str(e)}")
+        logger.info(f"Submitted {len(pending)} export tasks")
+        deadline = time.monotonic() + self.timeout if self.timeout is not None else None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="export-poll") as pool:
+            while pending:
+                statuses = dict(zip(pending, pool.map(self._poll, pending.values())))
+
+                completed = {key: pool.submit(self.backend.read_table, pending[key])
+                             for key, status in statuses.items() if status.get('state') == COMPLETED}
+                for key, future in completed.items():
+                    try:
+                        table = future.result()
+                    except Exception as e:
+                        on_failed(key, f"reading the exported table failed: {str(e)}")
+                    else:
+                        on_complete(key, table)
+                    del pending[key]
+
+                for key, status in statuses.items():
+                    if key in pending and status.get('state') in FAILED_STATES:
+                        on_failed(key, status.get('error_message') or status['state'])
+                        del pending[key]
+
+                if pending and deadline is not None and time.monotonic() >= deadline:
+                    for key, task_id in pending.items():
+                        try:
+                            self.backend.cancel(task_id)
+                        except Exception as e:
+                            logger.warning(f"Could not cancel export task {task_id}: {str(e)}")
+                        on_failed(key, f"task {task_id} still {statuses[key].get('state')} "
+                                       f"after {self.timeout:.0f}s")
+                    logger.warning(f"Gave up waiting for {len(pending)} export tasks")
+                    pending = {}
+
+                if pending:
+                    time.sleep(self.poll_interval)
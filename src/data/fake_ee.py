@@ -0,0 +1,827 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import calendar
+import hashlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.data.ee_backend import EEBackend
+
+logger = logging.getLogger(__name__)
+
+MS_PER_HOUR = 3600 * 1000
+# Meters per degree at the equator, used for the nominal scale of geographic grids
+METERS_PER_DEGREE = 111319.49
+
+# Millisecond lengths of the fixed-size units accepted by Date.advance
+_UNIT_MS = {
+    'second': 1000,
+    'minute': 60 * 1000,
+    'hour': MS_PER_HOUR,
+    'day': 24 * MS_PER_HOUR,
+    'week': 7 * 24 * MS_PER_HOUR,
+}
+
+# Joda-style format tokens used by the fetchers, longest first
+_DATE_FORMAT_TOKENS = (('YYYY', '%Y'), ('MM', '%m'), ('dd', '%d'), ('HH', '%H'), ('mm', '%M'), ('ss', '%S'))
+
+class FakeEEException(Exception):
+    """Error raised by the fake backend, mirroring ee.EEException"""
+    pass
+
+def _digest(*parts: Any) -> str:
+    """Short stable digest of an expression and its arguments"""
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:16]
+
+def _to_millis(value: Any) -> int:
+    """Milliseconds since the epoch of a date string, number or FakeDate"""
+    if isinstance(value, FakeDate):
+        return value.millis()
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return int(value)
+    text = str(value)
+    for fmt in ('%Y-%m-%d', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%d %H:%M:%S'):
+        try:
+            parsed = datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
+            return int(parsed.timestamp() * 1000)
+        except ValueError:
+            continue
+    raise FakeEEException(f"Unable to parse date '{text}'")
+
+def _resolve(value: Any) -> Any:
+    """Evaluate deferred fake objects into plain Python values"""
+    if hasattr(value, '_evaluate'):
+        return value._evaluate()
+    if isinstance(value, dict):
+        return {key: _resolve(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_resolve(item) for item in value]
+    return value
+
+class FakeRaster:
+    """
+    Synthetic gridded dataset: one band on a regular lon/lat grid at a regular time step.
+
+    Values are either taken from an explicit ``(time, row, col)`` array or
+    generated on demand from a hash of the seed, time step and pixel, so decades
+    of sub-daily data cost no memory.
+    """
+
+    def __init__(self, band_name: str, start: str, end: str, step_hours: float = 24,
+                 resolution: float = 0.25, bounds: Tuple[float, float, float, float] = (-125.0, 24.0, -66.0, 50.0),
+                 values: Optional[np.ndarray] = None, scale: float = 1.0, wet_fraction: float = 0.4,
+                 seed: int = 0):
+        """
+        Args:
+            band_name: Name of the single band
+            start: First image time ('YYYY-MM-DD')
+            end: Exclusive end of the record ('YYYY-MM-DD')
+            step_hours: Time between consecutive images
+            resolution: Pixel size in degrees
+            bounds: (west, south, east, north) in degrees
+            values: Optional explicit array of shape (n_times, n_rows, n_cols)
+            scale: Multiplier applied to generated values
+            wet_fraction: Share of generated values that are non-zero
+            seed: Seed of the generated values
+        """
+        self.band_name = band_name
+        step_ms = int(step_hours * MS_PER_HOUR)
+        self.times = np.arange(_to_millis(start), _to_millis(end), step_ms, dtype=np.int64)
+        self.resolution = resolution
+        self.west, self.south, self.east, self.north = bounds
+        self.n_cols = int(round((self.east - self.west) / resolution))
+        self.n_rows = int(round((self.north - self.south) / resolution))
+        self.values = values
+        if values is not None and values.shape != (len(self.times), self.n_rows, self.n_cols):
+            raise ValueError(f"Raster values must have shape {(len(self.times), self.n_rows, self.n_cols)}, "
+                             f"got {values.shape}")
+        self.scale = scale
+        self.wet_fraction = wet_fraction
+        self.seed = seed
+
+    @property
+    def projection(self) -> Dict[str, Any]:
+        """Projection description in the layout of ``projection().getInfo()``"""
+        return {
+            'type': 'Projection',
+            'crs': 'EPSG:4326',
+            'transform': [self.resolution, 0, self.west, 0, -self.resolution, self.north]
+        }
+
+    @property
+    def nominal_scale(self) -> float:
+        return self.resolution * METERS_PER_DEGREE
+
+    def pixel_of(self, lon: np.ndarray, lat: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Rows, columns and an inside-the-grid mask for the given points"""
+        cols = np.floor((lon - self.west) / self.resolution).astype(np.int64)
+        rows = np.floor((self.north - lat) / self.resolution).astype(np.int64)
+        inside = (cols >= 0) & (cols < self.n_cols) & (rows >= 0) & (rows < self.n_rows)
+        return rows, cols, inside
+
+    def sample(self, t_idx: int, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        """Values of time step ``t_idx`` at the given points, NaN outside the grid"""
+        rows, cols, inside = self.pixel_of(lon, lat)
+        out = np.full(len(lon), np.nan)
+        if not inside.any():
+            return out
+
+        if self.values is not None:
+            out[inside] = self.values[t_idx, rows[inside], cols[inside]]
+            return out
+
+        # Integer hash of (seed, time step, pixel) mapped to [0, 1); uint64 arrays wrap silently
+        offset = (self.seed * 0x9E3779B97F4A7C15 + t_idx * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        h = (rows[inside].astype(np.uint64) * np.uint64(0x94D049BB133111EB)
+             ^ cols[inside].astype(np.uint64) * np.uint64(0x2545F4914F6CDD1D)
+             ^ np.uint64(offset))
+        h ^= h >> np.uint64(31)
+        h *= np.uint64(0xD6E8FEB86659FD93)
+        h ^= h >> np.uint64(32)
+        u = (h & np.uint64(0xFFFFFFFF)).astype(np.float64) / 2.0 ** 32
+
+        dry = 1.0 - self.wet_fraction
+        out[inside] = np.where(u < dry, 0.0, (u - dry) / self.wet_fraction * 20.0) * self.scale
+        return out
+
+class FakeNumber:
+    """Deferred number"""
+
+    def __init__(self, backend: 'FakeEarthEngine', value: float):
+        self._backend = backend
+        self._value = value
+
+    def _evaluate(self) -> float:
+        return self._value
+
+    def serialize(self) -> str:
+        return _digest('Number', self._value)
+
+    def getInfo(self) -> float:
+        return self._backend._request(self._evaluate, 'Number')
+
+class FakeString:
+    """String value supporting ``cat``"""
+
+    def __init__(self, value: Any):
+        self._value = str(value._value if isinstance(value, FakeString) else value)
+
+    def cat(self, other: Any) -> 'FakeString':
+        return FakeString(self._value + str(FakeString(other)))
+
+    def _evaluate(self) -> str:
+        return self._value
+
+    def __str__(self) -> str:
+        return self._value
+
+class FakeDate:
+    """UTC date with the Date methods used by the fetchers"""
+
+    def __init__(self, value: Any):
+        self._millis = _to_millis(value)
+
+    def millis(self) -> int:
+        return self._millis
+
+    def advance(self, delta: float, unit: str) -> 'FakeDate':
+        unit = unit.rstrip('s')
+        if unit in _UNIT_MS:
+            return FakeDate(self._millis + int(delta * _UNIT_MS[unit]))
+        if unit in ('month', 'year'):
+            months = int(delta) * (12 if unit == 'year' else 1)
+            moment = datetime.fromtimestamp(self._millis / 1000, tz=timezone.utc)
+            month_index = moment.month - 1 + months
+            year, month = moment.year + month_index // 12, month_index % 12 + 1
+            day = min(moment.day, calendar.monthrange(year, month)[1])
+            return FakeDate(int(moment.replace(year=year, month=month, day=day).timestamp() * 1000))
+        raise FakeEEException(f"Unknown date unit '{unit}'")
+
+    def format(self, fmt: str = 'YYYY-MM-dd') -> FakeString:
+        pattern = fmt
+        for token, directive in _DATE_FORMAT_TOKENS:
+            pattern = pattern.replace(token, directive)
+        return FakeString(datetime.fromtimestamp(self._millis / 1000, tz=timezone.utc).strftime(pattern))
+
+    def _evaluate(self) -> Dict[str, Any]:
+        return {'type': 'Date', 'value': self._millis}
+
+class FakeList:
+    """Client-side list supporting ``map``"""
+
+    def __init__(self, items: Sequence[Any]):
+        self._items = list(items)
+
+    def map(self, fn: Callable[[Any], Any]) -> 'FakeList':
+        return FakeList([fn(item) for item in self._items])
+
+    def size(self) -> int:
+        return len(self._items)
+
+    def _evaluate(self) -> List[Any]:
+        return _resolve(self._items)
+
+class FakeProjection:
+    """Projection with ``nominalScale`` and ``getInfo``"""
+
+    def __init__(self, backend: 'FakeEarthEngine', crs: str, transform: Optional[List[float]] = None):
+        self._backend = backend
+        self.crs = crs
+        self.transform = list(transform) if transform is not None else [1, 0, 0, 0, 1, 0]
+
+    def nominalScale(self) -> FakeNumber:
+        scale = abs(self.transform[0])
+        if self.crs == 'EPSG:4326':
+            scale *= METERS_PER_DEGREE
+        return FakeNumber(self._backend, scale)
+
+    def _evaluate(self) -> Dict[str, Any]:
+        return {'type': 'Projection', 'crs': self.crs, 'transform': self.transform}
+
+    def serialize(self) -> str:
+        return _digest('Projection', self.crs, self.transform)
+
+    def getInfo(self) -> Dict[str, Any]:
+        return self._backend._request(self._evaluate, 'Projection')
+
+class FakePoint:
+    """Point geometry"""
+
+    def __init__(self, lon: float, lat: float):
+        self.lon = float(lon)
+        self.lat = float(lat)
+
+    def _evaluate(self) -> Dict[str, Any]:
+        return {'type': 'Point', 'coordinates': [self.lon, self.lat]}
+
+class FakeFeature:
+    """Feature with a point geometry and properties"""
+
+    def __init__(self, geometry: Optional[FakePoint], properties: Optional[Dict[str, Any]] = None):
+        self.geometry = geometry
+        self.properties = dict(properties or {})
+
+    def _evaluate(self) -> Dict[str, Any]:
+        return {'type': 'Feature', 'geometry': _resolve(self.geometry), 'properties': _resolve(self.properties)}
+
+class FakeFeatureCollection:
+    """Collection of point features"""
+
+    def __init__(self, backend: 'FakeEarthEngine', features: Sequence[FakeFeature]):
+        self._backend = backend
+        self.features = list(features)
+        self._expr = _digest('FeatureCollection', [(f.geometry.lon, f.geometry.lat, sorted(f.properties.items()))
+                                                   for f in self.features])
+
+    def size(self) -> int:
+        return len(self.features)
+
+    def _evaluate(self) -> Dict[str, Any]:
+        return {'type': 'FeatureCollection', 'features': [feature._evaluate() for feature in self.features]}
+
+    def getInfo(self) -> Dict[str, Any]:
+        return self._backend._request(self._evaluate, 'FeatureCollection')
+
+# A band sampler maps point longitudes and latitudes to values (NaN where masked)
+BandSampler = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+class FakeImage:
+    """
+    Lazily evaluated image: named band samplers plus properties.
+
+    Band arithmetic composes the samplers, so pixels are only computed at the
+    points requested by ``sampleRegions``.
+    """
+
+    def __init__(self, backend: 'FakeEarthEngine', bands: Dict[str, BandSampler],
+                 properties: Optional[Dict[str, Any]] = None, projection: Optional[FakeProjection] = None,
+                 expr: str = ''):
+        self._backend = backend
+        self._bands = dict(bands)
+        self._properties = dict(properties or {})
+        self._projection = projection or FakeProjection(backend, 'EPSG:4326')
+        self._expr = expr
+
+    def bandNames(self) -> FakeList:
+        return FakeList(list(self._bands))
+
+    def select(self, band_names: Any) -> 'FakeImage':
+        names = [str(name) for name in (band_names if isinstance(band_names, (list, tuple)) else [band_names])]
+        missing = [name for name in names if name not in self._bands]
+        if missing:
+            raise FakeEEException(f"Image.select: Pattern '{missing[0]}' did not match any bands.")
+        return FakeImage(self._backend, {name: self._bands[name] for name in names}, self._properties,
+                         self._projection, _digest(self._expr, 'select', names))
+
+    def rename(self, names: Any) -> 'FakeImage':
+        names = [str(name) for name in (names if isinstance(names, (list, tuple)) else [names])]
+        if len(names) != len(self._bands):
+            raise FakeEEException(f"Image.rename: Expected {len(self._bands)} band names, got {len(names)}.")
+        return FakeImage(self._backend, dict(zip(names, self._bands.values())), self._properties,
+                         self._projection, _digest(self._expr, 'rename', names))
+
+    def unmask(self, value: float = 0) -> 'FakeImage':
+        value = float(_resolve(value))
+
+        def filled(sampler):
+            def sample(lon, lat):
+                values = np.array(sampler(lon, lat), dtype=float)
+                values[np.isnan(values)] = value
+                return values
+            return sample
+
+        bands = {name: filled(sampler) for name, sampler in self._bands.items()}
+        return FakeImage(self._backend, bands, self._properties, self._projection,
+                         _digest(self._expr, 'unmask', value))
+
+    def multiply(self, factor: float) -> 'FakeImage':
+        factor = float(_resolve(factor))
+        bands = {name: (lambda lon, lat, s=sampler: s(lon, lat) * factor) for name, sampler in self._bands.items()}
+        return FakeImage(self._backend, bands, self._properties, self._projection,
+                         _digest(self._expr, 'multiply', factor))
+
+    def set(self, *args: Any) -> 'FakeImage':
+        updates = args[0] if len(args) == 1 else {args[0]: args[1]}
+        properties = dict(self._properties)
+        properties.update({key: _resolve(value) for key, value in updates.items()})
+        return FakeImage(self._backend, self._bands, properties, self._projection,
+                         _digest(self._expr, 'set', sorted(properties.items())))
+
+    def get(self, name: str) -> Any:
+        return self._properties.get(name)
+
+    def projection(self) -> FakeProjection:
+        return self._projection
+
+    def sampleRegions(self, collection: FakeFeatureCollection, properties: Optional[List[str]] = None,
+                      scale: Optional[float] = None, projection: Optional[FakeProjection] = None,
+                      tileScale: float = 1, geometries: bool = False) -> 'FakeComputed':
+        """
+        Sample every band at the collection's points
+
+        Points are sampled at the pixel they fall in; features where any band
+        is masked are dropped, as Earth Engine does.
+        """
+        band_names = list(self._bands)
+        kept_properties = list(properties) if properties is not None else None
+
+        def evaluate():
+            n_values = len(band_names) * collection.size()
+            self._backend._check_payload(n_values, tileScale)
+
+            lon = np.array([feature.geometry.lon for feature in collection.features])
+            lat = np.array([feature.geometry.lat for feature in collection.features])
+            columns = {name: self._bands[name](lon, lat) for name in band_names}
+
+            features = []
+            for i, feature in enumerate(collection.features):
+                values = {name: float(column[i]) for name, column in columns.items()}
+                if any(np.isnan(value) for value in values.values()):
+                    continue
+                props = {key: value for key, value in feature.properties.items()
+                         if kept_properties is None or key in kept_properties}
+                props.update(values)
+                features.append({
+                    'type': 'Feature',
+                    'geometry': feature.geometry._evaluate() if geometries else None,
+                    'properties': props
+                })
+            return {'type': 'FeatureCollection', 'features': features}
+
+        expr = _digest(self._expr, 'sampleRegions', collection._expr, kept_properties, scale,
+                       _resolve(projection), tileScale, geometries)
+        return FakeComputed(self._backend, evaluate, 'sampleRegions', expr)
+
+class FakeImageCollection:
+    """
+    Image collection backed either by a FakeRaster (kept lazy until mapped) or a list of images
+    """
+
+    def __init__(self, backend: 'FakeEarthEngine', raster: Optional[FakeRaster] = None,
+                 t_indices: Optional[np.ndarray] = None, images: Optional[List[FakeImage]] = None,
+                 expr: str = ''):
+        self._backend = backend
+        self._raster = raster
+        self._t_indices = t_indices
+        self._images = images
+        self._expr = expr
+
+    def _derive(self, op: str, *args: Any, t_indices: Optional[np.ndarray] = None,
+                images: Optional[List[FakeImage]] = None) -> 'FakeImageCollection':
+        expr = _digest(self._expr, op, *args)
+        if images is not None:
+            return FakeImageCollection(self._backend, images=images, expr=expr)
+        return FakeImageCollection(self._backend, raster=self._raster, t_indices=t_indices, expr=expr)
+
+    def _materialize(self) -> List[FakeImage]:
+        if self._images is not None:
+            return self._images
+
+        raster = self._raster
+        projection = FakeProjection(self._backend, raster.projection['crs'], raster.projection['transform'])
+        images = []
+        for t_idx in self._t_indices:
+            t_idx = int(t_idx)
+            sampler = (lambda lon, lat, t=t_idx: raster.sample(t, lon, lat))
+            images.append(FakeImage(
+                self._backend, {raster.band_name: sampler},
+                {'system:time_start': int(raster.times[t_idx]), 'system:index': str(t_idx)},
+                projection, _digest(self._expr, 'image', t_idx)
+            ))
+        return images
+
+    def select(self, band_names: Any) -> 'FakeImageCollection':
+        names = band_names if isinstance(band_names, (list, tuple)) else [band_names]
+        if self._images is None:
+            missing = [str(name) for name in names if str(name) != self._raster.band_name]
+            if missing:
+                raise FakeEEException(f"ImageCollection.select: Pattern '{missing[0]}' did not match any bands.")
+            return self._derive('select', [str(name) for name in names], t_indices=self._t_indices)
+        return self._derive('select', [str(name) for name in names],
+                            images=[image.select(band_names) for image in self._images])
+
+    def filterDate(self, start: Any, end: Any = None) -> 'FakeImageCollection':
+        start_ms = _to_millis(start)
+        end_ms = _to_millis(end) if end is not None else start_ms + _UNIT_MS['day']
+        if self._images is None:
+            times = self._raster.times[self._t_indices]
+            lo, hi = np.searchsorted(times, [start_ms, end_ms], side='left')
+            return self._derive('filterDate', start_ms, end_ms, t_indices=self._t_indices[lo:hi])
+        images = [image for image in self._images
+                  if start_ms <= image.get('system:time_start') < end_ms]
+        return self._derive('filterDate', start_ms, end_ms, images=images)
+
+    def filter(self, condition: 'FakeFilter') -> 'FakeImageCollection':
+        images = [image for image in self._materialize() if condition.test(image._properties)]
+        return self._derive('filter', condition.expr, images=images)
+
+    def map(self, fn: Callable[[FakeImage], FakeImage]) -> 'FakeImageCollection':
+        images = [fn(image) for image in self._materialize()]
+        return FakeImageCollection(self._backend, images=images,
+                                   expr=_digest(self._expr, 'map', [image._expr for image in images]))
+
+    def size(self) -> int:
+        if self._images is None:
+            return len(self._t_indices)
+        return len(self._images)
+
+    def first(self) -> Optional[FakeImage]:
+        images = self._materialize() if self._images is not None else \
+            FakeImageCollection(self._backend, raster=self._raster, t_indices=self._t_indices[:1],
+                                expr=self._expr)._materialize()
+        return images[0] if images else None
+
+    def sum(self) -> FakeImage:
+        images = self._materialize()
+        if not images:
+            return FakeImage(self._backend, {}, expr=_digest(self._expr, 'sum'))
+
+        def summed(name):
+            def sampler(lon, lat):
+                stacked = np.vstack([image._bands[name](lon, lat) for image in images])
+                total = np.nansum(stacked, axis=0)
+                total[np.isnan(stacked).all(axis=0)] = np.nan
+                return total
+            return sampler
+
+        bands = {name: summed(name) for name in images[0]._bands}
+        return FakeImage(self._backend, bands, projection=images[0]._projection,
+                         expr=_digest(self._expr, 'sum'))
+
+    def count(self) -> FakeImage:
+        images = self._materialize()
+        if not images:
+            return FakeImage(self._backend, {}, expr=_digest(self._expr, 'count'))
+
+        def counted(name):
+            def sampler(lon, lat):
+                stacked = np.vstack([image._bands[name](lon, lat) for image in images])
+                return (~np.isnan(stacked)).sum(axis=0).astype(float)
+            return sampler
+
+        bands = {name: counted(name) for name in images[0]._bands}
+        return FakeImage(self._backend, bands, projection=images[0]._projection,
+                         expr=_digest(self._expr, 'count'))
+
+    def toBands(self) -> FakeImage:
+        bands = {}
+        for i, image in enumerate(self._materialize()):
+            prefix = image.get('system:index') or str(i)
+            for name, sampler in image._bands.items():
+                bands[f"{prefix}_{name}"] = sampler
+        return FakeImage(self._backend, bands, expr=_digest(self._expr, 'toBands'))
+
+    def aggregate_array(self, property_name: str) -> 'FakeComputed':
+        def evaluate():
+            if self._images is None and property_name == 'system:time_start':
+                return [int(t) for t in self._raster.times[self._t_indices]]
+            return [image.get(property_name) for image in self._materialize()]
+
+        return FakeComputed(self._backend, evaluate, 'aggregate_array',
+                            _digest(self._expr, 'aggregate_array', property_name))
+
+    def _aggregate(self, property_name: str, reducer: Callable[[List[Any]], Any], op: str) -> 'FakeComputed':
+        values_of = self.aggregate_array(property_name)._evaluate
+
+        def evaluate():
+            values = [value for value in values_of() if value is not None]
+            return reducer(values) if values else None
+
+        return FakeComputed(self._backend, evaluate, op, _digest(self._expr, op, property_name))
+
+    def aggregate_min(self, property_name: str) -> 'FakeComputed':
+        return self._aggregate(property_name, min, 'aggregate_min')
+
+    def aggregate_max(self, property_name: str) -> 'FakeComputed':
+        return self._aggregate(property_name, max, 'aggregate_max')
+
+class FakeFilter:
+    """Property filter"""
+
+    def __init__(self, test: Callable[[Dict[str, Any]], bool], expr: str):
+        self.test = test
+        self.expr = expr
+
+class FakeComputed:
+    """Deferred server-side result, evaluated by ``getInfo``"""
+
+    def __init__(self, backend: 'FakeEarthEngine', evaluate: Callable[[], Any], label: str, expr: str):
+        self._backend = backend
+        self._evaluate = evaluate
+        self._label = label
+        self._expr = expr
+
+    def serialize(self) -> str:
+        return self._expr
+
+    def getInfo(self) -> Any:
+        return self._backend._request(self._evaluate, self._label)
+
+class FakeDictionary:
+    """Dictionary of deferred values"""
+
+    def __init__(self, backend: 'FakeEarthEngine', values: Dict[str, Any]):
+        self._backend = backend
+        self._values = dict(values)
+
+    def _evaluate(self) -> Dict[str, Any]:
+        return _resolve(self._values)
+
+    def serialize(self) -> str:
+        parts = [(key, value.serialize() if hasattr(value, 'serialize') else repr(value))
+                 for key, value in sorted(self._values.items())]
+        return _digest('Dictionary', parts)
+
+    def getInfo(self) -> Dict[str, Any]:
+        return self._backend._request(self._evaluate, 'Dictionary')
+
+class _ImageCollectionAPI:
+    """``ee.ImageCollection`` constructor and static methods"""
+
+    def __init__(self, backend: 'FakeEarthEngine'):
+        self._backend = backend
+
+    def __call__(self, source: Any) -> FakeImageCollection:
+        if isinstance(source, str):
+            raster = self._backend.rasters.get(source)
+            if raster is None:
+                raise FakeEEException(f"ImageCollection asset '{source}' not found.")
+            return FakeImageCollection(self._backend, raster=raster,
+                                       t_indices=np.arange(len(raster.times)), expr=_digest('ImageCollection', source))
+        return self.fromImages(source)
+
+    def fromImages(self, images: Any) -> FakeImageCollection:
+        images = images._items if isinstance(images, FakeList) else list(images)
+        return FakeImageCollection(self._backend, images=images,
+                                   expr=_digest('fromImages', [image._expr for image in images]))
+
+class _ListAPI:
+    """``ee.List`` static methods"""
+
+    @staticmethod
+    def sequence(start: float, end: float, step: float = 1) -> FakeList:
+        return FakeList(list(range(int(start), int(end) + 1, int(step))))
+
+class _FilterAPI:
+    """``ee.Filter`` static methods"""
+
+    @staticmethod
+    def gt(name: str, value: Any) -> FakeFilter:
+        return FakeFilter(lambda props: props.get(name) is not None and props[name] > value,
+                          _digest('Filter.gt', name, value))
+
+    @staticmethod
+    def lt(name: str, value: Any) -> FakeFilter:
+        return FakeFilter(lambda props: props.get(name) is not None and props[name] < value,
+                          _digest('Filter.lt', name, value))
+
+    @staticmethod
+    def eq(name: str, value: Any) -> FakeFilter:
+        return FakeFilter(lambda props: props.get(name) == value, _digest('Filter.eq', name, value))
+
+class _DataAPI:
+    """``ee.data`` functions"""
+
+    def __init__(self, backend: 'FakeEarthEngine'):
+        self._backend = backend
+
+    def computePixels(self, params: Dict[str, Any]) -> np.ndarray:
+        """
+        Compute an image on a grid, returned as a structured (height, width) array
+
+        Only ``fileFormat='NUMPY_NDARRAY'`` and unrotated grids are supported.
+        """
+        image = params['expression']
+        grid = params['grid']
+        width, height = grid['dimensions']['width'], grid['dimensions']['height']
+        affine = grid['affineTransform']
+        band_names = list(params.get('bandIds') or image._bands)
+
+        def evaluate():
+            self._backend._check_payload(len(band_names) * width * height)
+            cols, rows = np.meshgrid(np.arange(width), np.arange(height))
+            lon = affine['translateX'] + (cols.ravel() + 0.5) * affine['scaleX']
+            lat = affine['translateY'] + (rows.ravel() + 0.5) * affine['scaleY']
+            array = np.zeros((height, width), dtype=[(name, 'f8') for name in band_names])
+            for name in band_names:
+                array[name] = np.asarray(image._bands[name](lon, lat), dtype=float).reshape(height, width)
+            return array
+
+        return self._backend._request(evaluate, 'computePixels')
+
+class _GeometryAPI:
+    """``ee.Geometry`` constructors"""
+
+    @staticmethod
+    def Point(lon: Any, lat: Any = None) -> FakePoint:
+        if lat is None:
+            lon, lat = lon
+        return FakePoint(lon, lat)
+
+@dataclass
+class FakeRequestStats:
+    """Counters of the requests served by a FakeEarthEngine"""
+    requests: int = 0
+    failures: int = 0
+    values_sampled: int = 0
+    max_in_flight: int = 0
+    by_label: Dict[str, int] = field(default_factory=dict)
+
+class FakeEarthEngine(EEBackend):
+    """
+    In-process stand-in for the Earth Engine API backed by synthetic rasters.
+
+    Supports the operations used by the gridded fetchers. Every ``getInfo`` call
+    is a "request": it sleeps for the configured latency and may fail with a
+    throttling error (at random, or when more than ``max_in_flight`` requests run
+    at once) or a memory error (when a sampling request returns more values than
+    ``max_values``), so batching and retry behaviour can be measured offline.
+    """
+
+    def __init__(self, rasters: Dict[str, FakeRaster], latency: float = 0.0, latency_jitter: float = 0.0,
+                 per_value_latency: float = 0.0, failure_rate: float = 0.0,
+                 failure_message: str = "Too many concurrent aggregations.",
+                 max_in_flight: Optional[int] = None, max_values: Optional[int] = None, seed: int = 0):
+        """
+        Args:
+            rasters: Raster for each collection name
+            latency: Base latency of each request in seconds
+            latency_jitter: Uniform random extra latency in seconds
+            per_value_latency: Extra latency per sampled value in seconds
+            failure_rate: Probability that a request fails with ``failure_message``
+            failure_message: Message of injected random failures
+            max_in_flight: Requests allowed at once before throttling errors, None for no limit
+            max_values: Values a sampling request may return (times tileScale), None for no limit
+            seed: Seed of the latency and failure draws
+        """
+        self.rasters = dict(rasters)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.per_value_latency = per_value_latency
+        self.failure_rate = failure_rate
+        self.failure_message = failure_message
+        self.max_in_flight = max_in_flight
+        self.max_values = max_values
+        self.stats = FakeRequestStats()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._pending_values = threading.local()
+
+        self.ImageCollection = _ImageCollectionAPI(self)
+        self.List = _ListAPI()
+        self.Filter = _FilterAPI()
+        self.Geometry = _GeometryAPI()
+        self.data = _DataAPI(self)
+        self.EEException = FakeEEException
+
+    @classmethod
+    def synthetic(cls, datasets: Sequence[Any], start: str = '1980-01-01', end: str = '2025-01-01',
+                  resolution: float = 0.25, seed: int = 0, **kwargs) -> 'FakeEarthEngine':
+        """
+        Build a backend with a generated raster for each dataset configuration
+
+        Args:
+            datasets: GriddedDatasetConfig objects (collection_name, variable_name, time_scale)
+            start: First image time of every raster
+            end: Exclusive end of every raster
+            resolution: Pixel size in degrees
+            seed: Seed of the generated values
+            **kwargs: Latency and failure settings passed to the constructor
+        """
+        step_hours = {'hourly': 1, '3-hourly': 3, '3hourly': 3, 'monthly': 24 * 30}
+        rasters = {}
+        for i, dataset in enumerate(datasets):
+            if dataset.time_scale == 'monthly':
+                # Monthly rasters need calendar month starts, not a fixed step
+                raster = FakeRaster(dataset.variable_name, start, end, resolution=resolution, seed=seed + i)
+                month_starts = np.arange(np.datetime64(start[:7], 'M'), np.datetime64(end[:7], 'M'))
+                raster.times = month_starts.astype('datetime64[ms]').astype(np.int64)
+            else:
+                raster = FakeRaster(dataset.variable_name, start, end,
+                                    step_hours=step_hours.get(dataset.time_scale, 24),
+                                    resolution=resolution, seed=seed + i)
+            rasters[dataset.collection_name] = raster
+        return cls(rasters, seed=seed, **kwargs)
+
+    def initialize(self, project_id: Optional[str] = None) -> None:
+        logger.info(f"Using the in-process Earth Engine stand-in with {len(self.rasters)} collections")
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = FakeRequestStats()
+
+    # ee namespace constructors
+
+    def Date(self, value: Any) -> FakeDate:
+        return FakeDate(value)
+
+    def String(self, value: Any) -> FakeString:
+        return FakeString(value)
+
+    def Number(self, value: float) -> FakeNumber:
+        return FakeNumber(self, value)
+
+    def Dictionary(self, values: Dict[str, Any]) -> FakeDictionary:
+        return FakeDictionary(self, values)
+
+    def Projection(self, crs: str, transform: Optional[List[float]] = None) -> FakeProjection:
+        return FakeProjection(self, crs, transform)
+
+    def Feature(self, geometry: Optional[FakePoint], properties: Optional[Dict[str, Any]] = None) -> FakeFeature:
+        return FakeFeature(geometry, properties)
+
+    def FeatureCollection(self, features: Sequence[FakeFeature]) -> FakeFeatureCollection:
+        return FakeFeatureCollection(self, features)
+
+    # Request simulation
+
+    def _check_payload(self, n_values: int, tile_scale: float = 1) -> None:
+        """Fail sampling requests that would exceed the memory limit"""
+        if self.max_values is not None and n_values > self.max_values * tile_scale:
+            raise FakeEEException("User memory limit exceeded.")
+        self._pending_values.count = n_values
+
+    def _request(self, evaluate: Callable[[], Any], label: str) -> Any:
+        """Serve one getInfo call with simulated latency and failures"""
+        with self._lock:
+            self._in_flight += 1
+            self.stats.requests += 1
+            self.stats.by_label[label] = self.stats.by_label.get(label, 0) + 1
+            self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+            throttled = self.max_in_flight is not None and self._in_flight > self.max_in_flight
+            failed = throttled or self._random.random() < self.failure_rate
+            delay = self.latency + self._random.random() * self.latency_jitter
+
+        try:
+            self._pending_values.count = 0
+            time.sleep(delay)
+            if failed:
+                with self._lock:
+                    self.stats.failures += 1
+                raise FakeEEException(self.failure_message)
+
+            try:
+                result = evaluate()
+            except FakeEEException:
+                with self._lock:
+                    self.stats.failures += 1
+                raise
+
+            n_values = self._pending_values.count
+            if n_values and self.per_value_latency:
+                time.sleep(n_values * self.per_value_latency)
+            with self._lock:
+                self.stats.values_sampled += n_values
+            return result
+        finally:
+            with self._lock:
+                self._in_flight -= 1
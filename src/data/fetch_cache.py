@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+def hash_station_ids(station_ids: Sequence[Any]) -> str:
+    """Order-independent hash of a set of station IDs"""
+    key = "\n".join(sorted(str(station_id) for station_id in station_ids))
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()
+
+@dataclass
+class CacheHit:
+    """Result of a cache lookup"""
+    data: pd.DataFrame
+    exact: bool
+    # Requested stations that are not in the cached entry
+    missing_stations: List[Any] = field(default_factory=list)
+    # Requested year spans (inclusive) that are not in the cached entry
+    missing_years: List[Tuple[int, int]] = field(default_factory=list)
+
+class GriddedFetchCache:
+    """
+    Content-addressed cache of gridded fetch results.
+
+    Entries are keyed on the sampling parameters of a dataset (collection, band,
+    conversion, time scale, scale) together with the year range and a hash of the
+    station set. Lookups return exact hits, or the best overlapping entry along
+    with the stations and years that still have to be fetched. The cache is kept
+    under ``max_bytes`` by evicting least recently used entries.
+
+    Results sampled only where ground observations exist are stored with the
+    month × station activity they were sampled under. A later lookup reuses
+    them for every year in which no station has become active since.
+    """
+
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 2 * 1024 ** 3):
+        """
+        Args:
+            cache_dir: Directory holding cached results and the index
+            max_bytes: Size bound of the cache on disk
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+
+    @property
+    def index_path(self) -> Path:
+        return self.cache_dir / self.INDEX_FILENAME
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        if not self.index_path.exists():
+            return {}
+        try:
+            with open(self.index_path, 'r') as f:
+                index = json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Invalid fetch cache index {self.index_path}, starting empty: {str(e)}")
+            return {}
+
+        # Drop entries whose files have disappeared
+        return {key: entry for key, entry in index.items()
+                if (self.cache_dir / entry['file']).exists()}
+
+    def _write_index(self) -> None:
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    @staticmethod
+    def make_key(params: Dict[str, Any], start_year: int, end_year: int, station_hash: str) -> str:
+        """Content address of a cache entry"""
+        payload = json.dumps({'params': params, 'start_year': start_year, 'end_year': end_year,
+                              'stations': station_hash}, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def lookup(self, params: Dict[str, Any], station_ids: Sequence[Any],
+               start_year: int, end_year: int,
+               coverage: Optional[pd.DataFrame] = None) -> Optional[CacheHit]:
+        """
+        Find cached data for a request
+
+        Args:
+            params: Sampling parameters of the dataset
+            station_ids: Requested station IDs
+            start_year: First requested year
+            end_year: Last requested year
+            coverage: Boolean month ('YYYY-MM') × station ID activity the request
+                samples under; years with cells that the cached entry did not
+                sample are returned as missing
+
+        Returns:
+            CacheHit with the usable cached data, or None if nothing overlaps
+        """
+        station_hash = hash_station_ids(station_ids)
+        key = self.make_key(params, start_year, end_year, station_hash)
+
+        with self._lock:
+            exact_entry = self._index.get(key)
+        if exact_entry is not None:
+            data = self._read(key)
+            if data is not None:
+                stale_years = self._stale_years(key, coverage, start_year, end_year)
+                if not stale_years:
+                    logger.info(f"Fetch cache hit for {params.get('collection')} {start_year}-{end_year}")
+                    return CacheHit(data=data, exact=True)
+                logger.info(f"Fetch cache hit for {params.get('collection')} with ground coverage "
+                            f"changed in {len(stale_years)} years")
+                return CacheHit(data=data, exact=False, missing_years=self._year_spans(stale_years))
+
+        # Pick the overlapping entry that covers the most station-years
+        requested = {str(station_id): station_id for station_id in station_ids}
+        best_key, best_score = None, 0
+        with self._lock:
+            for entry_key, entry in self._index.items():
+                if entry['params'] != params:
+                    continue
+                overlap_years = min(end_year, entry['end_year']) - max(start_year, entry['start_year']) + 1
+                overlap_stations = len(requested.keys() & set(entry['stations']))
+                score = max(0, overlap_years) * overlap_stations
+                if score > best_score:
+                    best_key, best_score = entry_key, score
+
+        if best_key is None:
+            return None
+
+        data = self._read(best_key)
+        if data is None:
+            return None
+
+        entry = self._index[best_key]
+        cached_stations = set(entry['stations'])
+        missing_stations = [station_id for name, station_id in requested.items()
+                            if name not in cached_stations]
+
+        years = set(self._stale_years(best_key, coverage, start_year, end_year))
+        years.update(year for year in range(start_year, end_year + 1)
+                     if not entry['start_year'] <= year <= entry['end_year'])
+        missing_years = self._year_spans(sorted(years))
+
+        # Restrict to the requested stations and years
+        columns = [column for column in data.columns if str(column) in requested]
+        in_range = (data.index.year >= start_year) & (data.index.year <= end_year)
+        data = data.loc[in_range, columns]
+
+        logger.info(f"Partial fetch cache hit for {params.get('collection')}: "
+                    f"{len(missing_stations)} new stations, missing years {missing_years}")
+        return CacheHit(data=data, exact=False, missing_stations=missing_stations,
+                        missing_years=missing_years)
+
+    def store(self, params: Dict[str, Any], station_ids: Sequence[Any],
+              start_year: int, end_year: int, data: pd.DataFrame,
+              coverage: Optional[pd.DataFrame] = None) -> None:
+        """
+        Add a fetch result to the cache and evict old entries if over the size bound
+
+        Args:
+            coverage: Boolean month × station ID activity the data was sampled under
+        """
+        key = self.make_key(params, start_year, end_year, hash_station_ids(station_ids))
+        path = self.cache_dir / f"{key}.pkl"
+        tmp_path = path.with_suffix('.tmp')
+        data.to_pickle(tmp_path)
+        os.replace(tmp_path, path)
+
+        entry = {
+            'file': path.name,
+            'params': params,
+            'start_year': start_year,
+            'end_year': end_year,
+            'stations': [str(station_id) for station_id in station_ids],
+            'size': path.stat().st_size,
+            'last_access': time.time()
+        }
+        if coverage is not None:
+            coverage_path = self.cache_dir / f"{key}.coverage.pkl"
+            coverage.to_pickle(coverage_path)
+            entry['coverage_file'] = coverage_path.name
+            entry['size'] += coverage_path.stat().st_size
+
+        with self._lock:
+            self._index[key] = entry
+            self._evict(keep=key)
+            self._write_index()
+
+        logger.info(f"Cached {params.get('collection')} {start_year}-{end_year} "
+                    f"for {len(station_ids)} stations")
+
+    def _stale_years(self, key: str, coverage: Optional[pd.DataFrame],
+                     start_year: int, end_year: int) -> List[int]:
+        """
+        Requested years in which the current coverage has cells the entry did not sample
+
+        Every requested year is stale when the entry was stored without coverage.
+        """
+        if coverage is None:
+            return []
+        with self._lock:
+            entry = self._index[key]
+        years = [year for year in range(start_year, end_year + 1)
+                 if entry['start_year'] <= year <= entry['end_year']]
+
+        if 'coverage_file' not in entry:
+            return years
+        try:
+            sampled = pd.read_pickle(self.cache_dir / entry['coverage_file'])
+        except Exception as e:
+            logger.warning(f"Unreadable coverage of fetch cache entry {key}: {str(e)}")
+            return years
+
+        cached_stations = set(entry['stations'])
+        current = coverage[[column for column in coverage.columns if column in cached_stations]]
+        sampled = sampled.reindex(index=current.index, columns=current.columns, fill_value=False)
+        newly_active = current.to_numpy(dtype=bool) & ~sampled.to_numpy(dtype=bool)
+        changed = {int(month_key[:4]) for month_key in current.index[newly_active.any(axis=1)]}
+        return [year for year in years if year in changed]
+
+    @staticmethod
+    def _year_spans(years: List[int]) -> List[Tuple[int, int]]:
+        """Sorted years as inclusive spans of consecutive years"""
+        spans = []
+        for year in years:
+            if spans and spans[-1][1] == year - 1:
+                spans[-1] = (spans[-1][0], year)
+            else:
+                spans.append((year, year))
+        return spans
+
+    def _unlink(self, entry: Dict[str, Any]) -> None:
+        """Delete the files of an entry"""
+        (self.cache_dir / entry['file']).unlink(missing_ok=True)
+        if 'coverage_file' in entry:
+            (self.cache_dir / entry['coverage_file']).unlink(missing_ok=True)
+
+    def _read(self, key: str) -> Optional[pd.DataFrame]:
+        try:
+            data = pd.read_pickle(self.cache_dir / self._index[key]['file'])
+        except Exception as e:
+            logger.warning(f"Dropping unreadable fetch cache entry {key}: {str(e)}")
+            self._remove(key)
+            return None
+
+        with self._lock:
+            self._index[key]['last_access'] = time.time()
+            self._write_index()
+        return data
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            entry = self._index.pop(key, None)
+            if entry is not None:
+                self._unlink(entry)
+                self._write_index()
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used entries until the cache fits max_bytes (lock held)"""
+        total = sum(entry['size'] for entry in self._index.values())
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._unlink(entry)
+            del self._index[key]
+            total -= entry['size']
+            logger.info(f"Evicted fetch cache entry {key}")
+
+    def size(self) -> int:
+        """Total size of cached entries in bytes"""
+        with self._lock:
+            return sum(entry['size'] for entry in self._index.values())
+
+    def clear(self) -> None:
+        """Remove every cached entry"""
+        with self._lock:
+            for entry in self._index.values():
+                self._unlink(entry)
+            self._index = {}
+            self._write_index()
@@ -2,25 +2,38 @@
 # -*- coding: utf-8 -*-
 
 import logging
-import os
 import time
-from typing import Dict, Any, Optional, Callable, List, Union
+from typing import Dict, Any, Optional, Callable, List, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
 import json
+import hashlib
+import re
+import threading
+from collections import deque
+from dataclasses import replace
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 from src.base_fetcher import DataFetcher
+from src.data.result_matrix import ResultMatrixBuilder
+from src.data.ee_executor import EERequestExecutor
+from src.data.chunk_store import ChunkStore
+from src.data.fetch_cache import GriddedFetchCache
+from src.data.station_pixels import PixelWindow, StationPixelIndex
+from src.data.projection_cache import DatasetProjectionCache
+from src.data.date_index import CollectionDateIndex
+from src.data.ee_memo import GetInfoMemo
+from src.data.ground_coverage import GroundCoveragePlan
+from src.data.station_inventory import prune_stations
+from src.data.export_tasks import (ExportTaskBackend, ExportTaskManager, EarthEngineExportBackend,
+                                   export_description)
+from src.data.request_sizer import AdaptiveRequestSizer, RequestSize, RequestSizeStore, is_size_error
+from src.data.ee_backend import EEBackend
+from utils.ee_session import EESession, get_session
 from config import GriddedDataConfig, GriddedDatasetConfig
 
-# Conditional import for Earth Engine
-try:
-    import ee
-    EARTH_ENGINE_AVAILABLE = True
-except ImportError:
-    EARTH_ENGINE_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
 class GriddedDataFetcher(DataFetcher):
@@ -31,46 +44,123 @@ class GriddedDataFetcher(DataFetcher):
     with different temporal resolutions and conversion factors.
     """
     
-    def __init__(self, config: GriddedDataConfig):
+    # Number of calendar months of daily images stacked into a single sampling request
+    DAILY_BLOCK_MONTHS = 3
+    # Upper bound the adaptive sizer may grow daily blocks to
+    MAX_DAILY_BLOCK_MONTHS = 12
+    # Number of calendar months of daily images sampled by one export task
+    EXPORT_BLOCK_MONTHS = 12
+    # Number of monthly images stacked into a single sampling request
+    BLOCK_MONTHS = 120
+    # Subdirectory of the data directory holding per-month fetch checkpoints
+    CHUNK_DIR = "chunks"
+    # Subdirectory of the data directory holding cached fetch results
+    CACHE_DIR = "cache"
+    # Subdirectory of the data directory holding memoized getInfo responses
+    MEMO_DIR = "ee_memo"
+    # Sampling scale in meters when a dataset's native grid is unknown
+    SAMPLE_SCALE = 1000
+    # Size bound of one computePixels download (the API allows 48 MB) and its band count
+    BULK_MAX_BYTES = 32 * 1024 ** 2
+    BULK_MAX_BANDS = 1024
+    # Value masked pixels are filled with in stacked images. sampleRegions drops a
+    # point when any band is masked there, so without it a station outside one
+    # date's (or one product's) footprint would lose every other band of the block
+    NODATA = -9999.0
+    # Monthly or yearly periods composited into a single sampling request
+    COMPOSITE_BLOCK_PERIODS = {'monthly': 24, 'yearly': 10}
+    # Stacked band names end with the image date, e.g. "12_d19800101"
+    _BAND_DATE_PATTERN = re.compile(r'd(\d{8})$')
+    # Band names of datasets stacked together hold the dataset position, e.g. "1_12_p2_d19800101"
+    _STACKED_BAND_PATTERN = re.compile(r'p(\d+)_d(\d{8})$')
+    # Composited band names hold the statistic and period start, e.g. "3_count_d19800101"
+    _COMPOSITE_BAND_PATTERN = re.compile(r'(sum|count)_d(\d{8})$')
+    
+    def __init__(self, config: GriddedDataConfig, ee_backend: Optional[EEBackend] = None,
+                 session: Optional[EESession] = None, export_backend: Optional[ExportTaskBackend] = None):
+        """
+        Args:
+            config: Gridded data configuration
+            ee_backend: Earth Engine backend, defaults to the one of the session
+            session: Earth Engine session, defaults to the process-wide session
+            export_backend: Task API used in export mode, defaults to Cloud Storage
+                exports to ``config.export_bucket``
+        """
         self.config = config
+        if config.fetch_mode == 'export' and export_backend is None and not config.export_bucket:
+            raise ValueError("Export mode needs export_bucket to be set (or an export backend to be passed)")
+        self.export_backend = export_backend
+        if session is None:
+            session = EESession(backend=ee_backend) if ee_backend is not None else get_session()
+        self.session = session
+        # Every Earth Engine object is built through this backend
+        self.ee = session.backend
         self.progress_callback = None
-        self._ee_initialized = False
+        # Serialises progress reports from the dataset threads
+        self._progress_lock = threading.Lock()
+        # Memo of deterministic getInfo results, keyed by the serialized computation
+        self.memo = GetInfoMemo(
+            Path(config.data_dir) / self.MEMO_DIR,
+            max_bytes=config.memo_max_mb * 1024 ** 2,
+            default_ttl=config.memo_ttl_hours * 3600 if config.memo_ttl_hours is not None else None,
+            enabled=config.use_memo
+        )
+        # Shared executor for every Earth Engine request issued by this fetcher
+        self.executor = EERequestExecutor(max_concurrency=config.max_concurrent_requests, memo=self.memo)
+        # Native projections of datasets, persisted across runs
+        self.projection_cache = DatasetProjectionCache(config.data_dir)
+        # Image timestamps of each collection, persisted and extended incrementally
+        self.date_index = CollectionDateIndex(config.data_dir)
+        # Request sizes learned per dataset, so later runs start from a size that works
+        self.request_sizes = RequestSizeStore(config.data_dir)
+        self._projections: Dict[str, Optional[Dict[str, Any]]] = {}
+        # Stations and months with ground observations, when restricting to them
+        self.coverage_plan: Optional[GroundCoveragePlan] = None
+        self.cache = None
+        if config.use_cache:
+            self.cache = GriddedFetchCache(
+                Path(config.data_dir) / self.CACHE_DIR,
+                max_bytes=config.cache_max_mb * 1024 ** 2
+            )
         
     def set_progress_callback(self, callback: Callable[[str, int], None]):
         """
         Set a callback function for progress reporting
         
         Args:
-            callback: Function that takes dataset_name and progress percentage
+            callback: Function that takes dataset_name and progress percentage.
+                It may be called from several dataset threads, but never concurrently.
         """
-        self.progress_callback = callback
+        if callback is None:
+            self.progress_callback = None
+            return
+            
+        def report(dataset_name: str, progress: int):
+            with self._progress_lock:
+                callback(dataset_name, progress)
+                
+        self.progress_callback = report
         
     def _initialize_earth_engine(self) -> bool:
-        """Initialize Earth Engine API with project ID"""
-        if not EARTH_ENGINE_AVAILABLE:
-            logger.warning("Earth Engine API not available. Install with: pip install earthengine-api")
-            return False
-            
-        if self._ee_initialized:
-            return True
-            
-        try:
-            # Initialize Earth Engine with the project ID from config
-            project_id = self.config.ee_project_id
-            logger.info(f"Initializing Earth Engine with project ID: {project_id}")
-            
-            ee.Initialize(project=project_id)
-            self._ee_initialized = True
-            logger.info("Earth Engine initialized successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize Earth Engine: {str(e)}")
-            return False
+        """Initialize Earth Engine API with project ID (once per process)"""
+        return self.session.initialize(self.config.ee_project_id)
+        
+    def fetch_data(self, on_dataset_complete: Optional[Callable[[str, pd.DataFrame], None]] = None
+                   ) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch gridded data for enabled datasets with progress reporting
         
-    def fetch_data(self) -> Dict[str, pd.DataFrame]:
-        """Fetch gridded data for enabled datasets with progress reporting"""
+        Up to ``config.max_concurrent_datasets`` datasets are fetched at once.
+        Their Earth Engine requests share this fetcher's executor, so the total
+        number of requests in flight stays within ``config.max_concurrent_requests``.
+        
+        Args:
+            on_dataset_complete: Called with (dataset_name, data) as soon as each
+                dataset finishes, from the thread that fetched it
+        """
         results = {}
-        enabled_datasets = self.config.get_enabled_datasets()
+        # Datasets with a local mirror are read by LocalRasterFetcher
+        enabled_datasets = self.config.get_remote_datasets()
         
         # Initialize Earth Engine if needed
         ee_available = self._initialize_earth_engine()
@@ -78,55 +168,539 @@ class GriddedDataFetcher(DataFetcher):
             logger.error("Earth Engine initialization failed. Cannot fetch real data.")
             return results
         
+        self.coverage_plan = self._load_coverage_plan()
+        if self.coverage_plan is not None:
+            logger.info(f"Ground coverage plan: {self.coverage_plan.summary()}")
+            if not self.coverage_plan.station_ids:
+                logger.error("No station has enough ground observations to compare against")
+                return results
+        
+        datasets = []
         for dataset in enabled_datasets:
-            try:
-                logger.info(f"Fetching {dataset.name} data...")
-                
-                if self.progress_callback:
-                    self.progress_callback(dataset.name, 0)
+            if self.progress_callback:
+                self.progress_callback(dataset.name, 0)
                 
-                # Check if data already exists
-                output_path = Path(self.config.data_dir) / dataset.get_filename()
-                if output_path.exists():
-                    logger.info(f"Loading existing {dataset.name} data from {output_path}")
-                    
-                    # Load existing data
-                    df = pd.read_csv(output_path, index_col=0)
-                    df.index = pd.to_datetime(df.index)
-                    results[dataset.name] = df
-                    
-                    if self.progress_callback:
-                        self.progress_callback(dataset.name, 100)
+            # Check for date range constraints for specific datasets
+            if self._should_skip_dataset(dataset):
+                logger.warning(f"Skipping {dataset.name} - outside valid date range")
+                continue
+            datasets.append(dataset)
+            
+        if not datasets:
+            return results
+        
+        self.executor.reset_stats()
+        # Daily datasets sampled together count as one fetch
+        stacked = self._stackable_datasets(datasets)
+        separate = [dataset for dataset in datasets if dataset not in stacked]
+        max_workers = max(1, min(self.config.max_concurrent_datasets, len(separate) + bool(stacked)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dataset") as pool:
+            futures = {
+                pool.submit(self._fetch_and_report, dataset, on_dataset_complete): dataset
+                for dataset in separate
+            }
+            if stacked:
+                futures[pool.submit(self._fetch_stacked_and_report, stacked, on_dataset_complete)] = None
+            for future in as_completed(futures):
+                dataset = futures[future]
+                data = future.result()
+                if dataset is None:
+                    results.update(data)
+                elif data is not None:
+                    results[dataset.name] = data
                     
-                    continue
+        self.memo.flush()
+        logger.info(f"getInfo memo: {self.memo.hits} hits, {self.memo.misses} misses")
+        
+        # Keep the configured dataset order
+        return {dataset.name: results[dataset.name] for dataset in datasets if dataset.name in results}
+    
+    def _load_coverage_plan(self) -> Optional[GroundCoveragePlan]:
+        """Ground coverage plan restricting the fetch, or None when every station and date is fetched"""
+        if not self.config.restrict_to_ground_coverage:
+            return None
+        return GroundCoveragePlan.from_file(
+            Path(self.config.data_dir) / self.config.ground_data_filename,
+            self.config.start_year, self.config.end_year,
+            min_coverage=self.config.min_ground_coverage
+        )
+    
+    def _fetch_and_report(self, dataset: GriddedDatasetConfig,
+                          on_dataset_complete: Optional[Callable[[str, pd.DataFrame], None]] = None
+                          ) -> Optional[pd.DataFrame]:
+        """Fetch one dataset in a worker thread, returning None on failure"""
+        try:
+            logger.info(f"Fetching {dataset.name} data...")
+            data = self._fetch_with_cache(dataset)
+            
+            logger.info(f"{dataset.name} request timings: "
+                        f"{self.executor.get_stats(label_prefix=f'{dataset.name} ')}")
+            
+            if on_dataset_complete is not None:
+                on_dataset_complete(dataset.name, data)
+            
+            if self.progress_callback:
+                self.progress_callback(dataset.name, 100)
+            return data
                 
-                # Check for date range constraints for specific datasets
-                if self._should_skip_dataset(dataset):
-                    logger.warning(f"Skipping {dataset.name} - outside valid date range")
-                    continue
+        except Exception as e:
+            logger.error(f"Error fetching {dataset.name} data: {e}", exc_info=True)
+            if self.progress_callback:
+                self.progress_callback(dataset.name, 0)
+            return None
+    
+    def _stackable_datasets(self, datasets: List[GriddedDatasetConfig]) -> List[GriddedDatasetConfig]:
+        """
+        Standard daily datasets to sample together in band-stacked requests
+        
+        Datasets whose stations are dense enough to be downloaded as pixel
+        blocks, and datasets with any cached result, keep their own fetch; a
+        block download is cheaper than any sampling request, and the own fetch
+        of a cached dataset only requests the missing part. Stacking needs at
+        least two datasets.
+        """
+        if not self.config.stack_daily_datasets or self.config.fetch_mode != 'interactive':
+            return []
+        
+        eligible = [
+            dataset for dataset in datasets
+            if dataset.time_scale != "monthly" and not self._is_high_resolution(dataset)
+            and self._composite_period(dataset) is None
+        ]
+        if len(eligible) > 1:
+            stations = self._planned_stations()
+            eligible = [dataset for dataset in eligible
+                        if self._bulk_window(dataset, self._sample_points(dataset, stations)[1]) is None]
+        if len(eligible) > 1 and self.cache is not None:
+            station_ids = stations['id'].tolist()
+            eligible = [
+                dataset for dataset in eligible
+                if self.cache.lookup(self._cache_params(dataset), station_ids,
+                                     self.config.start_year, self.config.end_year,
+                                     self._station_coverage(station_ids)) is None
+            ]
+        return eligible if len(eligible) > 1 else []
+    
+    def _planned_stations(self) -> pd.DataFrame:
+        """Stations to fetch, restricted to the ground coverage plan when there is one"""
+        stations = self._load_stations()
+        if self.coverage_plan is not None:
+            stations = stations[stations['id'].astype(str).isin(self.coverage_plan.station_ids)]
+        return stations
+    
+    def _station_coverage(self, station_ids: List[Any]) -> Optional[pd.DataFrame]:
+        """Month × station activity that cached results are checked against, if restricted"""
+        if self.coverage_plan is None:
+            return None
+        return self.coverage_plan.station_activity(station_ids)
+    
+    def _fetch_stacked_and_report(self, datasets: List[GriddedDatasetConfig],
+                                  on_dataset_complete: Optional[Callable[[str, pd.DataFrame], None]] = None
+                                  ) -> Dict[str, pd.DataFrame]:
+        """Fetch stacked datasets in a worker thread, returning the ones that succeeded"""
+        names = [dataset.name for dataset in datasets]
+        try:
+            logger.info(f"Fetching {', '.join(names)} data in stacked requests...")
+            data = self._fetch_stacked(datasets)
+            
+            logger.info(f"Stacked request timings: {self.executor.get_stats(label_prefix='stacked ')}")
+            
+            for name, frame in data.items():
+                if on_dataset_complete is not None:
+                    on_dataset_complete(name, frame)
+                if self.progress_callback:
+                    self.progress_callback(name, 100)
+            return data
+            
+        except Exception as e:
+            logger.error(f"Error fetching {', '.join(names)} data: {e}", exc_info=True)
+            if self.progress_callback:
+                for name in names:
+                    self.progress_callback(name, 0)
+            return {}
+    
+    def _fetch_stacked(self, datasets: List[GriddedDatasetConfig]) -> Dict[str, pd.DataFrame]:
+        """
+        Fetch several daily datasets with one sampling request per date block
+        
+        The collections are stacked as bands of one image per block and sampled
+        at the finest of their native grids, once per unique pixel of that grid
+        (each product still returns the value of its own pixel containing the
+        pixel centre). Blocks are sized by an adaptive sizer of their own and go
+        through the same tileScale retry and bisection as single-dataset blocks.
+        Values are split back into one matrix per dataset, each checkpointed,
+        scaled by its conversion factor and cached as if fetched alone.
+        """
+        stations = self._planned_stations()
+        station_ids = stations['id'].tolist()
+        start_year, end_year = self.config.start_year, self.config.end_year
+        start_date = f"{start_year}-01-01"
+        end_date = f"{end_year}-12-31"
+        
+        for dataset in datasets:
+            if self.progress_callback:
+                self.progress_callback(dataset.name, 5)
+        
+        collections = [
+            self.ee.ImageCollection(dataset.collection_name)
+                .select(dataset.variable_name)
+                .filterDate(start_date, self._next_day(end_date))
+            for dataset in datasets
+        ]
+        
+        # Sample on the finest native grid, once per unique pixel of it
+        scales = [(self._get_native_projection(dataset) or {}).get('scale') or self.SAMPLE_SCALE
+                  for dataset in datasets]
+        finest = datasets[int(np.argmin(scales))]
+        pixel_index, sample_points = self._sample_points(finest, stations)
+        sample_ids = sample_points['id'].tolist()
+        # Sampling requests are labelled and sized for the stack, not for the finest dataset
+        sampling = replace(finest, name=f"stacked {'+'.join(dataset.name for dataset in datasets)}")
+        
+        coverage = None
+        if self.coverage_plan is not None:
+            coverage = self.coverage_plan.activity(
+                station_ids, pixel_index.pixel_of_station if pixel_index is not None else None
+            )
+        
+        # Per dataset result matrix, checkpoints and months still missing
+        full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+        results, stores, missing = [], [], []
+        for dataset in datasets:
+            result = ResultMatrixBuilder(full_date_range, sample_ids)
+            store = self._open_chunk_store(dataset, sample_points, coverage)
+            results.append(result)
+            stores.append(store)
+            missing.append(set(self._restore_chunks(store, result, result.month_keys())))
+        
+        # Days with images in any collection; blocks without any are checkpointed empty
+        dates_by_month = {}
+        for date_str in sorted({d for dataset in datasets
+                                for d in self._collection_dates(dataset, start_date, end_date)}):
+            dates_by_month.setdefault(date_str[:7], []).append(date_str)
+        month_keys = [m for m in results[0].month_keys() if any(m in months for months in missing)]
+        
+        sizer = self.request_sizes.sizer_for(sampling.name, self.DAILY_BLOCK_MONTHS,
+                                             self.MAX_DAILY_BLOCK_MONTHS, len(sample_points))
+        features = self._build_station_features(sample_points)
+        parse = lambda point_values: self._parse_stacked_response(point_values, sample_ids)
+        # Keep roughly two requests per executor slot queued
+        max_queued = 2 * self.executor.max_concurrency
+        
+        queue = deque(month_keys)
+        window = deque()
+        done = 0
+        while queue or window:
+            while queue and (not window or sum(len(entry[5]) for entry in window) < max_queued):
+                size = sizer.current()
+                block = [queue.popleft()]
+                while (queue and len(block) < size.block_months
+                       and self._next_month(f"{block[-1]}-01")[:7] == queue[0]):
+                    block.append(queue.popleft())
                 
-                # Use appropriate fetching method based on dataset characteristics
-                if dataset.time_scale == "monthly":
-                    data = self._fetch_monthly_dataset(dataset)
-                elif dataset.time_scale in ["hourly", "3hourly"] or dataset.name in ["GSMAP", "GLDAS-Historical", "GLDAS-Current"]:
-                    # For high-resolution datasets or specific datasets prone to memory issues
-                    data = self._fetch_high_resolution_dataset(dataset)
-                else:
-                    # For standard daily datasets
-                    data = self._fetch_ee_dataset(dataset)
+                members = [k for k in range(len(datasets)) if any(m in missing[k] for m in block)]
+                dates = [d for m in block for d in dates_by_month.get(m, [])]
+                block_end = self._next_month(f"{block[-1]}-01")
+                image_for = lambda start, end, members=members: self._stacked_image(
+                    collections, datasets, members, start, end)
+                chunks = self._station_chunks(self._active_features(features, coverage, block),
+                                              size.station_chunk)
+                futures = [
+                    self._submit_block(None, dates, chunk, None, sampling, end_date=block_end,
+                                       tile_scale=size.tile_scale, image_for=image_for)
+                    for chunk in chunks
+                ]
+                window.append((block, members, dates, block_end, size, futures, chunks, image_for,
+                               time.perf_counter()))
+            
+            block, members, dates, block_end, size, futures, chunks, image_for, submitted = window.popleft()
+            failures = []
+            block_data = {k: {} for k in members}
+            for chunk, future in zip(chunks, futures):
+                chunk_data = self._collect_block(
+                    future, None, dates, sample_points, chunk, None, sampling, end_date=block_end,
+                    failures=failures, size=size, sizer=sizer, image_for=image_for, parse=parse
+                )
+                for date_str, values in chunk_data.items():
+                    for (k, sample_id), value in values.items():
+                        block_data[k].setdefault(date_str, {})[sample_id] = value
+            if any(future is not None for future in futures) and not failures:
+                sizer.on_success(size, time.perf_counter() - submitted)
+            
+            for k in members:
+                self._checkpoint_block(stores[k], results[k], block_data[k],
+                                       [m for m in block if m in missing[k]], failures)
+            
+            done += len(block)
+            if self.progress_callback:
+                for k in members:
+                    self.progress_callback(datasets[k].name, int(15 + (done / len(month_keys)) * 80))
+        
+        self.request_sizes.put(sampling.name, sizer)
+        
+        data = {}
+        for dataset, result, store in zip(datasets, results, stores):
+            if dataset.conversion_factor != 1.0:
+                result.scale(dataset.conversion_factor)
+            frame = result.to_frame()
+            if pixel_index is not None:
+                frame = pixel_index.expand(frame)
+            complete = not store.missing(result.month_keys())
+            if complete:
+                store.discard()
+                if self.cache is not None:
+                    self.cache.store(self._cache_params(dataset), station_ids, start_year, end_year, frame,
+                                     self._station_coverage(station_ids))
+            else:
+                logger.warning(f"{dataset.name} fetch is incomplete; not caching so a re-run can resume it")
+            data[dataset.name] = frame
+        return data
+    
+    def _stacked_image(self, collections: List[Any], datasets: List[GriddedDatasetConfig],
+                       members: List[int], start_date: str, end_date: str):
+        """Daily bands of the member datasets over [start_date, end_date) as one image"""
+        images = [
+            self._stack_block(collections[k], start_date, end_date, datasets[k].variable_name,
+                              prefix=f"p{k}_")
+            for k in members
+        ]
+        return self.ee.ImageCollection.fromImages(images).toBands()
+    
+    def _parse_stacked_response(self, point_values: Dict[str, Any],
+                                station_ids: List[Any]) -> Dict[str, Dict[Tuple[int, Any], float]]:
+        """Convert a sampled stacked image into {date: {(dataset position, station_id): value}}"""
+        result = {}
+        for feature in point_values.get('features', []):
+            properties = feature['properties']
+            station_id = station_ids[int(properties['station_idx'])]
+            for band_name, value in properties.items():
+                match = self._STACKED_BAND_PATTERN.search(band_name)
+                if match is None or value is None or value == self.NODATA:
+                    continue
+                day = match.group(2)
+                date_str = f"{day[:4]}-{day[4:6]}-{day[6:]}"
+                result.setdefault(date_str, {})[(int(match.group(1)), station_id)] = value
+        return result
+    
+    def _fetch_with_cache(self, dataset: GriddedDatasetConfig) -> pd.DataFrame:
+        """
+        Fetch a dataset, reusing cached results for the same sampling parameters
+        
+        Exact cache hits are returned directly. For partial hits only the delta is
+        fetched: new stations over the whole year range, and missing years for the
+        stations already cached.
+        """
+        stations = self._planned_stations()
+        station_ids = stations['id'].tolist()
+        start_year, end_year = self.config.start_year, self.config.end_year
+        self._get_native_projection(dataset)
+        params = self._cache_params(dataset)
+        coverage = self._station_coverage(station_ids)
+        
+        hit = self.cache.lookup(params, station_ids, start_year, end_year, coverage) if self.cache else None
+        if hit is not None and hit.exact:
+            return hit.data
+        
+        if hit is None:
+            data, complete = self._fetch_dataset(dataset, stations, start_year, end_year)
+        else:
+            parts = [hit.data]
+            complete = True
+            
+            if hit.missing_stations:
+                logger.info(f"Fetching {dataset.name} for {len(hit.missing_stations)} new stations")
+                new_stations = stations[stations['id'].isin(hit.missing_stations)]
+                part, part_complete = self._fetch_dataset(dataset, new_stations, start_year, end_year)
+                parts.append(part)
+                complete = complete and part_complete
                 
-                results[dataset.name] = data
+            cached_stations = stations[~stations['id'].isin(hit.missing_stations)]
+            for span_start, span_end in hit.missing_years:
+                logger.info(f"Fetching {dataset.name} for missing years {span_start}-{span_end}")
+                part, part_complete = self._fetch_dataset(dataset, cached_stations, span_start, span_end)
+                parts.append(part)
+                complete = complete and part_complete
                 
-                if self.progress_callback:
-                    self.progress_callback(dataset.name, 100)
-                    
+            data = self._combine_parts(parts, station_ids, start_year, end_year)
+        
+        if self.cache is not None and complete:
+            self.cache.store(params, station_ids, start_year, end_year, data, coverage)
+        elif not complete:
+            logger.warning(f"{dataset.name} fetch is incomplete; not caching so a re-run can resume it")
+            
+        return data
+    
+    def _fetch_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                       start_year: int, end_year: int) -> Tuple[pd.DataFrame, bool]:
+        """
+        Fetch one dataset for the given stations and years
+        
+        Returns:
+            Tuple of (data, complete) where complete is False if some months
+            could not be fetched
+        """
+        # Sample each native grid cell once when several stations share it
+        pixel_index, sample_points = self._sample_points(dataset, stations)
+        
+        # Months in which each sample point has ground observations
+        coverage = None
+        if self.coverage_plan is not None:
+            coverage = self.coverage_plan.activity(
+                stations['id'].tolist(), pixel_index.pixel_of_station if pixel_index is not None else None
+            )
+        
+        # Use appropriate fetching method based on dataset characteristics
+        period = self._composite_period(dataset)
+        if self.config.fetch_mode == 'export' and period is None and not self._is_high_resolution(dataset):
+            # Daily or monthly values through batch table exports
+            data, complete = self._export_dataset(dataset, sample_points, start_year, end_year, coverage)
+        elif period is not None:
+            # Monthly or yearly sums computed in Earth Engine
+            data, complete = self._fetch_composite_dataset(dataset, sample_points, start_year, end_year,
+                                                           period, coverage)
+        elif dataset.time_scale == "monthly":
+            data, complete = self._fetch_monthly_dataset(dataset, sample_points, start_year, end_year, coverage)
+        elif self._is_high_resolution(dataset):
+            # For high-resolution datasets or specific datasets prone to memory issues
+            data, complete = self._fetch_high_resolution_dataset(dataset, sample_points, start_year, end_year,
+                                                                 coverage)
+        else:
+            # For standard daily datasets
+            data, complete = self._fetch_ee_dataset(dataset, sample_points, start_year, end_year, coverage)
+            
+        # Checkpoints are no longer needed once the result is complete
+        if complete:
+            self._open_chunk_store(dataset, sample_points).discard()
+        
+        # Fan pixel values back out to the stations
+        if pixel_index is not None:
+            data = pixel_index.expand(data)
+            
+        return data, complete
+    
+    def _is_high_resolution(self, dataset: GriddedDatasetConfig) -> bool:
+        """Whether a dataset is sub-daily or prone to memory issues, and fetched month by month"""
+        return (dataset.time_scale in ["hourly", "3hourly"]
+                or dataset.name in ["GSMAP", "GLDAS-Historical", "GLDAS-Current"])
+    
+    def _composite_period(self, dataset: GriddedDatasetConfig) -> Optional[str]:
+        """
+        Output period ('monthly' or 'yearly') to composite a dataset to in Earth Engine
+        
+        Only standard daily datasets are composited; monthly and sub-daily
+        products keep their own fetch paths. None means daily values are fetched.
+        """
+        period = self.config.output_resolution
+        if period not in self.COMPOSITE_BLOCK_PERIODS:
+            return None
+        if dataset.time_scale == "monthly" or self._is_high_resolution(dataset):
+            return None
+        return period
+    
+    def _get_native_projection(self, dataset: GriddedDatasetConfig) -> Optional[Dict[str, Any]]:
+        """
+        Native grid of a dataset's band, or None if unavailable
+        
+        Uses the dataset configuration when it specifies the grid, otherwise the
+        on-disk projection cache, and only asks Earth Engine for collections that
+        have never been looked up.
+        
+        Returns:
+            Dict with 'crs', 'transform' and 'scale' (meters)
+        """
+        if dataset.name in self._projections:
+            return self._projections[dataset.name]
+            
+        if dataset.native_crs and dataset.native_transform:
+            info = {'crs': dataset.native_crs, 'transform': dataset.native_transform,
+                    'scale': dataset.native_scale}
+        else:
+            info = self.projection_cache.get(dataset.collection_name, dataset.variable_name)
+            
+        if info is None:
+            try:
+                projection = self.ee.ImageCollection(dataset.collection_name) \
+                    .select(dataset.variable_name) \
+                    .first() \
+                    .projection()
+                response = self.executor.get_info(
+                    self.ee.Dictionary({'projection': projection, 'scale': projection.nominalScale()}),
+                    label=f"{dataset.name} projection"
+                ).result()
+                info = {
+                    'crs': response['projection'].get('crs') or response['projection'].get('wkt'),
+                    'transform': response['projection'].get('transform'),
+                    'scale': response['scale']
+                }
+                self.projection_cache.put(dataset.collection_name, dataset.variable_name, info)
+                logger.info(f"Discovered native grid of {dataset.name}: {info['crs']}, {info['scale']:.0f} m")
             except Exception as e:
-                logger.error(f"Error fetching {dataset.name} data: {e}", exc_info=True)
-                if self.progress_callback:
-                    self.progress_callback(dataset.name, 0)
-                continue
+                logger.warning(f"Could not get native projection of {dataset.name}: {str(e)}")
                 
-        return results
+        if info is not None:
+            dataset.native_crs = info['crs']
+            dataset.native_transform = info['transform']
+            dataset.native_scale = info['scale']
+            
+        self._projections[dataset.name] = info
+        return info
+    
+    def _sampling_args(self, dataset: GriddedDatasetConfig) -> Dict[str, Any]:
+        """sampleRegions arguments that sample on the dataset's native grid"""
+        info = self._get_native_projection(dataset)
+        if info is None or not info.get('crs') or not info.get('transform'):
+            return {'scale': self.SAMPLE_SCALE}
+        return {'projection': self.ee.Projection(info['crs'], info['transform'])}
+    
+    def _build_pixel_index(self, dataset: GriddedDatasetConfig,
+                           stations: pd.DataFrame) -> Optional[StationPixelIndex]:
+        """Index stations by native pixel, or None if deduplication would not help"""
+        projection = self._get_native_projection(dataset)
+        if projection is None:
+            return None
+            
+        pixel_index = StationPixelIndex.from_projection(stations, projection)
+        if pixel_index is None or pixel_index.n_pixels >= len(stations):
+            return None
+            
+        logger.info(f"{dataset.name}: {len(stations)} stations fall in {pixel_index.n_pixels} "
+                    f"unique pixels, sampling pixel centres only")
+        return pixel_index
+    
+    def _sample_points(self, dataset: GriddedDatasetConfig,
+                       stations: pd.DataFrame) -> Tuple[Optional[StationPixelIndex], pd.DataFrame]:
+        """Pixel index of the stations and the points to sample: unique pixel centres, or the stations"""
+        pixel_index = self._build_pixel_index(dataset, stations)
+        return pixel_index, pixel_index.sample_points() if pixel_index is not None else stations
+    
+    def _combine_parts(self, parts: List[pd.DataFrame], station_ids: List[Any],
+                       start_year: int, end_year: int) -> pd.DataFrame:
+        """Merge cached and newly fetched pieces into one matrix for the requested stations and years"""
+        combined = parts[0]
+        for part in parts[1:]:
+            combined = combined.combine_first(part)
+            
+        combined = combined.sort_index()
+        in_range = (combined.index.year >= start_year) & (combined.index.year <= end_year)
+        return combined.loc[in_range].reindex(columns=station_ids).astype(np.float32)
+    
+    def _cache_params(self, dataset: GriddedDatasetConfig) -> Dict[str, Any]:
+        """Sampling parameters that identify a dataset's fetched values"""
+        params = {
+            'collection': dataset.collection_name,
+            'variable': dataset.variable_name,
+            'conversion_factor': dataset.conversion_factor,
+            'time_scale': dataset.time_scale,
+            'crs': dataset.native_crs,
+            'scale': dataset.native_scale or self.SAMPLE_SCALE
+        }
+        period = self._composite_period(dataset)
+        if period is not None:
+            params['output_resolution'] = period
+            params['min_valid_day_fraction'] = self.config.min_valid_day_fraction
+        if self.coverage_plan is not None:
+            params['ground_coverage'] = True
+        return params
     
     def _should_skip_dataset(self, dataset: GriddedDatasetConfig) -> bool:
         """Check if dataset should be skipped based on date range constraints"""
@@ -148,70 +722,87 @@ class GriddedDataFetcher(DataFetcher):
             
         return pd.read_csv(metadata_file)
     
-    def _aggregate_to_daily(self, image_collection, dataset: GriddedDatasetConfig) -> ee.ImageCollection:
-        """Aggregate sub-daily data to daily in Earth Engine with dataset-specific handling"""
-        logger.info(f"Aggregating {dataset.time_scale} data to daily in Earth Engine for {dataset.name}...")
-        
-        # Define a function to extract date string and set it as a property
-        def add_date_property(image):
-            date = ee.Date(image.get('system:time_start'))
-            day_string = date.format('YYYY-MM-dd')
-            return image.set('date', day_string)
-        
-        # Add date property to each image
-        image_collection = image_collection.map(add_date_property)
-        
-        # Get list of unique dates
-        dates = image_collection.aggregate_array('date').distinct()
-        
-        # Define dataset-specific aggregation functions
-        def sum_day(day):
-            day_collection = image_collection.filter(ee.Filter.eq('date', day))
-            
-            # Handle dataset-specific aggregation logic
-            if dataset.name == 'GSMAP':
-                # For GSMAP, directly sum the hourly precipitation rates (mm/hr) to get daily total (mm/day)
-                # Each hour contributes 1 hour's worth of rain at the given rate
-                day_sum = day_collection.map(lambda img: img.multiply(1.0)).sum()
-            elif dataset.name.startswith('GLDAS'):
-                # For GLDAS (both Historical and Current), special handling needed
-                if dataset.time_scale == "3hourly":
-                    # For 3-hourly data, each image covers 3 hours (1/8 of day)
-                    # Scale each image by 3hours/24hours = 0.125 before summing
-                    day_sum = day_collection.map(lambda img: img.multiply(0.125 * dataset.conversion_factor)).sum()
-                else:
-                    # For other GLDAS temporal resolutions
-                    day_sum = day_collection.sum().multiply(dataset.conversion_factor)
-            else:
-                # For other datasets with hourly data (standard handling)
-                if dataset.time_scale == "hourly":
-                    # For hourly data, each image is 1/24 of a day
-                    day_sum = day_collection.map(lambda img: img.multiply(1.0/24.0)).sum()
-                    # Apply conversion factor after summing if needed
-                    if dataset.conversion_factor != 1.0:
-                        day_sum = day_sum.multiply(dataset.conversion_factor)
-                else:
-                    # For other temporal resolutions, just sum then apply conversion
-                    day_sum = day_collection.sum()
-                    if dataset.conversion_factor != 1.0:
-                        day_sum = day_sum.multiply(dataset.conversion_factor)
+    def _load_stations(self) -> pd.DataFrame:
+        """Load station IDs and coordinates for sampling"""
+        metadata = self._load_station_metadata()
+        if self.config.prune_by_inventory:
+            metadata = prune_stations(metadata, self.config.start_year, self.config.end_year,
+                                      self.config.min_inventory_coverage)
+        return metadata[['id', 'latitude', 'longitude']].dropna()
+    
+    @staticmethod
+    def _daily_aggregation_factor(dataset: GriddedDatasetConfig) -> float:
+        """Factor applied to each sub-daily image before summing it into a daily total"""
+        # Handle dataset-specific aggregation logic
+        if dataset.name == 'GSMAP':
+            # For GSMAP, directly sum the hourly precipitation rates (mm/hr) to get daily total (mm/day)
+            # Each hour contributes 1 hour's worth of rain at the given rate
+            return 1.0
+        elif dataset.name.startswith('GLDAS'):
+            # For GLDAS (both Historical and Current), special handling needed
+            if dataset.time_scale == "3hourly":
+                # For 3-hourly data, each image covers 3 hours (1/8 of day)
+                # Scale each image by 3hours/24hours = 0.125 before summing
+                return 0.125 * dataset.conversion_factor
+            # For other GLDAS temporal resolutions
+            return dataset.conversion_factor
+        elif dataset.time_scale == "hourly":
+            # For other datasets with hourly data, each image is 1/24 of a day
+            return dataset.conversion_factor / 24.0
+        # For other temporal resolutions, just sum then apply conversion
+        return dataset.conversion_factor
+    
+    def _aggregate_to_daily(self, image_collection, dataset: GriddedDatasetConfig,
+                            start_date: str, end_date: str):
+        """
+        Aggregate sub-daily data to daily in Earth Engine with dataset-specific handling
+        
+        Each day's total is built directly from its own time window over a
+        client-side day sequence, so no per-image date property or full-collection
+        filter per day is needed. Days without images are dropped.
+        
+        Args:
+            image_collection: Sub-daily collection already filtered to [start_date, end_date)
+            dataset: Dataset configuration
+            start_date: First day ('YYYY-MM-DD')
+            end_date: Exclusive end day ('YYYY-MM-DD')
+        """
+        logger.debug(f"Aggregating {dataset.time_scale} data to daily in Earth Engine for "
+                     f"{dataset.name} from {start_date} to {end_date}")
+        
+        factor = self._daily_aggregation_factor(dataset)
+        start = self.ee.Date(start_date)
+        n_days = (datetime.strptime(end_date, '%Y-%m-%d') - datetime.strptime(start_date, '%Y-%m-%d')).days
+        
+        def sum_day(offset):
+            day_start = start.advance(offset, 'day')
+            day_collection = image_collection.filterDate(day_start, day_start.advance(1, 'day'))
+            day_sum = day_collection.map(lambda img: img.multiply(factor)).sum()
             
-            # Keep the date as a property and set time to midnight
-            day_date = ee.Date.parse('YYYY-MM-dd', day)
+            # Set time to midnight and remember how many images contributed
             return day_sum.set({
-                'system:time_start': day_date.millis(),
-                'date': day
+                'system:time_start': day_start.millis(),
+                'n_images': day_collection.size()
             })
         
         # Create new daily collection by processing the sub-daily data
-        daily_collection = ee.ImageCollection(dates.map(sum_day))
-        
-        logger.info(f"Successfully aggregated {dataset.name} to daily data in Earth Engine")
-        return daily_collection
+        daily_images = self.ee.List.sequence(0, n_days - 1).map(sum_day)
+        return self.ee.ImageCollection.fromImages(daily_images).filter(self.ee.Filter.gt('n_images', 0))
     
-    def _fetch_monthly_dataset(self, dataset: GriddedDatasetConfig) -> pd.DataFrame:
-        """Fetch monthly data from Earth Engine (special case for FLDAS)"""
-        if not EARTH_ENGINE_AVAILABLE:
+    def _fetch_monthly_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                               start_year: int, end_year: int,
+                               coverage: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, bool]:
+        """
+        Fetch monthly data from Earth Engine (special case for FLDAS)
+        
+        Args:
+            coverage: Month × station activity from the ground coverage plan;
+                inactive stations are not sampled in those months
+        
+        Returns:
+            Tuple of (data, complete)
+        """
+        if self.ee is None:
             raise ImportError("Earth Engine API not available")
         
         # Report start of processing
@@ -219,8 +810,8 @@ class GriddedDataFetcher(DataFetcher):
             self.progress_callback(dataset.name, 5)
             
         # Create date range for the query
-        start_date = f"{self.config.start_year}-01-01"
-        end_date = f"{self.config.end_year}-12-31"
+        start_date = f"{start_year}-01-01"
+        end_date = f"{end_year}-12-31"
         
         logger.info(f"Fetching monthly {dataset.name} data from {start_date} to {end_date}")
         
@@ -229,18 +820,14 @@ class GriddedDataFetcher(DataFetcher):
         variable_name = dataset.variable_name
         
         # Create the image collection
-        image_collection = ee.ImageCollection(collection_name) \
+        image_collection = self.ee.ImageCollection(collection_name) \
             .select(variable_name) \
-            .filterDate(start_date, end_date)
+            .filterDate(start_date, self._next_day(end_date))
         
         # Update progress
         if self.progress_callback:
             self.progress_callback(dataset.name, 15)
         
-        # Load metadata for ground stations
-        metadata = self._load_station_metadata()
-        stations = metadata[['id', 'latitude', 'longitude']].dropna()
-        
         logger.info(f"Extracting monthly data for {len(stations)} stations")
         
         # Create full monthly date range for the dataframe
@@ -250,104 +837,69 @@ class GriddedDataFetcher(DataFetcher):
             freq='MS'  # Month start frequency
         )
         
-        # Create empty DataFrame with stations as columns and dates as index
-        result_df = pd.DataFrame(index=full_date_range, columns=stations['id'].tolist())
-        
-        # Get list of all months in the collection
-        date_list = []
-        dates = image_collection.aggregate_array('system:time_start').getInfo()
-        
-        # Convert milliseconds since epoch to date strings (first of month)
-        for d in dates:
-            dt = datetime.utcfromtimestamp(d/1000)
-            date_strings = dt.replace(day=1).strftime('%Y-%m-%d')
-            if date_strings not in date_list:
-                date_list.append(date_strings)
-        
-        # Sort dates
-        date_list.sort()
+        # Preallocated result matrix with stations as columns and dates as index
+        result = ResultMatrixBuilder(full_date_range, stations['id'].tolist())
+        
+        # Get list of all months in the collection (first of month)
+        date_list = self._collection_dates(dataset, start_date, end_date)
+        
+        # Restore months checkpointed by a previous run
+        store = self._open_chunk_store(dataset, stations, coverage)
+        month_keys = [d[:7] for d in date_list]
+        missing_months = self._restore_chunks(store, result, month_keys)
+        
+        # Process missing months in blocks: whole pixel blocks when the stations
+        # are dense on the grid, otherwise one sampling request per block and station chunk
+        dates_for = lambda months: [f"{m}-01" for m in months]
+        window = self._bulk_window(dataset, stations)
+        if window is not None:
+            self._download_months(
+                dataset, image_collection, missing_months, dates_for, stations, store, result,
+                window, self._bulk_block_months(window, days_per_month=1), progress_range=(15, 95),
+                coverage=coverage
+            )
+        else:
+            sizer = self.request_sizes.sizer_for(dataset.name, self.BLOCK_MONTHS, self.BLOCK_MONTHS,
+                                                 len(stations))
+            self._sample_months(
+                dataset, image_collection, missing_months, dates_for,
+                stations, store, result, sizer, progress_range=(15, 95), coverage=coverage
+            )
         
-        # Process each month
-        for i, date_str in enumerate(date_list):
-            # Update progress
-            progress = 15 + ((i / len(date_list)) * 80)
-            if self.progress_callback:
-                self.progress_callback(dataset.name, int(progress))
-            
-            # Get the first day of next month
-            month_date = datetime.strptime(date_str, '%Y-%m-%d')
-            if month_date.month == 12:
-                next_month = month_date.replace(year=month_date.year+1, month=1)
-            else:
-                next_month = month_date.replace(month=month_date.month+1)
-            next_month_str = next_month.strftime('%Y-%m-%d')
-            
-            # Filter collection to this month
-            monthly_image = image_collection.filterDate(date_str, next_month_str).first()
-            
-            if monthly_image is None:
-                logger.warning(f"No data available for {date_str}")
-                continue
-                
-            # Create list of points to sample
-            points = [ee.Geometry.Point(row['longitude'], row['latitude']) for _, row in stations.iterrows()]
-            
-            # Sample the image at all station points
-            try:
-                point_values = monthly_image.sampleRegions(
-                    collection=ee.FeatureCollection(points),
-                    properties=['system:index'],
-                    scale=1000  # Scale in meters
-                ).getInfo()
-                
-                # Extract values for each station
-                date = pd.to_datetime(date_str)
-                days_in_month = pd.Period(date, freq='M').days_in_month
-                
-                for i, feature in enumerate(point_values.get('features', [])):
-                    if variable_name in feature['properties']:
-                        station_id = stations.iloc[i]['id']
-                        value = feature['properties'][variable_name]
-                        
-                        # Convert kg/m²/s → mm/month:
-                        # First apply config conversion factor (86400) to get mm/day
-                        # Then multiply by days in month to get mm/month
-                        converted_value = value * dataset.conversion_factor * days_in_month
-                        
-                        if date in result_df.index:
-                            result_df.loc[date, station_id] = converted_value
-                
-            except Exception as e:
-                logger.error(f"Error sampling points for {date_str}: {str(e)}")
+        # Convert kg/m²/s → mm/month:
+        # First apply config conversion factor (86400) to get mm/day
+        # Then multiply by days in month to get mm/month
+        result.scale(dataset.conversion_factor * full_date_range.days_in_month.values)
         
         # Final progress update
         if self.progress_callback:
             self.progress_callback(dataset.name, 95)
             
-        return result_df
+        return result.to_frame(), not store.missing(month_keys)
     
-    def _fetch_high_resolution_dataset(self, dataset: GriddedDatasetConfig) -> pd.DataFrame:
+    def _fetch_high_resolution_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                                       start_year: int, end_year: int,
+                                       coverage: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, bool]:
         """
         Fetch data for high temporal resolution datasets (hourly, 3-hourly)
         using a month-by-month approach to avoid memory limits
+        
+        Args:
+            coverage: Month × station activity from the ground coverage plan;
+                inactive stations are not sampled in those months
+        
+        Returns:
+            Tuple of (data, complete)
         """
-        if not EARTH_ENGINE_AVAILABLE:
+        if self.ee is None:
             raise ImportError("Earth Engine API not available")
         
         # Report start of processing
         if self.progress_callback:
             self.progress_callback(dataset.name, 5)
             
-        # Create date range parameters
-        start_year = self.config.start_year
-        end_year = self.config.end_year
-        
         logger.info(f"Fetching {dataset.name} data from {start_year} to {end_year} using chunked approach")
         
-        # Load metadata for ground stations
-        metadata = self._load_station_metadata()
-        stations = metadata[['id', 'latitude', 'longitude']].dropna()
-        
         logger.info(f"Extracting data for {len(stations)} stations")
         
         # Create full date range for the dataframe (daily resolution for result)
@@ -355,106 +907,331 @@ class GriddedDataFetcher(DataFetcher):
         end_date = f"{end_year}-12-31"
         full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        # Create empty DataFrame with stations as columns and dates as index
-        result_df = pd.DataFrame(index=full_date_range, columns=stations['id'].tolist())
+        # Preallocated result matrix with stations as columns and dates as index
+        result = ResultMatrixBuilder(full_date_range, stations['id'].tolist())
         
         # Get collection info
         collection_name = dataset.collection_name
         variable_name = dataset.variable_name
         
-        # Process data month by month to avoid memory limits
-        total_months = (end_year - start_year + 1) * 12
-        month_count = 0
+        # Station points are shared by every sampling request; the chunking and
+        # tileScale learned for this dataset are reused, blocks are always one month
+        sizer = self.request_sizes.sizer_for(dataset.name, 1, 1, len(stations))
+        size = sizer.current()
+        features = self._build_station_features(stations)
+        
+        # Restore months checkpointed by a previous run
+        store = self._open_chunk_store(dataset, stations, coverage)
+        missing_months = self._restore_chunks(store, result, result.month_keys())
+        
+        # Submit one sampling request per missing month and station chunk up front so the requests overlap.
+        # Data is processed month by month to avoid memory limits.
+        # Days covered by the collection; months outside its record are empty
+        dates_by_month = {}
+        for date_str in self._collection_dates(dataset, start_date, end_date):
+            dates_by_month.setdefault(date_str[:7], []).append(date_str)
+        
+        pending = []
+        for month_key in missing_months:
+            # Define month start and end dates
+            month_start = f"{month_key}-01"
+            next_month_start = self._next_month(month_start)
+            date_strings = dates_by_month.get(month_key, [])
+            station_chunks = self._station_chunks(self._active_features(features, coverage, [month_key]),
+                                                  size.station_chunk)
+            if not date_strings or not station_chunks:
+                pending.append((month_key, None, date_strings, [], []))
+                continue
+            
+            # Get data for this month
+            image_collection = self.ee.ImageCollection(collection_name) \
+                .select(variable_name) \
+                .filterDate(month_start, next_month_start)
+            
+            # For sub-daily data, aggregate to daily in GEE
+            image_collection = self._aggregate_to_daily(image_collection, dataset,
+                                                        month_start, next_month_start)
+            
+            # Days without data are simply absent from the sampled response
+            futures = [
+                self._submit_block(image_collection, date_strings, station_chunk,
+                                   variable_name, dataset, end_date=next_month_start,
+                                   tile_scale=size.tile_scale)
+                for station_chunk in station_chunks
+            ]
+            pending.append((month_key, image_collection, date_strings, station_chunks, futures))
+        
+        for month_idx, (month_key, image_collection, date_strings, station_chunks, futures) in enumerate(pending):
+            # Sample every day of this month, one request per station chunk
+            failures = []
+            month_data = {}
+            for station_chunk, future in zip(station_chunks, futures):
+                chunk_data = self._collect_block(
+                    future, image_collection, date_strings, stations, station_chunk,
+                    variable_name, dataset, end_date=self._next_month(f"{month_key}-01"),
+                    failures=failures, size=size, sizer=sizer
+                )
+                for date_str, values in chunk_data.items():
+                    month_data.setdefault(date_str, {}).update(values)
+            
+            # No need for additional conversion factor here
+            # The conversion has already been applied during aggregation
+            self._checkpoint_block(store, result, month_data, [month_key], failures)
+            
+            # Update progress based on months processed
+            progress = 10 + (((month_idx + 1) / len(pending)) * 85)
+            if self.progress_callback:
+                self.progress_callback(dataset.name, int(progress))
         
-        # Iterate through each month in the date range
-        for year in range(start_year, end_year + 1):
-            for month in range(1, 13):
-                # Update progress based on months processed
-                month_count += 1
-                progress = 10 + ((month_count / total_months) * 85)
-                if self.progress_callback:
-                    self.progress_callback(dataset.name, int(progress))
-                
-                # Define month start and end dates
-                month_start = f"{year}-{month:02d}-01"
-                # Calculate next month (handling December)
-                if month == 12:
-                    next_month_start = f"{year+1}-01-01"
-                else:
-                    next_month_start = f"{year}-{month+1:02d}-01"
-                
-                try:
-                    logger.info(f"Processing {dataset.name} for {month_start}")
-                    
-                    # Get data for this month
-                    image_collection = ee.ImageCollection(collection_name) \
-                        .select(variable_name) \
-                        .filterDate(month_start, next_month_start)
-                    
-                    # For sub-daily data, aggregate to daily in GEE
-                    image_collection = self._aggregate_to_daily(image_collection, dataset)
-                    
-                    # Get dates in this month (this should be a smaller, manageable list)
-                    try:
-                        month_dates = image_collection.aggregate_array('system:time_start').getInfo()
-                        date_strings = [datetime.utcfromtimestamp(d/1000).strftime('%Y-%m-%d') 
-                                    for d in month_dates]
-                        # Sort dates
-                        date_strings.sort()
-                    except Exception as e:
-                        logger.warning(f"Error getting dates for {month_start}: {str(e)}")
-                        continue
-                    
-                    # Process each day in this month
-                    for date_str in date_strings:
-                        # Get daily image
-                        next_day_str = self._next_day(date_str)
-                        daily_image = image_collection.filterDate(date_str, next_day_str).first()
-                        
-                        if daily_image is None:
-                            continue
-                        
-                        # Create list of points to sample
-                        points = [ee.Geometry.Point(row['longitude'], row['latitude']) 
-                                for _, row in stations.iterrows()]
-                        
-                        # Sample the image at all station points
-                        try:
-                            point_values = daily_image.sampleRegions(
-                                collection=ee.FeatureCollection(points),
-                                properties=['system:index'],
-                                scale=1000  # Scale in meters
-                            ).getInfo()
-                            
-                            # Extract values for each station
-                            date = pd.to_datetime(date_str)
-                            for i, feature in enumerate(point_values.get('features', [])):
-                                if variable_name in feature['properties']:
-                                    station_id = stations.iloc[i]['id']
-                                    value = feature['properties'][variable_name]
-                                    
-                                    # No need for additional conversion factor here
-                                    # The conversion has already been applied during aggregation
-                                    
-                                    if date in result_df.index:
-                                        result_df.loc[date, station_id] = value
-                        
-                        except Exception as e:
-                            logger.warning(f"Error sampling points for {date_str}: {str(e)}")
-                
-                except Exception as e:
-                    logger.warning(f"Error processing {dataset.name} for {month_start}: {str(e)}")
-                    continue
+        self.request_sizes.put(dataset.name, sizer)
+        
+        # Final progress update
+        if self.progress_callback:
+            self.progress_callback(dataset.name, 95)
+            
+        return result.to_frame(), not store.missing(result.month_keys())
+        
+    def _get_export_backend(self) -> ExportTaskBackend:
+        """Task API for export mode, created on first use"""
+        if self.export_backend is None:
+            self.export_backend = EarthEngineExportBackend(self.ee, self.config.export_bucket,
+                                                           project_id=self.config.ee_project_id)
+        return self.export_backend
+    
+    def _export_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                        start_year: int, end_year: int,
+                        coverage: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, bool]:
+        """
+        Fetch a daily or monthly dataset through batch table exports
+        
+        One export task samples the stations for a block of months
+        (EXPORT_BLOCK_MONTHS of daily images, BLOCK_MONTHS of monthly ones), so
+        large extractions run under Earth Engine's batch quotas instead of the
+        interactive payload and time limits. Tasks are polled together and each
+        finished table is checkpointed as soon as it is ingested.
+        
+        Args:
+            coverage: Month × station activity from the ground coverage plan;
+                inactive stations are left out of a block's task
+        
+        Returns:
+            Tuple of (data, complete)
+        """
+        if self.ee is None:
+            raise ImportError("Earth Engine API not available")
+        
+        if self.progress_callback:
+            self.progress_callback(dataset.name, 5)
+        
+        monthly = dataset.time_scale == "monthly"
+        start_date = f"{start_year}-01-01"
+        end_date = f"{end_year}-12-31"
+        variable_name = dataset.variable_name
+        
+        logger.info(f"Exporting {dataset.name} data from {start_date} to {end_date}")
+        
+        image_collection = self.ee.ImageCollection(dataset.collection_name) \
+            .select(variable_name) \
+            .filterDate(start_date, self._next_day(end_date))
+        
+        if monthly:
+            full_date_range = pd.date_range(start=start_date, end=pd.to_datetime(end_date).replace(day=28), freq='MS')
+        else:
+            full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
+        result = ResultMatrixBuilder(full_date_range, stations['id'].tolist())
+        station_ids = stations['id'].tolist()
+        
+        dates_by_month = {}
+        for date_str in self._collection_dates(dataset, start_date, end_date):
+            dates_by_month.setdefault(date_str[:7], []).append(date_str)
+        month_keys = list(dates_by_month) if monthly else result.month_keys()
+        
+        # Restore months checkpointed by a previous run
+        store = self._open_chunk_store(dataset, stations, coverage)
+        missing_months = self._restore_chunks(store, result, month_keys)
+        
+        # One export task per block of months with images and active stations
+        features = self._build_station_features(stations)
+        tasks, blocks = {}, {}
+        for block in self._group_months(missing_months, self.BLOCK_MONTHS if monthly else self.EXPORT_BLOCK_MONTHS):
+            dates = [d for m in block for d in dates_by_month.get(m, [])]
+            block_features = self._active_features(features, coverage, block)
+            if not dates or not block_features:
+                self._checkpoint_block(store, result, {}, block, [])
+                continue
+            
+            stacked_image = self._stack_block(image_collection, dates[0],
+                                              self._next_month(f"{block[-1]}-01"), variable_name)
+            samples = stacked_image.sampleRegions(
+                collection=self.ee.FeatureCollection(block_features),
+                properties=['station_idx'],
+                geometries=False,
+                **self._sampling_args(dataset)
+            )
+            tasks[block[0]] = (samples, export_description(dataset.name, block[0], block[-1]))
+            blocks[block[0]] = block
+        
+        if self.progress_callback:
+            self.progress_callback(dataset.name, 15)
+        
+        ingested = []
+        
+        def ingest(key: str, table: pd.DataFrame):
+            self._checkpoint_block(store, result, self._parse_table(table, station_ids), blocks[key], [])
+            ingested.append(key)
+            logger.info(f"Ingested {dataset.name} export {key} ({len(ingested)}/{len(tasks)})")
+            if self.progress_callback:
+                self.progress_callback(dataset.name, int(15 + (len(ingested) / len(tasks)) * 80))
+        
+        def failed(key: str, message: str):
+            logger.error(f"{dataset.name} export of {blocks[key][0]}..{blocks[key][-1]} failed: {message}")
+        
+        if tasks:
+            timeout = self.config.export_timeout_hours
+            ExportTaskManager(self._get_export_backend(), poll_interval=self.config.export_poll_seconds,
+                              max_workers=self.config.max_concurrent_requests,
+                              timeout=timeout * 3600 if timeout is not None else None
+                              ).run(tasks, ingest, failed)
+        
+        if monthly:
+            # kg/m²/s → mm/day by the conversion factor, then mm/month
+            result.scale(dataset.conversion_factor * full_date_range.days_in_month.values)
+        elif dataset.conversion_factor != 1.0:
+            result.scale(dataset.conversion_factor)
+        
+        if self.progress_callback:
+            self.progress_callback(dataset.name, 95)
+        
+        return result.to_frame(), not store.missing(month_keys)
+    
+    def _parse_table(self, table: pd.DataFrame, station_ids: List[Any]) -> Dict[str, Dict[str, float]]:
+        """Convert an exported sample table (one row per station) into {date: {station_id: value}}"""
+        result = {}
+        if table.empty or 'station_idx' not in table.columns:
+            return result
+        
+        row_ids = [station_ids[int(i)] for i in table['station_idx']]
+        for column in table.columns:
+            match = self._BAND_DATE_PATTERN.search(str(column))
+            if match is None:
+                continue
+            
+            values = pd.to_numeric(table[column], errors='coerce').to_numpy(dtype=np.float64)
+            valid = np.flatnonzero(~np.isnan(values) & (values != self.NODATA))
+            if len(valid) == 0:
+                continue
+            day = match.group(1)
+            result[f"{day[:4]}-{day[4:6]}-{day[6:]}"] = {row_ids[i]: values[i] for i in valid}
+        return result
+    
+    def _fetch_composite_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                                 start_year: int, end_year: int, period: str,
+                                 coverage: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, bool]:
+        """
+        Fetch monthly or yearly sums of a daily dataset, composited in Earth Engine
+        
+        Each period is reduced server-side to the sum of its daily images and
+        the number of valid days, so one value pair per station and period is
+        transferred instead of every daily value. Sums covering fewer than
+        ``config.min_valid_day_fraction`` of the period's days are dropped,
+        matching the threshold used when aggregating daily data locally.
+        
+        Args:
+            coverage: Month × station activity from the ground coverage plan;
+                stations inactive throughout a block's periods are not sampled
+            
+        Returns:
+            Tuple of (data, complete), indexed by period start
+        """
+        if self.ee is None:
+            raise ImportError("Earth Engine API not available")
+        
+        # Report start of processing
+        if self.progress_callback:
+            self.progress_callback(dataset.name, 5)
+            
+        start_date = f"{start_year}-01-01"
+        end_date = f"{end_year}-12-31"
+        
+        logger.info(f"Fetching {period} {dataset.name} sums from {start_date} to {end_date}")
+        
+        image_collection = self.ee.ImageCollection(dataset.collection_name) \
+            .select(dataset.variable_name) \
+            .filterDate(start_date, self._next_day(end_date))
+        
+        # One row per period start
+        full_date_range = pd.date_range(start=start_date, end=end_date,
+                                        freq='MS' if period == 'monthly' else 'YS')
+        result = ResultMatrixBuilder(full_date_range, stations['id'].tolist())
+        
+        # Periods the collection has no images for are empty
+        period_of = (lambda date_str: date_str[:7]) if period == 'monthly' else (lambda date_str: date_str[:4])
+        covered = {period_of(d) for d in self._collection_dates(dataset, start_date, end_date)}
+        
+        # Checkpoints are keyed on the month of each period start
+        store = self._open_chunk_store(dataset, stations, coverage)
+        missing_keys = self._restore_chunks(store, result, result.month_keys())
+        for month_key in [k for k in missing_keys if period_of(f"{k}-01") not in covered]:
+            self._checkpoint_block(store, result, {}, [month_key], [])
+        missing_keys = [k for k in missing_keys if period_of(f"{k}-01") in covered]
+        
+        if self.progress_callback:
+            self.progress_callback(dataset.name, 15)
+        
+        # Every block is submitted up front; blocks are small
+        features = self._build_station_features(stations)
+        block_size = self.COMPOSITE_BLOCK_PERIODS[period]
+        pending = []
+        for i in range(0, len(missing_keys), block_size):
+            block_keys = missing_keys[i:i + block_size]
+            block_months = block_keys if period == 'monthly' else \
+                [f"{k[:4]}-{month:02d}" for k in block_keys for month in range(1, 13)]
+            block_features = self._active_features(features, coverage, block_months)
+            if not block_features:
+                pending.append((block_keys, None, None))
+                continue
+            station_collection = self.ee.FeatureCollection(block_features)
+            future = self._submit_block(image_collection, [f"{k}-01" for k in block_keys],
+                                        station_collection, dataset.variable_name, dataset,
+                                        period=period)
+            pending.append((block_keys, station_collection, future))
+        
+        for block_idx, (block_keys, station_collection, future) in enumerate(pending):
+            failures = []
+            block_data = self._collect_block(
+                future, image_collection, [f"{k}-01" for k in block_keys], stations,
+                station_collection, dataset.variable_name, dataset, failures=failures, period=period
+            )
+            self._checkpoint_block(store, result, block_data, block_keys, failures)
+            
+            progress = 15 + (((block_idx + 1) / len(pending)) * 80)
+            if self.progress_callback:
+                self.progress_callback(dataset.name, int(progress))
+        
+        # Apply conversion factor if needed
+        if dataset.conversion_factor != 1.0:
+            result.scale(dataset.conversion_factor)
         
         # Final progress update
         if self.progress_callback:
             self.progress_callback(dataset.name, 95)
             
-        return result_df
+        return result.to_frame(), not store.missing(result.month_keys())
+        
+    def _fetch_ee_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                          start_year: int, end_year: int,
+                          coverage: Optional[pd.DataFrame] = None) -> Tuple[pd.DataFrame, bool]:
+        """
+        Fetch data from Earth Engine for a specific dataset with appropriate aggregation
         
-    def _fetch_ee_dataset(self, dataset: GriddedDatasetConfig) -> pd.DataFrame:
-        """Fetch data from Earth Engine for a specific dataset with appropriate aggregation"""
-        if not EARTH_ENGINE_AVAILABLE:
+        Args:
+            coverage: Month × station activity from the ground coverage plan;
+                inactive stations are not sampled in those months
+        
+        Returns:
+            Tuple of (data, complete)
+        """
+        if self.ee is None:
             raise ImportError("Earth Engine API not available")
         
         # Report start of processing
@@ -462,8 +1239,8 @@ class GriddedDataFetcher(DataFetcher):
             self.progress_callback(dataset.name, 5)
             
         # Create date range for the query
-        start_date = f"{self.config.start_year}-01-01"
-        end_date = f"{self.config.end_year}-12-31"
+        start_date = f"{start_year}-01-01"
+        end_date = f"{end_year}-12-31"
         
         logger.info(f"Fetching {dataset.name} data from {start_date} to {end_date}")
         
@@ -472,125 +1249,682 @@ class GriddedDataFetcher(DataFetcher):
         variable_name = dataset.variable_name
         
         # Create the image collection
-        image_collection = ee.ImageCollection(collection_name) \
+        image_collection = self.ee.ImageCollection(collection_name) \
             .select(variable_name) \
-            .filterDate(start_date, end_date)
+            .filterDate(start_date, self._next_day(end_date))
         
         # Update progress
         if self.progress_callback:
             self.progress_callback(dataset.name, 15)
         
-        # Load metadata for ground stations
-        metadata = self._load_station_metadata()
-        stations = metadata[['id', 'latitude', 'longitude']].dropna()
-        
         logger.info(f"Extracting data for {len(stations)} stations")
         
         # Get list of all dates in the collection
-        date_list = self._get_date_list(image_collection)
+        date_list = self._collection_dates(dataset, start_date, end_date)
         
         # Create full date range for the dataframe
         full_date_range = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        # Create empty DataFrame with stations as columns and dates as index
-        result_df = pd.DataFrame(index=full_date_range, columns=stations['id'].tolist())
-        
-        # Process data in batches to avoid timeout issues
-        batch_size = 100  # Process 100 days at a time
-        total_batches = len(date_list) // batch_size + (1 if len(date_list) % batch_size > 0 else 0)
-        
-        # Process each batch
-        for batch_idx in range(total_batches):
-            batch_start = batch_idx * batch_size
-            batch_end = min((batch_idx + 1) * batch_size, len(date_list))
-            batch_dates = date_list[batch_start:batch_end]
-            
-            # Update progress based on batch
-            batch_progress = 15 + ((batch_idx / total_batches) * 80)
-            if self.progress_callback:
-                self.progress_callback(dataset.name, int(batch_progress))
-            
-            # Process this batch of dates
-            batch_data = self._process_date_batch(
-                image_collection, batch_dates, stations, variable_name, dataset
+        # Preallocated result matrix with stations as columns and dates as index
+        result = ResultMatrixBuilder(full_date_range, stations['id'].tolist())
+        
+        # Restore months checkpointed by a previous run
+        store = self._open_chunk_store(dataset, stations, coverage)
+        missing_months = self._restore_chunks(store, result, result.month_keys())
+        
+        # Process data in batches of whole months to avoid timeout issues: whole pixel
+        # blocks when the stations are dense on the grid, otherwise one sampling
+        # request per batch and station chunk
+        dates_by_month = {}
+        for date_str in date_list:
+            dates_by_month.setdefault(date_str[:7], []).append(date_str)
+        dates_for = lambda months: [d for m in months for d in dates_by_month.get(m, [])]
+        window = self._bulk_window(dataset, stations)
+        if window is not None:
+            self._download_months(
+                dataset, image_collection, missing_months, dates_for, stations, store, result,
+                window, self._bulk_block_months(window, days_per_month=31), progress_range=(15, 95),
+                coverage=coverage
+            )
+        else:
+            sizer = self.request_sizes.sizer_for(dataset.name, self.DAILY_BLOCK_MONTHS,
+                                                 self.MAX_DAILY_BLOCK_MONTHS, len(stations))
+            self._sample_months(
+                dataset, image_collection, missing_months, dates_for,
+                stations, store, result, sizer, progress_range=(15, 95), coverage=coverage
             )
-            
-            # Add batch data to result dataframe
-            for date_str, station_values in batch_data.items():
-                date = pd.to_datetime(date_str)
-                if date in result_df.index:
-                    for station_id, value in station_values.items():
-                        result_df.loc[date, station_id] = value
-            
-            logger.info(f"Processed batch {batch_idx+1}/{total_batches} for {dataset.name}")
         
         # Apply conversion factor if needed
         if dataset.conversion_factor != 1.0:
-            result_df = result_df.mul(dataset.conversion_factor)
+            result.scale(dataset.conversion_factor)
         
         # Final progress update
         if self.progress_callback:
             self.progress_callback(dataset.name, 95)
             
-        return result_df
+        return result.to_frame(), not store.missing(result.month_keys())
     
-    def _get_date_list(self, image_collection) -> List[str]:
-        """Get list of dates in the image collection"""
-        # Get distinct dates from the collection
-        dates = image_collection.aggregate_array('system:time_start').getInfo()
+    def _collection_dates(self, dataset: GriddedDatasetConfig, start_date: str, end_date: str) -> List[str]:
+        """
+        Image dates of a dataset's collection between start_date and end_date (inclusive)
         
-        # Convert milliseconds since epoch to date strings
-        date_strings = [datetime.utcfromtimestamp(d/1000).strftime('%Y-%m-%d') for d in dates]
+        Dates come from the persisted collection date index. Regular-cadence
+        products only need the first and last timestamps of the collection; their
+        dates are generated client-side. The index is extended with timestamps
+        after the last indexed one when the request reaches past it.
         
-        # Sort dates
-        date_strings.sort()
+        Returns:
+            Sorted 'YYYY-MM-DD' strings: one per day, or the first of each month
+            for monthly datasets
+        """
+        entry = self._update_date_index(dataset, end_date)
+        if entry is None or entry.get('first') is None:
+            return []
+            
+        monthly = dataset.time_scale == "monthly"
+        if entry.get('timestamps') is not None:
+            times = pd.to_datetime(entry['timestamps'], unit='ms')
+        else:
+            first = pd.to_datetime(entry['first'], unit='ms')
+            last = pd.to_datetime(entry['last'], unit='ms')
+            if monthly:
+                times = pd.date_range(first.to_period('M').to_timestamp(), last, freq='MS')
+            else:
+                times = pd.date_range(first.normalize(), last, freq='D')
+                
+        times = times.to_period('M').to_timestamp() if monthly else times.normalize()
+        times = times[(times >= pd.Timestamp(start_date)) & (times <= pd.Timestamp(end_date))]
+        return sorted(set(times.strftime('%Y-%m-%d')))
+    
+    def _update_date_index(self, dataset: GriddedDatasetConfig, end_date: str) -> Optional[Dict[str, Any]]:
+        """Index entry of a dataset's collection, fetched or extended as needed"""
+        collection_name = dataset.collection_name
+        entry = self.date_index.get(collection_name)
+        collection = self.ee.ImageCollection(collection_name)
+        label = f"{dataset.name} dates"
+        # Timestamp queries may change as new images are ingested
+        ttl = self.config.date_index_refresh_hours * 3600
+        
+        # Entries indexed by bounds only are rescanned once the product is no longer regular
+        if entry is not None and entry.get('timestamps') is None and not dataset.regular_cadence:
+            entry = None
+        
+        if entry is None:
+            # One full-record scan per collection, ever
+            if dataset.regular_cadence:
+                bounds = self.executor.get_info(self.ee.Dictionary({
+                    'first': collection.aggregate_min('system:time_start'),
+                    'last': collection.aggregate_max('system:time_start')
+                }), label=label, ttl=ttl).result()
+                entry = {'first': bounds['first'], 'last': bounds['last'], 'timestamps': None}
+            else:
+                timestamps = sorted(self.executor.get_info(
+                    collection.aggregate_array('system:time_start'), label=label, ttl=ttl).result())
+                entry = {'first': timestamps[0] if timestamps else None,
+                         'last': timestamps[-1] if timestamps else None,
+                         'timestamps': timestamps}
+            entry['checked'] = time.time()
+            self.date_index.put(collection_name, entry)
+            logger.info(f"Indexed dates of {collection_name}")
+            return entry
+        
+        end_ms = int(pd.Timestamp(end_date).value // 10 ** 6) + 24 * 3600 * 1000
+        stale = time.time() - entry.get('checked', 0) > self.config.date_index_refresh_hours * 3600
+        if entry.get('last') is None or entry['last'] >= end_ms or not stale:
+            return entry
+        
+        # Only ask for images newer than the last indexed one
+        tail = collection.filterDate(entry['last'] + 1, end_ms)
+        if entry.get('timestamps') is not None:
+            new_timestamps = sorted(self.executor.get_info(
+                tail.aggregate_array('system:time_start'), label=label, ttl=ttl).result())
+            entry['timestamps'].extend(new_timestamps)
+            if new_timestamps:
+                entry['last'] = new_timestamps[-1]
+        else:
+            new_last = self.executor.get_info(tail.aggregate_max('system:time_start'),
+                                              label=label, ttl=ttl).result()
+            if new_last is not None:
+                entry['last'] = new_last
+                
+        entry['checked'] = time.time()
+        self.date_index.put(collection_name, entry)
+        logger.info(f"Extended date index of {collection_name} to "
+                    f"{datetime.utcfromtimestamp(entry['last'] / 1000):%Y-%m-%d}")
+        return entry
         
-        return date_strings
+    def _build_station_features(self, stations: pd.DataFrame) -> List[Any]:
+        """
+        Build the station point features used for sampling
         
-    def _process_date_batch(self, image_collection, dates, stations, variable_name, dataset) -> Dict[str, Dict[str, float]]:
-        """Process a batch of dates to extract point values for all stations"""
-        result = {}
+        Each feature carries the positional index of its station so sampled
+        values can be matched back even when EE drops points without data.
+        """
+        return [
+            self.ee.Feature(self.ee.Geometry.Point(row['longitude'], row['latitude']), {'station_idx': i})
+            for i, (_, row) in enumerate(stations.iterrows())
+        ]
+    
+    def _build_station_collection(self, stations: pd.DataFrame):
+        """Build the FeatureCollection of every station point"""
+        return self.ee.FeatureCollection(self._build_station_features(stations))
+    
+    def _station_chunks(self, features: List[Any], chunk_size: int) -> List[Any]:
+        """Split station features into FeatureCollections of at most chunk_size points"""
+        chunk_size = max(1, chunk_size)
+        return [self.ee.FeatureCollection(features[i:i + chunk_size])
+                for i in range(0, len(features), chunk_size)]
+    
+    def _active_features(self, features: List[Any], coverage: Optional[pd.DataFrame],
+                         month_keys: List[str]) -> List[Any]:
+        """Station features with ground observations in any of the months (all without a plan)"""
+        if coverage is None:
+            return features
+        active = coverage.reindex(month_keys, fill_value=False).to_numpy(dtype=bool).any(axis=0)
+        return [feature for feature, is_active in zip(features, active) if is_active]
+    
+    def _bulk_window(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame) -> Optional[PixelWindow]:
+        """
+        Pixel window to download for a dataset's stations, or None to sample points
         
-        for date_str in dates:
-            # Filter collection to this date
-            next_day_str = self._next_day(date_str)
-            daily_image = image_collection.filterDate(date_str, next_day_str).first()
+        Whole blocks are downloaded when the stations' bounding box holds at most
+        ``config.bulk_pixel_ratio`` pixels per station and a month of daily bands
+        fits in one download.
+        """
+        if self.config.bulk_pixel_ratio <= 0:
+            return None
+        info = self._get_native_projection(dataset)
+        if info is None:
+            return None
+        window = PixelWindow.from_projection(stations, info)
+        if window is None:
+            return None
+        
+        if window.n_pixels > self.config.bulk_pixel_ratio * len(stations):
+            logger.info(f"{dataset.name}: {window.n_pixels} pixels for {len(stations)} stations, sampling points")
+            return None
+        if window.n_pixels * 8 * 31 > self.BULK_MAX_BYTES:
+            return None
+        
+        logger.info(f"{dataset.name}: downloading {window.width}x{window.height} pixel blocks "
+                    f"for {len(stations)} stations")
+        return window
+    
+    def _bulk_block_months(self, window: PixelWindow, days_per_month: int) -> int:
+        """Months of bands that fit in one download of the window"""
+        bands = min(self.BULK_MAX_BANDS, self.BULK_MAX_BYTES // (window.n_pixels * 8))
+        return max(1, bands // days_per_month)
+    
+    def _download_months(self, dataset: GriddedDatasetConfig, image_collection, month_keys: List[str],
+                         dates_for: Callable[[List[str]], List[str]], stations: pd.DataFrame,
+                         store: ChunkStore, result: ResultMatrixBuilder, window: PixelWindow,
+                         block_months: int, progress_range: Tuple[int, int],
+                         coverage: Optional[pd.DataFrame] = None) -> None:
+        """
+        Download and checkpoint months as time-stacked pixel blocks of the window
+        
+        Each block is fetched with one ``computePixels`` call and every station is
+        sampled from the array locally. A block whose download fails is sampled
+        point-wise instead.
+        
+        Args:
+            month_keys: Ordered 'YYYY-MM' keys to fetch
+            dates_for: Maps the months of a block to the image dates it covers
+            window: Pixel window covering the stations
+            block_months: Months per download
+            progress_range: Progress reported before the first and after the last block
+            coverage: Month × station activity; blocks without any active station are skipped
+        """
+        variable_name = dataset.variable_name
+        station_ids = stations['id'].tolist()
+        
+        pending = []
+        for block in self._group_months(month_keys, block_months):
+            dates = dates_for(block)
+            block_end = self._next_month(f"{block[-1]}-01")
+            if coverage is not None and not coverage.reindex(block, fill_value=False).to_numpy(dtype=bool).any():
+                dates = []
+            pending.append((block, dates, block_end,
+                            self._submit_download(image_collection, dates, block_end, variable_name,
+                                                  window, dataset)))
+        
+        for block_idx, (block, dates, block_end, future) in enumerate(pending):
+            failures = []
+            block_data = {}
+            if future is not None:
+                try:
+                    block_data = self._parse_download(future.result(), window, station_ids)
+                except Exception as e:
+                    logger.warning(f"Downloading {dataset.name} {block[0]}..{block[-1]} failed, "
+                                   f"sampling points instead: {str(e)}")
+                    station_collection = self._build_station_collection(stations)
+                    block_data = self._collect_block(
+                        self._submit_block(image_collection, dates, station_collection,
+                                           variable_name, dataset, end_date=block_end),
+                        image_collection, dates, stations, station_collection,
+                        variable_name, dataset, end_date=block_end, failures=failures
+                    )
             
-            if daily_image is None:
-                logger.warning(f"No data available for {date_str} in {dataset.name}")
+            self._checkpoint_block(store, result, block_data, block, failures)
+            
+            if self.progress_callback:
+                start, end = progress_range
+                self.progress_callback(dataset.name, int(start + ((block_idx + 1) / len(pending)) * (end - start)))
+    
+    def _submit_download(self, image_collection, dates: List[str], end_date: str, variable_name: str,
+                         window: PixelWindow, dataset: GriddedDatasetConfig) -> Optional[Future]:
+        """Schedule the computePixels download of a block of dates, or None for an empty block"""
+        if not dates:
+            return None
+        
+        stacked_image = self._stack_block(image_collection, dates[0], end_date, variable_name)
+        request = {
+            'expression': stacked_image,
+            'fileFormat': 'NUMPY_NDARRAY',
+            'grid': window.grid()
+        }
+        return self.executor.submit(lambda: self.ee.data.computePixels(request),
+                                    label=f"{dataset.name} pixels {dates[0]}..{dates[-1]}")
+    
+    def _parse_download(self, array: np.ndarray, window: PixelWindow,
+                        station_ids: List[Any]) -> Dict[str, Dict[str, float]]:
+        """Sample every station from a downloaded structured array into {date: {station_id: value}}"""
+        result = {}
+        for band_name in array.dtype.names or ():
+            match = self._BAND_DATE_PATTERN.search(band_name)
+            if match is None:
                 continue
+            
+            values = window.sample(array[band_name]).astype(np.float64)
+            valid = values != self.NODATA
+            if not valid.any():
+                continue
+            day = match.group(1)
+            result[f"{day[:4]}-{day[4:6]}-{day[6:]}"] = {
+                station_ids[i]: values[i] for i in np.flatnonzero(valid)
+            }
+        return result
+    
+    def _sample_months(self, dataset: GriddedDatasetConfig, image_collection, month_keys: List[str],
+                       dates_for: Callable[[List[str]], List[str]], stations: pd.DataFrame,
+                       store: ChunkStore, result: ResultMatrixBuilder, sizer: AdaptiveRequestSizer,
+                       progress_range: Tuple[int, int], coverage: Optional[pd.DataFrame] = None) -> None:
+        """
+        Sample and checkpoint months in blocks sized by the dataset's sizer
+        
+        Blocks of consecutive months are submitted a few at a time, each sized
+        when it is submitted, so sizes learned from earlier blocks apply to later
+        ones. A block is one request per station chunk; it is checkpointed once
+        every chunk has been collected. The learned size is persisted at the end.
+        
+        Args:
+            month_keys: Ordered 'YYYY-MM' keys to fetch
+            dates_for: Maps the months of a block to the image dates it covers
+            progress_range: Progress reported before the first and after the last block
+            coverage: Month × station activity; stations without ground
+                observations in a block are left out of its requests
+        """
+        variable_name = dataset.variable_name
+        features = self._build_station_features(stations)
+        chunks_by_size = {}
+        # Keep roughly two requests per executor slot queued
+        max_queued = 2 * self.executor.max_concurrency
+        
+        queue = deque(month_keys)
+        window = deque()
+        done = 0
+        while queue or window:
+            while queue and (not window or sum(len(entry[4]) for entry in window) < max_queued):
+                size = sizer.current()
+                block_months = [queue.popleft()]
+                while (queue and len(block_months) < size.block_months
+                       and self._next_month(f"{block_months[-1]}-01")[:7] == queue[0]):
+                    block_months.append(queue.popleft())
                 
-            # Create list of points to sample
-            points = [ee.Geometry.Point(row['longitude'], row['latitude']) for _, row in stations.iterrows()]
+                dates = dates_for(block_months)
+                block_end = self._next_month(f"{block_months[-1]}-01")
+                if coverage is not None:
+                    chunks = self._station_chunks(self._active_features(features, coverage, block_months),
+                                                  size.station_chunk)
+                else:
+                    if size.station_chunk not in chunks_by_size:
+                        chunks_by_size[size.station_chunk] = self._station_chunks(features, size.station_chunk)
+                    chunks = chunks_by_size[size.station_chunk]
+                futures = [
+                    self._submit_block(image_collection, dates, chunk, variable_name, dataset,
+                                       end_date=block_end, tile_scale=size.tile_scale)
+                    for chunk in chunks
+                ]
+                window.append((block_months, dates, block_end, size, futures, chunks, time.perf_counter()))
             
-            # Sample the image at all station points
-            try:
-                point_values = daily_image.sampleRegions(
-                    collection=ee.FeatureCollection(points),
-                    properties=['system:index'],
-                    scale=1000  # Scale in meters
-                ).getInfo()
+            block_months, dates, block_end, size, futures, chunks, submitted = window.popleft()
+            failures = []
+            block_data = {}
+            for chunk, future in zip(chunks, futures):
+                chunk_data = self._collect_block(
+                    future, image_collection, dates, stations, chunk, variable_name, dataset,
+                    end_date=block_end, failures=failures, size=size, sizer=sizer
+                )
+                for date_str, values in chunk_data.items():
+                    block_data.setdefault(date_str, {}).update(values)
+            if any(future is not None for future in futures) and not failures:
+                sizer.on_success(size, time.perf_counter() - submitted)
+            
+            # Add block data to result matrix and checkpoint its months
+            self._checkpoint_block(store, result, block_data, block_months, failures)
+            
+            done += len(block_months)
+            if self.progress_callback:
+                start, end = progress_range
+                self.progress_callback(dataset.name, int(start + (done / len(month_keys)) * (end - start)))
+            logger.info(f"Processed {done}/{len(month_keys)} months for {dataset.name}")
+        
+        self.request_sizes.put(dataset.name, sizer)
+    
+    def _stack_block(self, image_collection, start_date: str, end_date: str, variable_name: str,
+                     prefix: str = ''):
+        """
+        Stack every image in [start_date, end_date) into one multi-band image
+        
+        Each band is renamed to the image date ("dYYYYMMdd", after ``prefix``)
+        before stacking so the sampled properties can be mapped back to dates
+        client-side. Masked pixels are filled with ``NODATA``.
+        """
+        def rename_by_date(image):
+            band_name = self.ee.String(f'{prefix}d').cat(self.ee.Date(image.get('system:time_start')).format('YYYYMMdd'))
+            return image.select([variable_name]).rename([band_name])
+        
+        return image_collection.filterDate(start_date, end_date).map(rename_by_date).toBands() \
+            .unmask(self.NODATA)
+    
+    def _stack_composites(self, image_collection, period_starts: List[str], period: str,
+                          variable_name: str):
+        """
+        Stack the sum and valid-day count of each period into one multi-band image
+        
+        Bands are named "sum_dYYYYMMdd" and "count_dYYYYMMdd" after the period
+        start. Masked pixels are filled with ``NODATA``.
+        """
+        images = []
+        for period_start in period_starts:
+            period_images = image_collection.filterDate(period_start, self._period_end(period_start, period)) \
+                .select([variable_name])
+            tag = 'd' + period_start.replace('-', '')
+            images.append(period_images.sum().rename([f'sum_{tag}']))
+            images.append(period_images.count().rename([f'count_{tag}']))
+        return self.ee.ImageCollection.fromImages(images).toBands().unmask(self.NODATA)
+    
+    def _submit_block(self, image_collection, dates: List[str], station_collection,
+                      variable_name: str, dataset: GriddedDatasetConfig,
+                      end_date: Optional[str] = None, tile_scale: int = 1,
+                      period: Optional[str] = None,
+                      image_for: Optional[Callable[[str, str], Any]] = None) -> Optional[Future]:
+        """
+        Schedule the sampling request for a block of dates on the request executor
+        
+        Args:
+            tile_scale: sampleRegions tileScale; higher values use less memory per tile
+            period: 'monthly' or 'yearly' to sample period composites; dates are
+                then the period starts
+            image_for: Builds the image of [start_date, end_date) to sample instead
+                of stacking image_collection (e.g. bands of several datasets)
+            
+        Returns:
+            Future resolving to the sampled FeatureCollection, or None for an empty block
+        """
+        if not dates:
+            return None
+            
+        if period is not None:
+            stacked_image = self._stack_composites(image_collection, dates, period, variable_name)
+            block_end = self._period_end(dates[-1], period)
+        else:
+            block_end = end_date or self._next_day(dates[-1])
+            if image_for is not None:
+                stacked_image = image_for(dates[0], block_end)
+            else:
+                stacked_image = self._stack_block(image_collection, dates[0], block_end, variable_name)
+        samples = stacked_image.sampleRegions(
+            collection=station_collection,
+            properties=['station_idx'],
+            tileScale=tile_scale,
+            **self._sampling_args(dataset)
+        )
+        return self.executor.get_info(samples, label=f"{dataset.name} {dates[0]}..{dates[-1]}",
+                                      memoize=not self._is_recent(block_end))
+    
+    def _collect_block(self, future: Optional[Future], image_collection, dates: List[str],
+                       stations: pd.DataFrame, station_collection, variable_name: str,
+                       dataset: GriddedDatasetConfig, end_date: Optional[str] = None,
+                       failures: Optional[List[str]] = None, size: Optional[RequestSize] = None,
+                       sizer: Optional[AdaptiveRequestSizer] = None,
+                       period: Optional[str] = None,
+                       image_for: Optional[Callable[[str, str], Any]] = None,
+                       parse: Optional[Callable[[Dict[str, Any]], Dict[str, Dict[Any, float]]]] = None
+                       ) -> Dict[str, Dict[Any, float]]:
+        """
+        Wait for a block submitted with _submit_block and parse its values
+        
+        With a sizer, a block that ran out of memory is first retried with a
+        higher tileScale. Other failed blocks are split in half; both halves are
+        submitted before either is collected so they run concurrently. Dates
+        that still fail on their own are appended to ``failures`` when given.
+        
+        Args:
+            size: Size the block was submitted with
+            sizer: Adaptive sizer told about blocks that were too large
+            period: Composite period the block was submitted with
+            image_for: Image builder the block was submitted with
+            parse: Converts the sampled response into {date: {key: value}}
+                instead of the default per-station parsing
+        """
+        if future is None:
+            return {}
+            
+        tile_scale = size.tile_scale if size is not None else 1
+        try:
+            point_values = future.result()
+        except Exception as e:
+            if sizer is not None and size is not None and is_size_error(e):
+                retry_scale = sizer.on_size_error(size, e)
+                if retry_scale is not None:
+                    logger.warning(
+                        f"Out of memory sampling {len(dates)} dates from {dates[0]} in {dataset.name}, "
+                        f"retrying with tileScale={retry_scale}"
+                    )
+                    size = replace(size, tile_scale=retry_scale)
+                    retry = self._submit_block(image_collection, dates, station_collection,
+                                               variable_name, dataset, end_date, tile_scale=retry_scale,
+                                               period=period, image_for=image_for)
+                    return self._collect_block(retry, image_collection, dates, stations,
+                                               station_collection, variable_name, dataset,
+                                               end_date, failures, size, sizer, period, image_for, parse)
                 
-                # Extract values for each station
-                station_values = {}
-                for i, feature in enumerate(point_values.get('features', [])):
-                    if variable_name in feature['properties']:
-                        station_id = stations.iloc[i]['id']
-                        value = feature['properties'][variable_name]
-                        station_values[station_id] = value
+            if len(dates) == 1:
+                logger.error(f"Error sampling points for {dates[0]} in {dataset.name}: {str(e)}")
+                if failures is not None:
+                    failures.append(dates[0])
+                return {}
                 
-                result[date_str] = station_values
+            logger.warning(
+                f"Error sampling {len(dates)} dates from {dates[0]} in {dataset.name}, "
+                f"splitting block: {str(e)}"
+            )
+            block_end = end_date or self._next_day(dates[-1])
+            middle = len(dates) // 2
+            halves = [(dates[:middle], dates[middle]), (dates[middle:], block_end)]
+            futures = [
+                self._submit_block(image_collection, half, station_collection,
+                                   variable_name, dataset, half_end, tile_scale=tile_scale,
+                                   period=period, image_for=image_for)
+                for half, half_end in halves
+            ]
+            result = {}
+            for (half, half_end), half_future in zip(halves, futures):
+                result.update(self._collect_block(
+                    half_future, image_collection, half, stations, station_collection,
+                    variable_name, dataset, half_end, failures, size, sizer, period, image_for, parse
+                ))
+            return result
+        
+        if parse is not None:
+            return parse(point_values)
+        if period is not None:
+            return self._parse_composite_response(point_values, stations['id'].tolist(), period)
+        return self._parse_block_response(point_values, stations['id'].tolist())
+    
+    def _parse_block_response(self, point_values: Dict[str, Any],
+                              station_ids: List[Any]) -> Dict[str, Dict[str, float]]:
+        """Convert a sampled stacked image into {date: {station_id: value}}"""
+        result = {}
+        for feature in point_values.get('features', []):
+            properties = feature['properties']
+            station_id = station_ids[int(properties['station_idx'])]
+            
+            for band_name, value in properties.items():
+                match = self._BAND_DATE_PATTERN.search(band_name)
+                if match is None or value is None or value == self.NODATA:
+                    continue
+                    
+                day = match.group(1)
+                date_str = f"{day[:4]}-{day[4:6]}-{day[6:]}"
+                result.setdefault(date_str, {})[station_id] = value
                 
-            except Exception as e:
-                logger.error(f"Error sampling points for {date_str}: {str(e)}")
+        return result
+        
+    def _parse_composite_response(self, point_values: Dict[str, Any], station_ids: List[Any],
+                                  period: str) -> Dict[str, Dict[str, float]]:
+        """
+        Convert sampled period composites into {period_start: {station_id: sum}}
+        
+        Sums whose valid-day count is below ``config.min_valid_day_fraction`` of
+        the period's days are left out.
+        """
+        result = {}
+        for feature in point_values.get('features', []):
+            properties = feature['properties']
+            station_id = station_ids[int(properties['station_idx'])]
+            
+            sums, counts = {}, {}
+            for band_name, value in properties.items():
+                match = self._COMPOSITE_BAND_PATTERN.search(band_name)
+                if match is None or value is None or value == self.NODATA:
+                    continue
+                day = match.group(2)
+                date_str = f"{day[:4]}-{day[4:6]}-{day[6:]}"
+                (sums if match.group(1) == 'sum' else counts)[date_str] = value
                 
+            for date_str, total in sums.items():
+                valid_days = counts.get(date_str, 0)
+                if valid_days and valid_days >= self.config.min_valid_day_fraction * self._period_days(date_str, period):
+                    result.setdefault(date_str, {})[station_id] = total
+                    
         return result
         
+    def _open_chunk_store(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame,
+                          coverage: Optional[pd.DataFrame] = None) -> ChunkStore:
+        """
+        Open the checkpoint store for a dataset, keyed on the request parameters
+        
+        With a ground coverage plan, each month is tagged with its active sample
+        points, so refreshed ground data only invalidates the months it changes.
+        """
+        station_key = json.dumps(stations[['id', 'latitude', 'longitude']].astype(str).values.tolist())
+        signature = {
+            'collection': dataset.collection_name,
+            'variable': dataset.variable_name,
+            'conversion_factor': dataset.conversion_factor,
+            'time_scale': dataset.time_scale,
+            'crs': dataset.native_crs,
+            'scale': dataset.native_scale,
+            'stations': hashlib.sha1(station_key.encode('utf-8')).hexdigest()
+        }
+        period = self._composite_period(dataset)
+        if period is not None:
+            signature['output_resolution'] = period
+            signature['min_valid_day_fraction'] = self.config.min_valid_day_fraction
+        if self.coverage_plan is not None:
+            signature['ground_coverage'] = True
+        chunk_tags = GroundCoveragePlan.month_tags(coverage) if coverage is not None else None
+        return ChunkStore(Path(self.config.data_dir) / self.CHUNK_DIR, dataset.name, signature, chunk_tags)
+    
+    def _restore_chunks(self, store: ChunkStore, result: ResultMatrixBuilder,
+                        month_keys: List[str]) -> List[str]:
+        """
+        Load checkpointed months into the result matrix
+        
+        Returns:
+            Ordered month keys ('YYYY-MM') that still need to be fetched
+        """
+        missing = []
+        for month_key in dict.fromkeys(month_keys):
+            chunk = store.load_chunk(month_key) if store.has(month_key) else None
+            if chunk is None:
+                missing.append(month_key)
+            else:
+                result.add_frame(chunk)
+        
+        restored = len(set(month_keys)) - len(missing)
+        if restored:
+            logger.info(f"Restored {restored} checkpointed months for {store.dataset_name}, "
+                        f"{len(missing)} left to fetch")
+        return missing
+    
+    def _checkpoint_block(self, store: ChunkStore, result: ResultMatrixBuilder,
+                          block_data: Dict[str, Dict[str, float]], month_keys: List[str],
+                          failures: List[str]) -> None:
+        """Add a fetched block to the result matrix and persist each fully fetched month"""
+        result.add_block(block_data)
+        
+        failed_months = {date_str[:7] for date_str in failures}
+        for month_key in month_keys:
+            if month_key in failed_months:
+                logger.warning(f"Not checkpointing {store.dataset_name} {month_key}: some dates failed")
+                continue
+            store.save_chunk(month_key, result.frame_for_rows(result.month_rows(month_key)))
+    
+    def _group_months(self, month_keys: List[str], max_months: int) -> List[List[str]]:
+        """Group ordered 'YYYY-MM' keys into runs of consecutive months of at most max_months"""
+        groups = []
+        for month_key in month_keys:
+            if (groups and len(groups[-1]) < max_months
+                    and self._next_month(f"{groups[-1][-1]}-01")[:7] == month_key):
+                groups[-1].append(month_key)
+            else:
+                groups.append([month_key])
+        return groups
+    
     def _next_day(self, date_str) -> str:
         """Get the next day after the given date string"""
         date = datetime.strptime(date_str, '%Y-%m-%d')
         next_day = date + timedelta(days=1)
         return next_day.strftime('%Y-%m-%d')
+    
+    def _is_recent(self, end_date: str) -> bool:
+        """Whether a request up to end_date (exclusive) reaches into the last memo_recent_days"""
+        cutoff = pd.Timestamp.now().normalize() - pd.Timedelta(days=self.config.memo_recent_days)
+        return pd.Timestamp(end_date) > cutoff
+    
+    def _period_end(self, date_str: str, period: str) -> str:
+        """Exclusive end of the monthly or yearly period starting at date_str"""
+        if period == 'monthly':
+            return self._next_month(date_str)
+        return f"{int(date_str[:4]) + 1}-01-01"
+    
+    @staticmethod
+    def _period_days(date_str: str, period: str) -> int:
+        """Number of days in the monthly or yearly period starting at date_str"""
+        start = pd.Timestamp(date_str)
+        if period == 'monthly':
+            return start.days_in_month
+        return 366 if start.is_leap_year else 365
+    
+    def _next_month(self, date_str) -> str:
+        """Get the first day of the month after the given date string"""
+        date = datetime.strptime(date_str, '%Y-%m-%d')
+        if date.month == 12:
+            return f"{date.year + 1}-01-01"
+        return f"{date.year}-{date.month + 1:02d}-01"
         
     def validate_data(self, data: Dict[str, pd.DataFrame]) -> bool:
         """Validate the fetched data"""
@@ -631,15 +1965,18 @@ class GriddedDataFetcher(DataFetcher):
         if not self.config.is_valid():
             raise ValueError("No gridded datasets enabled")
             
-        # Fetch data
-        data = self.fetch_data()
+        # Fetch data, validating and saving each dataset as soon as it completes
+        def save_completed(name: str, df: pd.DataFrame):
+            if self.validate_data({name: df}):
+                self.save_data({name: df})
+            else:
+                logger.error(f"Not saving {name}: validation failed")
+                
+        data = self.fetch_data(on_dataset_complete=save_completed)
         
         # Validate data
         if not self.validate_data(data):
             raise ValueError("Gridded data validation failed")
-            
-        # Save data
-        self.save_data(data)
         
         return data
         
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class GroundCoveragePlan:
+    """
+    Which stations have ground observations, and in which months.
+
+    Gridded values can only ever be compared where ground observations exist,
+    so the plan is used to leave out stations with too little coverage and to
+    skip the months in which a station has no observations at all. Requests are
+    restricted at month granularity; days without observations inside an active
+    month are still sampled.
+    """
+
+    def __init__(self, monthly_activity: pd.DataFrame, coverage: pd.Series):
+        """
+        Args:
+            monthly_activity: Boolean frame indexed by month key ('YYYY-MM') with
+                station IDs as columns, True where the station has observations
+            coverage: Fraction of days with observations of each planned station
+        """
+        self.monthly_activity = monthly_activity
+        self.coverage = coverage
+
+    @classmethod
+    def from_ground_data(cls, ground: pd.DataFrame, start_year: int, end_year: int,
+                         min_coverage: float = 0.0) -> 'GroundCoveragePlan':
+        """
+        Plan from the daily ground matrix
+
+        Args:
+            ground: Date-indexed frame with station IDs as columns
+            start_year: First year of the gridded fetch
+            end_year: Last year of the gridded fetch
+            min_coverage: Fraction of the fetch period's days a station needs
+                observations on to be kept
+        """
+        days = pd.date_range(f"{start_year}-01-01", f"{end_year}-12-31", freq='D')
+        in_range = (ground.index.year >= start_year) & (ground.index.year <= end_year)
+        valid = ground.loc[in_range].notna()
+
+        coverage = valid.sum() / len(days)
+        keep = coverage.index[(coverage > 0) & (coverage >= min_coverage)]
+        monthly_activity = valid[keep].groupby(valid.index.strftime('%Y-%m')).any()
+
+        dropped = len(ground.columns) - len(keep)
+        if dropped:
+            logger.info(f"Ground coverage plan drops {dropped} of {len(ground.columns)} stations "
+                        f"with less than {min_coverage:.0%} coverage")
+        return cls(monthly_activity, coverage[keep])
+
+    @classmethod
+    def from_file(cls, path: str, start_year: int, end_year: int,
+                  min_coverage: float = 0.0) -> Optional['GroundCoveragePlan']:
+        """Plan from a saved ground matrix, or None if the file does not exist"""
+        path = Path(path)
+        if not path.exists():
+            logger.warning(f"Ground data {path} not found; fetching every station and date")
+            return None
+
+        ground = pd.read_csv(path, index_col=0)
+        ground.index = pd.to_datetime(ground.index)
+        ground.columns = ground.columns.astype(str)
+        return cls.from_ground_data(ground, start_year, end_year, min_coverage)
+
+    @property
+    def station_ids(self) -> List[str]:
+        """IDs of the stations worth sampling"""
+        return list(self.monthly_activity.columns)
+
+    def activity(self, station_ids: List[Any],
+                 pixel_of_station: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Boolean month × sample point activity for a fetch
+
+        Args:
+            station_ids: Stations being fetched
+            pixel_of_station: When stations are sampled by pixel, the pixel of
+                each station; a pixel is active if any of its stations is
+
+        Returns:
+            Frame indexed by month key with one column per sample point (positional)
+        """
+        active = self.station_activity(station_ids)
+        values = active.to_numpy()
+        if pixel_of_station is not None:
+            n_pixels = int(pixel_of_station.max()) + 1 if len(pixel_of_station) else 0
+            pixel_values = np.zeros((len(active), n_pixels), dtype=bool)
+            for station, pixel in enumerate(pixel_of_station):
+                pixel_values[:, pixel] |= values[:, station]
+            values = pixel_values
+        return pd.DataFrame(values, index=active.index)
+
+    def station_activity(self, station_ids: List[Any]) -> pd.DataFrame:
+        """Boolean month × station activity with the station IDs (as strings) as columns"""
+        columns = [str(station_id) for station_id in station_ids]
+        return self.monthly_activity.reindex(columns=columns, fill_value=False).fillna(False).astype(bool)
+
+    @staticmethod
+    def month_tags(activity: pd.DataFrame) -> Dict[str, str]:
+        """
+        Tag of each month's active sample points
+
+        A month's tag only changes when the points active in it do, so results
+        of other months stay valid after the ground data is refreshed.
+        """
+        return {
+            month_key: np.packbits(row).tobytes().hex()
+            for month_key, row in zip(activity.index, activity.to_numpy(dtype=bool))
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        """Planned station count and mean coverage, for logging"""
+        return {
+            'stations': len(self.station_ids),
+            'station_months': int(self.monthly_activity.to_numpy().sum()),
+            'mean_coverage': float(self.coverage.mean()) if len(self.coverage) else 0.0
+        }
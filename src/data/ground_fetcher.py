@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Tuple
 import pandas as pd
-from datetime import datetime
+import hashlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from meteostat import Stations, Daily
 from src.base_fetcher import DataFetcher, MetadataProvider
 from config import GroundDataConfig
@@ -12,6 +18,7 @@ import warnings
 import logging
 from pathlib import Path
 from utils.huc_utils import HUCDataProvider
+from src.data.station_inventory import prune_stations
 
 logger = logging.getLogger(__name__)
 
@@ -24,27 +31,38 @@ class GroundMetadataProvider(MetadataProvider):
     def __init__(self, config: GroundDataConfig):
         self.config = config
 
-    def get_metadata(self) -> pd.DataFrame:
-        """Get weather stations for specified states or all US states"""
-        stations = Stations()
+    def get_inventory(self) -> pd.DataFrame:
+        """
+        All US weather stations, from the local inventory file when it is recent enough
+        
+        The inventory is fetched from Meteostat once and re-fetched after
+        ``config.inventory_max_age_days``, so that daily record ranges stay current.
+        """
+        path = Path(self.config.get_inventory_path())
+        if path.exists():
+            age_days = (time.time() - path.stat().st_mtime) / 86400
+            if age_days <= self.config.inventory_max_age_days:
+                return self.load_metadata(str(path))
+            logger.info(f"Station inventory is {age_days:.0f} days old, refreshing it")
+        
         try:
-            if self.config.huc_id:
-                stations_df = stations.region('US').fetch()
-
-                return stations_df
-
-            elif self.config.states:
-                all_stations = []
-                for state in self.config.states:
-                    state_stations = stations.region('US', state)
-                    all_stations.append(state_stations.fetch())
-                stations_df = pd.concat(all_stations)
-            else:
-                stations_df = stations.region('US').fetch()
-            return stations_df
-            
+            inventory = Stations().region('US').fetch()
         except Exception as e:
+            if path.exists():
+                logger.warning(f"Could not refresh station inventory, using the saved one: {str(e)}")
+                return self.load_metadata(str(path))
             raise RuntimeError(f"Error fetching station metadata: {str(e)}")
+        
+        self.save_metadata(inventory, str(path))
+        return inventory
+
+    def get_metadata(self) -> pd.DataFrame:
+        """Get weather stations for specified states or all US states"""
+        stations_df = self.get_inventory()
+        # HUC selections are filtered spatially by the caller
+        if self.config.states and not self.config.huc_id:
+            stations_df = stations_df[stations_df['region'].isin(self.config.states)]
+        return stations_df
 
     def save_metadata(self, metadata: pd.DataFrame, path: str) -> None:
         """Save metadata to CSV file"""
@@ -67,10 +85,16 @@ class GroundMetadataProvider(MetadataProvider):
 class GroundDataFetcher(DataFetcher):
     """Fetches ground data using Meteostat with progress reporting capability"""
     
+    # Backoff between attempts at one station download, in seconds
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 30.0
+    
     def __init__(self, config: GroundDataConfig):
         self.config = config
         self.metadata_provider = GroundMetadataProvider(config)
         self.progress_callback = None
+        # Watermarks of the last fetch, persisted once its data is saved
+        self._pending_watermarks = None
         
     def set_progress_callback(self, callback: Callable[[str, int], None]) -> None:
         """
@@ -90,86 +114,295 @@ class GroundDataFetcher(DataFetcher):
         """
         self.filter_polygon = polygon_feature
 
+    def selection_key(self) -> str:
+        """Hash identifying the station selection: states, HUC and drawn polygon"""
+        polygon = getattr(self, 'filter_polygon', None)
+        selection = {
+            'states': sorted(self.config.states) if self.config.states else None,
+            'huc_id': self.config.huc_id,
+            'polygon': polygon['geometry'] if polygon else None
+        }
+        return hashlib.sha1(json.dumps(selection, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
     def fetch_data(self) -> pd.DataFrame:
         """Fetch ground precipitation data with progress reporting"""
-        # Get or load metadata
-        try:
-            metadata = self.metadata_provider.load_metadata(self.config.get_metadata_path())
-            logger.info("Using existing metadata file")
+        metadata = self._select_stations()
+        # The gridded fetchers sample the stations of the current selection
+        self.metadata_provider.save_metadata(metadata, self.config.get_metadata_path())
+        
+        if self.progress_callback:
+            self.progress_callback("Ground", 20)
+
+        # The saved metadata keeps every selected station; pruning depends on the years
+        if self.config.prune_by_inventory:
+            metadata = prune_stations(metadata, self.config.start_year, self.config.end_year,
+                                      self.config.min_inventory_coverage)
+            if metadata.empty:
+                raise ValueError(f"No station has daily records in {self.config.start_year}-{self.config.end_year}")
+
+        start = datetime(self.config.start_year, 1, 1)
+        end = datetime(self.config.end_year, 12, 31)
+        # Nothing after today can have been observed yet
+        checked_through = min(end, datetime.combine(datetime.now().date(), datetime.min.time()))
+        
+        existing, watermarks = self._load_existing(metadata.index, start)
+        windows = self._fetch_windows(metadata.index, start, end, watermarks)
+        if existing is not None:
+            logger.info(f"Incremental refresh: fetching {len(windows)} of {len(metadata.index)} stations")
+        
+        result = self._fetch_matrix(metadata, windows)
+        
+        if result.empty and existing is None:
+            raise RuntimeError("No valid data was fetched from any station")
+        
+        # Fresh values replace the overlap of the saved matrix
+        if existing is not None:
+            result = result.combine_first(existing) if not result.empty else existing
+            columns = [station_id for station_id in metadata.index if station_id in result.columns]
+            result = result.loc[(result.index >= start) & (result.index <= end), columns].sort_index()
+        
+        # Stations that returned are checked through the fetched window; failed
+        # downloads keep their old watermark so the next run retries them
+        for station_id in windows:
+            if station_id not in self._failed_stations:
+                watermarks[str(station_id)] = checked_through.strftime('%Y-%m-%d')
+        self._pending_watermarks = {
+            'start': start.strftime('%Y-%m-%d'),
+            'stations': {key: value for key, value in watermarks.items()
+                         if key in {str(station_id) for station_id in metadata.index}}
+        }
+        
+        # Final progress update
+        if self.progress_callback:
+            self.progress_callback("Ground", 100)
             
+        return result
+
+    def _select_stations(self) -> pd.DataFrame:
+        """
+        Metadata of the selected stations
+        
+        Each selection's station IDs are cached under its selection key and
+        joined against the current inventory, so record dates stay as fresh as
+        the inventory. Uncached selections are filtered locally from the
+        national inventory.
+        """
+        selection_path = Path(self.config.get_selection_path(self.selection_key()))
+        if selection_path.exists():
+            logger.info("Using cached station selection")
             if self.progress_callback:
                 self.progress_callback("Ground", 10)
-        except FileNotFoundError:
-            logger.info("Fetching new station metadata...")
-            metadata = self.metadata_provider.get_metadata()
-
-            # Apply HUC filtering if specified
-            if self.config.huc_id:
-                logger.info(f"Filtering stations by HUC: {self.config.huc_id}")
-                huc_provider = HUCDataProvider()
-                metadata = huc_provider.filter_stations_by_huc(metadata, self.config.huc_id)
-                
-                if metadata.empty:
-                    raise ValueError(f"No stations found within HUC {self.config.huc_id}")
-                    
-                logger.info(f"Filtered to {len(metadata)} stations within HUC")
-                
-            # Apply polygon filtering if specified
-            if hasattr(self, 'filter_polygon') and self.filter_polygon:
-                logger.info("Filtering stations by custom polygon")
-                from utils.drawing_utils import filter_stations_by_polygon
-                metadata = filter_stations_by_polygon(metadata, self.filter_polygon)
-                
-                if metadata.empty:
-                    raise ValueError("No stations found within the specified polygon")
-                    
-                logger.info(f"Filtered to {len(metadata)} stations within polygon")
+            station_ids = set(pd.read_csv(selection_path, dtype=str)['id'])
+            inventory = self.metadata_provider.get_inventory()
+            return inventory[inventory.index.astype(str).isin(station_ids)]
+        
+        logger.info("Selecting stations from the station inventory...")
+        metadata = self.metadata_provider.get_metadata()
+
+        # Apply HUC filtering if specified
+        if self.config.huc_id:
+            logger.info(f"Filtering stations by HUC: {self.config.huc_id}")
+            huc_provider = HUCDataProvider()
+            metadata = huc_provider.filter_stations_by_huc(metadata, self.config.huc_id)
+            
+            if metadata.empty:
+                raise ValueError(f"No stations found within HUC {self.config.huc_id}")
                 
-            self.metadata_provider.save_metadata(metadata, self.config.get_metadata_path())
+            logger.info(f"Filtered to {len(metadata)} stations within HUC")
             
-            if self.progress_callback:
-                self.progress_callback("Ground", 20)
+        # Apply polygon filtering if specified
+        if hasattr(self, 'filter_polygon') and self.filter_polygon:
+            logger.info("Filtering stations by custom polygon")
+            from utils.drawing_utils import filter_stations_by_polygon
+            metadata = filter_stations_by_polygon(metadata, self.filter_polygon)
+            
+            if metadata.empty:
+                raise ValueError("No stations found within the specified polygon")
+                
+            logger.info(f"Filtered to {len(metadata)} stations within polygon")
+        
+        selection_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame({'id': metadata.index.astype(str)}).to_csv(selection_path, index=False)
+        return metadata
 
-        start = datetime(self.config.start_year, 1, 1)
-        end = datetime(self.config.end_year, 12, 31)
+    def _load_existing(self, station_ids: pd.Index, start: datetime) -> Tuple[Optional[pd.DataFrame], Dict[str, str]]:
+        """
+        Saved ground matrix and per-station watermarks for an incremental refresh
         
-        precipitation_data = {}
+        A station's watermark is the last date it has been fetched through. Stations
+        without a recorded watermark fall back to their last valid observation in
+        the saved matrix.
         
-        # Calculate total stations for progress tracking
-        total_stations = len(metadata.index)
-        current_station = 0
+        Returns:
+            Tuple of (saved matrix with columns matching station_ids, watermarks by
+            station ID string); (None, {}) when everything has to be fetched
+        """
+        data_path = Path(self.config.get_data_path())
+        if not self.config.incremental_refresh or not data_path.exists():
+            return None, {}
         
-        # Use tqdm for progress bar (will be visible in CLI, disabled in GUI when callback is set)
-        for idx, station_id in enumerate(tqdm(metadata.index, desc="Processing stations", 
-                                             disable=self.progress_callback is not None)):
+        recorded = {}
+        watermark_path = Path(self.config.get_watermark_path())
+        if watermark_path.exists():
             try:
-                data = Daily(station_id, start, end)
-                df = data.fetch()
-                if not df.empty and 'prcp' in df.columns:
-                    precipitation_data[station_id] = df['prcp']
-            except Exception as e:
-                logger.error(f"Error with station {station_id}: {e}")
+                with open(watermark_path, 'r') as f:
+                    recorded = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.warning(f"Invalid ground watermarks {watermark_path}, ignoring them: {str(e)}")
+                recorded = {}
+        
+        # Matrices saved for a later start year do not hold the earlier years
+        if recorded.get('start') is not None and pd.Timestamp(recorded['start']) > start:
+            logger.info("Saved ground data starts after the requested period, fetching everything")
+            return None, {}
+        
+        existing = pd.read_csv(data_path, index_col=0)
+        existing.index = pd.to_datetime(existing.index)
+        if recorded.get('start') is None and (existing.empty or existing.index.min() > start):
+            logger.info("Saved ground data starts after the requested period, fetching everything")
+            return None, {}
+        
+        # Saved columns are strings; use the metadata's station IDs
+        by_key = {str(station_id): station_id for station_id in station_ids}
+        existing = existing[[column for column in existing.columns if column in by_key]]
+        existing.columns = [by_key[column] for column in existing.columns]
+        
+        watermarks = dict(recorded.get('stations') or {})
+        for station_id in existing.columns:
+            key = str(station_id)
+            if key not in watermarks:
+                last_valid = existing[station_id].last_valid_index()
+                if last_valid is not None:
+                    watermarks[key] = last_valid.strftime('%Y-%m-%d')
+        return existing, watermarks
+    
+    def _fetch_windows(self, station_ids: pd.Index, start: datetime, end: datetime,
+                       watermarks: Dict[str, str]) -> Dict[Any, Tuple[datetime, datetime]]:
+        """
+        Date range to download for each station
+        
+        New stations get the whole period. Stations with a watermark get the days
+        after it, starting ``refresh_overlap_days`` earlier, and are left out once
+        the watermark reaches the end of the period.
+        """
+        windows = {}
+        overlap = timedelta(days=self.config.refresh_overlap_days)
+        for station_id in station_ids:
+            watermark = watermarks.get(str(station_id))
+            if watermark is None:
+                windows[station_id] = (start, end)
                 continue
-                
-            # Update progress
-            current_station += 1
-            if self.progress_callback:
-                progress = 20 + (current_station / total_stations * 70)
-                self.progress_callback("Ground", int(progress))
+            watermark = datetime.strptime(watermark, '%Y-%m-%d')
+            if watermark >= end:
+                continue
+            windows[station_id] = (max(start, watermark + timedelta(days=1) - overlap), end)
+        return windows
+    
+    def _save_watermarks(self) -> None:
+        """Persist the watermarks of the last fetch"""
+        if self._pending_watermarks is None:
+            return
+        path = Path(self.config.get_watermark_path())
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._pending_watermarks, f, indent=2)
+        os.replace(tmp_path, path)
+        self._pending_watermarks = None
+    
+    def _fetch_matrix(self, metadata: pd.DataFrame,
+                      windows: Dict[Any, Tuple[datetime, datetime]]) -> pd.DataFrame:
+        """
+        Date × station precipitation matrix of the stations that returned data
+        
+        Args:
+            metadata: Selected stations, indexed by station ID
+            windows: (start, end) to fetch for each station ID
+        """
+        precipitation_data = self._download_stations(windows)
         
-        if not precipitation_data:
-            raise RuntimeError("No valid data was fetched from any station")
-            
         # Create DataFrame and ensure proper datetime index
         result = pd.DataFrame(precipitation_data)
         result.index = pd.to_datetime(result.index)
+        return result
+    
+    def _download_stations(self, windows: Dict[Any, Tuple[datetime, datetime]],
+                           progress_range: tuple = (20, 90)) -> Dict[Any, pd.Series]:
+        """
+        Download daily precipitation of many stations on a bounded worker pool
         
-        # Final progress update
-        if self.progress_callback:
-            self.progress_callback("Ground", 100)
+        At most ``config.max_concurrent_downloads`` stations are downloaded at
+        once. Progress is reported only when the whole percentage changes.
+        Stations whose download failed are recorded in ``_failed_stations``.
+        
+        Args:
+            windows: (start, end) to download for each station ID
             
-        return result
-
+        Returns:
+            Precipitation series by station ID, in the order of windows, for the
+            stations that returned data
+        """
+        series = {}
+        self._failed_stations = set()
+        station_ids = list(windows)
+        total_stations = len(station_ids)
+        if not total_stations:
+            return series
+        
+        last_progress = None
+        max_workers = max(1, min(self.config.max_concurrent_downloads, total_stations))
+        # Use tqdm for progress bar (will be visible in CLI, disabled in GUI when callback is set)
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="meteostat") as pool, \
+                tqdm(total=total_stations, desc="Processing stations",
+                     disable=self.progress_callback is not None) as progress_bar:
+            futures = {
+                pool.submit(self._download_station, station_id, *windows[station_id]): station_id
+                for station_id in station_ids
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                station_id = futures[future]
+                try:
+                    prcp = future.result()
+                    if prcp is not None:
+                        series[station_id] = prcp
+                except Exception as e:
+                    logger.error(f"Error with station {station_id}: {e}")
+                    self._failed_stations.add(station_id)
+                
+                progress_bar.update(1)
+                progress = int(progress_range[0] + done / total_stations * (progress_range[1] - progress_range[0]))
+                if self.progress_callback and progress != last_progress:
+                    self.progress_callback("Ground", progress)
+                    last_progress = progress
+        
+        # Completion order depends on the pool, keep the metadata order
+        return {station_id: series[station_id] for station_id in station_ids if station_id in series}
+    
+    def _download_station(self, station_id: Any, start: datetime, end: datetime) -> Optional[pd.Series]:
+        """
+        Daily precipitation of one station, retried with jittered exponential backoff
+        
+        Returns:
+            Precipitation series, or None if the station has no precipitation data
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                df = Daily(station_id, start, end).fetch()
+                break
+            except Exception as e:
+                if attempt > self.config.download_retries:
+                    raise
+                cap = min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+                delay = random.uniform(cap / 2, cap)
+                logger.warning(f"Retrying station {station_id} in {delay:.1f}s "
+                               f"(attempt {attempt}/{self.config.download_retries}): {str(e)}")
+                time.sleep(delay)
+        
+        if df.empty or 'prcp' not in df.columns:
+            return None
+        return df['prcp']
+    
     def validate_data(self, data: pd.DataFrame) -> bool:
         """Validate the fetched data"""
         if data.empty:
@@ -185,6 +418,10 @@ class GroundDataFetcher(DataFetcher):
         # Save with datetime index properly formatted
         data.to_csv(path)
         logger.info(f"Saved ground data to {path}")
+        
+        # Watermarks only describe the data once it is on disk
+        if Path(path) == Path(self.config.get_data_path()):
+            self._save_watermarks()
 
     def process(self) -> pd.DataFrame:
         """Main processing method with progress reporting"""
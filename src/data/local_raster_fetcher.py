@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import glob
+import importlib.util
+import logging
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.base_fetcher import DataFetcher
+from src.data.gridded_fetcher import GriddedDataFetcher
+from src.data.station_inventory import prune_stations
+from config import GriddedDataConfig, GriddedDatasetConfig
+
+# Conditional imports for the local raster readers
+try:
+    import xarray as xr
+    XARRAY_AVAILABLE = True
+except ImportError:
+    XARRAY_AVAILABLE = False
+
+# dask is only needed by xarray for lazy, chunked reads
+DASK_AVAILABLE = importlib.util.find_spec('dask') is not None
+
+try:
+    import rasterio
+    from rasterio.windows import Window
+    RASTERIO_AVAILABLE = True
+except ImportError:
+    RASTERIO_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+class LocalRasterFetcher(DataFetcher):
+    """
+    Extracts station time series from local mirrors of gridded datasets.
+
+    Reads NetCDF files and Zarr stores through xarray and per-date GeoTIFFs
+    through rasterio. Station pixel indices are computed once per dataset and
+    every time step is read for all stations at once with vectorised indexing.
+    The values are converted exactly as in GriddedDataFetcher, so the saved
+    ``<name>_precipitation.csv`` files are interchangeable with Earth Engine ones.
+    Archives must hold the same variable, in the same units, as the EE collection.
+    """
+
+    # Coordinate names tried, in order, for each dimension
+    TIME_NAMES = ('time', 'valid_time', 't')
+    LAT_NAMES = ('lat', 'latitude', 'y')
+    LON_NAMES = ('lon', 'longitude', 'x')
+    # Upper bound on the bytes read from disk per step
+    MAX_READ_BYTES = 256 * 1024 ** 2
+    # Dates in GeoTIFF file names, e.g. "chirps-v2.0.1981.01.01.tif" or "PRISM_ppt_19810101.tif"
+    _FILENAME_DATE_PATTERN = re.compile(r'(?<!\d)(\d{4})[._-]?(\d{2})(?:[._-]?(\d{2}))?(?!\d)')
+    _GEOTIFF_SUFFIXES = {'.tif', '.tiff'}
+
+    def __init__(self, config: GriddedDataConfig):
+        self.config = config
+        self.progress_callback = None
+
+    def set_progress_callback(self, callback: Callable[[str, int], None]):
+        """
+        Set a callback function for progress reporting
+
+        Args:
+            callback: Function that takes dataset_name and progress percentage
+        """
+        self.progress_callback = callback
+
+    def fetch_data(self) -> Dict[str, pd.DataFrame]:
+        """Read every enabled dataset that has a local_path"""
+        results = {}
+        datasets = self.config.get_local_datasets()
+        if not datasets:
+            return results
+
+        try:
+            stations = self._load_stations()
+        except FileNotFoundError as e:
+            logger.error(str(e))
+            return results
+
+        for dataset in datasets:
+            try:
+                logger.info(f"Reading {dataset.name} data from {dataset.local_path}...")
+
+                if self.progress_callback:
+                    self.progress_callback(dataset.name, 0)
+
+                if self._should_skip_dataset(dataset):
+                    logger.warning(f"Skipping {dataset.name} - outside valid date range")
+                    continue
+
+                results[dataset.name] = self._fetch_dataset(dataset, stations)
+
+                if self.progress_callback:
+                    self.progress_callback(dataset.name, 100)
+
+            except Exception as e:
+                logger.error(f"Error reading {dataset.name} data: {e}", exc_info=True)
+                if self.progress_callback:
+                    self.progress_callback(dataset.name, 0)
+                continue
+
+        return results
+
+    def _should_skip_dataset(self, dataset: GriddedDatasetConfig) -> bool:
+        """Check if dataset should be skipped based on date range constraints"""
+        if dataset.date_range is None:
+            return False
+
+        start_year, end_year = dataset.date_range
+        if end_year is None:  # Open-ended range
+            return self.config.end_year < start_year
+        else:
+            return (self.config.start_year > end_year or
+                    self.config.end_year < start_year)
+
+    def _load_stations(self) -> pd.DataFrame:
+        """Load station IDs and coordinates for sampling"""
+        metadata_file = Path(self.config.data_dir) / "stations_metadata.csv"
+        if not metadata_file.exists():
+            raise FileNotFoundError(f"Station metadata file not found: {metadata_file}")
+
+        metadata = pd.read_csv(metadata_file)
+        if self.config.prune_by_inventory:
+            metadata = prune_stations(metadata, self.config.start_year, self.config.end_year,
+                                      self.config.min_inventory_coverage)
+        return metadata[['id', 'latitude', 'longitude']].dropna()
+
+    def _fetch_dataset(self, dataset: GriddedDatasetConfig, stations: pd.DataFrame) -> pd.DataFrame:
+        """Read raw station series from the local archive and convert them to the result matrix"""
+        files = self._resolve_files(dataset.local_path)
+        if not files:
+            raise FileNotFoundError(f"No local files found for {dataset.name} at {dataset.local_path}")
+
+        start = pd.Timestamp(f"{self.config.start_year}-01-01")
+        end = pd.Timestamp(f"{self.config.end_year}-12-31 23:59:59")
+
+        if all(path.suffix.lower() in self._GEOTIFF_SUFFIXES for path in files):
+            times, values = self._read_geotiff_series(dataset, files, stations, start, end)
+        else:
+            times, values = self._read_xarray_series(dataset, files, stations, start, end)
+
+        logger.info(f"Read {len(times)} time steps of {dataset.name} for {len(stations)} stations")
+        return self._to_result(dataset, times, values, stations['id'].tolist())
+
+    def _resolve_files(self, local_path: str) -> List[Path]:
+        """Expand a file, directory or glob into the sorted list of archive files"""
+        path = Path(local_path).expanduser()
+        if path.suffix == '.zarr' or (path.is_dir() and (path / '.zmetadata').exists()):
+            return [path]
+        if path.is_dir():
+            return sorted(p for p in path.iterdir()
+                          if p.suffix.lower() in {'.nc', '.nc4', '.tif', '.tiff'})
+        if path.exists():
+            return [path]
+        return sorted(Path(p) for p in glob.glob(str(path)))
+
+    def _to_result(self, dataset: GriddedDatasetConfig, times: pd.DatetimeIndex,
+                   values: np.ndarray, station_ids: List[Any]) -> pd.DataFrame:
+        """
+        Convert raw (time, station) values into the saved result layout
+
+        Monthly datasets keep one row per month scaled to monthly totals; every
+        other dataset becomes a daily matrix over the configured years, with
+        sub-daily steps summed per day using the same factors as Earth Engine.
+        """
+        frame = pd.DataFrame(values, index=times, columns=station_ids)
+
+        if dataset.time_scale == 'monthly':
+            full_range = pd.date_range(start=f"{self.config.start_year}-01-01",
+                                       end=f"{self.config.end_year}-12-01", freq='MS')
+            frame.index = frame.index.to_period('M').to_timestamp()
+            frame = frame[~frame.index.duplicated()].reindex(full_range)
+            frame = frame.mul(dataset.conversion_factor * full_range.days_in_month.to_numpy(), axis=0)
+            return frame.astype(np.float32)
+
+        full_range = pd.date_range(start=f"{self.config.start_year}-01-01",
+                                   end=f"{self.config.end_year}-12-31", freq='D')
+        if len(times) > 1 and (times[1:] - times[:-1]).min() < pd.Timedelta(days=1):
+            # Sub-daily steps: scale each step, then sum per day
+            factor = GriddedDataFetcher._daily_aggregation_factor(dataset)
+            frame = (frame * factor).groupby(frame.index.floor('D')).sum(min_count=1)
+        else:
+            frame.index = frame.index.floor('D')
+            frame = frame[~frame.index.duplicated()] * dataset.conversion_factor
+
+        return frame.reindex(full_range).astype(np.float32)
+
+    @staticmethod
+    def _nearest_indices(coord: np.ndarray, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Index of the nearest coordinate for each point along one regular axis
+
+        Returns:
+            Tuple of (indices, inside) where ``inside`` masks points within half
+            a pixel of the axis extent
+        """
+        ascending = coord[-1] >= coord[0]
+        axis = coord if ascending else coord[::-1]
+        idx = np.clip(np.searchsorted(axis, points), 1, len(axis) - 1)
+        idx -= (points - axis[idx - 1]) < (axis[idx] - points)
+
+        half_pixel = abs(axis[1] - axis[0]) / 2 if len(axis) > 1 else 0
+        inside = (points >= axis[0] - half_pixel) & (points <= axis[-1] + half_pixel)
+        if not ascending:
+            idx = len(axis) - 1 - idx
+        return idx, inside
+
+    def _find_dim(self, data_array, names: Tuple[str, ...]) -> str:
+        for name in names:
+            if name in data_array.dims:
+                return name
+        raise ValueError(f"None of the dimensions {names} found in {data_array.dims}")
+
+    def _open_xarray(self, files: List[Path]):
+        """Open NetCDF files or a Zarr store lazily"""
+        if not XARRAY_AVAILABLE:
+            raise ImportError("xarray not available. Install with: pip install xarray netCDF4 zarr")
+
+        chunks = {} if DASK_AVAILABLE else None
+        if len(files) == 1 and (files[0].suffix == '.zarr' or (files[0] / '.zmetadata').exists()):
+            return xr.open_zarr(str(files[0]))
+        if len(files) == 1:
+            return xr.open_dataset(str(files[0]), chunks=chunks)
+        if not DASK_AVAILABLE:
+            raise ImportError("Reading multi-file archives needs dask. Install with: pip install dask")
+        return xr.open_mfdataset([str(path) for path in files], combine='by_coords', chunks=chunks)
+
+    def _read_xarray_series(self, dataset: GriddedDatasetConfig, files: List[Path], stations: pd.DataFrame,
+                            start: pd.Timestamp, end: pd.Timestamp) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """Read the (time, station) values of a NetCDF or Zarr archive"""
+        ds = self._open_xarray(files)
+        if dataset.variable_name in ds.data_vars:
+            data_array = ds[dataset.variable_name]
+        elif len(ds.data_vars) == 1:
+            data_array = ds[next(iter(ds.data_vars))]
+            logger.info(f"Variable {dataset.variable_name} not in {dataset.local_path}, "
+                        f"using its only variable {data_array.name}")
+        else:
+            raise ValueError(f"Variable {dataset.variable_name} not found in {dataset.local_path}")
+
+        time_dim = self._find_dim(data_array, self.TIME_NAMES)
+        lat_dim = self._find_dim(data_array, self.LAT_NAMES)
+        lon_dim = self._find_dim(data_array, self.LON_NAMES)
+        data_array = data_array.sortby(time_dim).sel({time_dim: slice(start, end)})
+
+        # Station pixel indices, computed once for the whole record
+        lon_coord = data_array[lon_dim].values
+        station_lon = stations['longitude'].to_numpy(dtype=np.float64)
+        if lon_coord.max() > 180:
+            station_lon = station_lon % 360
+        cols, inside_lon = self._nearest_indices(lon_coord, station_lon)
+        rows, inside_lat = self._nearest_indices(data_array[lat_dim].values,
+                                                 stations['latitude'].to_numpy(dtype=np.float64))
+        inside = inside_lon & inside_lat
+
+        times = pd.DatetimeIndex(data_array[time_dim].values)
+        values = np.full((len(times), len(stations)), np.nan, dtype=np.float32)
+        if not inside.any() or len(times) == 0:
+            logger.warning(f"No stations inside the {dataset.name} grid for the requested years")
+            return times, values
+
+        # Pointwise selection over the stations inside the grid
+        points = data_array.isel({
+            lat_dim: xr.DataArray(rows[inside], dims='station'),
+            lon_dim: xr.DataArray(cols[inside], dims='station')
+        }).transpose(time_dim, 'station')
+
+        # Read in time blocks bounded by the bytes of the pixels touched per step
+        step_bytes = len(np.unique(rows[inside])) * len(np.unique(cols[inside])) * data_array.dtype.itemsize
+        block_steps = max(1, self.MAX_READ_BYTES // max(1, step_bytes))
+        for block_start in range(0, len(times), block_steps):
+            block_end = min(block_start + block_steps, len(times))
+            values[block_start:block_end, inside] = points.isel({time_dim: slice(block_start, block_end)}).values
+
+            if self.progress_callback:
+                self.progress_callback(dataset.name, int(5 + 85 * block_end / len(times)))
+
+        return times, values
+
+    def _file_date(self, path: Path) -> Optional[datetime]:
+        """Date encoded in a GeoTIFF file name"""
+        match = self._FILENAME_DATE_PATTERN.search(path.stem)
+        if match is None:
+            return None
+        year, month, day = match.group(1), match.group(2), match.group(3) or '01'
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            return None
+
+    def _read_geotiff_series(self, dataset: GriddedDatasetConfig, files: List[Path], stations: pd.DataFrame,
+                             start: pd.Timestamp, end: pd.Timestamp) -> Tuple[pd.DatetimeIndex, np.ndarray]:
+        """Read the (time, station) values of a directory of per-date GeoTIFFs"""
+        if not RASTERIO_AVAILABLE:
+            raise ImportError("rasterio not available. Install with: pip install rasterio")
+
+        dated = sorted((date, path) for date, path in ((self._file_date(path), path) for path in files)
+                       if date is not None and start <= date <= end)
+        if len(dated) < len(files):
+            logger.info(f"Using {len(dated)} of {len(files)} {dataset.name} files within the requested years")
+
+        times = pd.DatetimeIndex([date for date, _ in dated])
+        values = np.full((len(dated), len(stations)), np.nan, dtype=np.float32)
+        lon = stations['longitude'].to_numpy(dtype=np.float64)
+        lat = stations['latitude'].to_numpy(dtype=np.float64)
+
+        grid = None
+        for i, (_, path) in enumerate(dated):
+            with rasterio.open(path) as src:
+                if (src.transform, src.height, src.width) != grid:
+                    # Station pixels and their bounding window, recomputed only when the grid changes
+                    grid = (src.transform, src.height, src.width)
+                    rows, cols = rasterio.transform.rowcol(src.transform, lon, lat)
+                    rows, cols = np.asarray(rows), np.asarray(cols)
+                    inside = (rows >= 0) & (rows < src.height) & (cols >= 0) & (cols < src.width)
+                    window = None
+                    if inside.any():
+                        row0, col0 = rows[inside].min(), cols[inside].min()
+                        window = Window(col0, row0, cols[inside].max() - col0 + 1, rows[inside].max() - row0 + 1)
+
+                # No station falls on this grid
+                if window is None:
+                    continue
+
+                block = src.read(1, window=window, masked=True).astype(np.float32).filled(np.nan)
+                values[i, inside] = block[rows[inside] - row0, cols[inside] - col0]
+
+            if self.progress_callback and (i + 1) % 100 == 0:
+                self.progress_callback(dataset.name, int(5 + 85 * (i + 1) / len(dated)))
+
+        return times, values
+
+    def validate_data(self, data: Dict[str, pd.DataFrame]) -> bool:
+        """Validate the read data"""
+        if not data:
+            return False
+
+        for name, df in data.items():
+            if df.empty:
+                logger.error(f"Empty dataset: {name}")
+                return False
+            if not isinstance(df.index, pd.DatetimeIndex):
+                logger.error(f"Invalid index type for dataset: {name}")
+                return False
+
+        return True
+
+    def save_data(self, data: Dict[str, pd.DataFrame], path: Optional[str] = None) -> None:
+        """Save the data to the same CSV files as GriddedDataFetcher"""
+        for name, df in data.items():
+            dataset_config = next((ds for ds in self.config.datasets.values() if ds.name == name), None)
+            if not dataset_config:
+                logger.warning(f"No configuration found for dataset {name}")
+                continue
+
+            file_path = Path(self.config.data_dir) / dataset_config.get_filename()
+            df.to_csv(file_path)
+            logger.info(f"Saved {name} data to {file_path}")
+
+    def process(self) -> Dict[str, pd.DataFrame]:
+        """Main processing method with progress reporting"""
+        logger.info("Reading local gridded data...")
+
+        if not self.config.get_local_datasets():
+            raise ValueError("No enabled gridded datasets have a local_path")
+
+        data = self.fetch_data()
+
+        if not self.validate_data(data):
+            raise ValueError("Local gridded data validation failed")
+
+        self.save_data(data)
+
+        return data
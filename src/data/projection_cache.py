@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+class DatasetProjectionCache:
+    """
+    Persistent cache of each collection's native projection and nominal scale.
+
+    Discovering a projection costs one Earth Engine call; the result is stored in
+    a small JSON file so it is only ever looked up once per collection and band.
+    """
+
+    FILENAME = "dataset_projections.json"
+
+    def __init__(self, data_dir: str):
+        self.path = Path(data_dir) / self.FILENAME
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Invalid projection cache {self.path}, ignoring it: {str(e)}")
+            return {}
+
+    @staticmethod
+    def _key(collection_name: str, variable_name: str) -> str:
+        return f"{collection_name}:{variable_name}"
+
+    def get(self, collection_name: str, variable_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached projection of a collection band
+
+        Returns:
+            Dict with 'crs' (or 'wkt'), 'transform' and 'scale' in meters, or None
+        """
+        with self._lock:
+            return self._entries.get(self._key(collection_name, variable_name))
+
+    def put(self, collection_name: str, variable_name: str, info: Dict[str, Any]) -> None:
+        """Store the projection of a collection band"""
+        with self._lock:
+            self._entries[self._key(collection_name, variable_name)] = info
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Error fragments raised when a single request asks Earth Engine for too much.
+# These are never retried as-is: the request is made cheaper or smaller instead.
+MEMORY_ERROR_PATTERNS = (
+    'memory limit',
+    'out of memory',
+    'too many pixels',
+)
+SIZE_ERROR_PATTERNS = MEMORY_ERROR_PATTERNS + (
+    'computation timed out',
+    'timed out',
+    'deadline exceeded',
+    'response size',
+    'payload size',
+    'too large',
+)
+
+def is_memory_error(error: Exception) -> bool:
+    """Check whether an Earth Engine error reports exhausted memory"""
+    message = str(error).lower()
+    return any(pattern in message for pattern in MEMORY_ERROR_PATTERNS)
+
+def is_size_error(error: Exception) -> bool:
+    """Check whether an Earth Engine error means the request was too large (memory, time or payload)"""
+    message = str(error).lower()
+    return any(pattern in message for pattern in SIZE_ERROR_PATTERNS)
+
+@dataclass(frozen=True)
+class RequestSize:
+    """Shape of one sampling request"""
+    block_months: int
+    station_chunk: int
+    tile_scale: int = 1
+
+class AdaptiveRequestSizer:
+    """
+    Chooses the size of sampling requests for one dataset.
+
+    Requests start from the learned (or default) size. A run of fast successes
+    at the current size grows it: the station chunk first, back up to every
+    station, then the number of months per block. Memory errors first raise
+    ``tileScale``; when that is exhausted, or on time and payload errors, the
+    block and station chunk are halved for later requests, and growth stops
+    short of the size that failed.
+    """
+
+    MAX_TILE_SCALE = 16
+
+    def __init__(self, initial: RequestSize, max_block_months: int, max_station_chunk: int,
+                 fast_seconds: float = 60.0, grow_after: int = 3):
+        """
+        Args:
+            initial: Starting request size, clamped to the maximums
+            max_block_months: Upper bound on months per block
+            max_station_chunk: Number of stations, the upper bound on the chunk size
+            fast_seconds: Requests completing within this many seconds count towards growth
+            grow_after: Consecutive fast successes needed before growing
+        """
+        self.max_block_months = max(1, max_block_months)
+        self.max_station_chunk = max(1, max_station_chunk)
+        self.fast_seconds = fast_seconds
+        self.grow_after = grow_after
+        self._lock = threading.Lock()
+        self._streak = 0
+        # Growth limits, lowered below sizes that turned out too large
+        self._month_limit = self.max_block_months
+        self._chunk_limit = self.max_station_chunk
+        self._size = RequestSize(
+            block_months=min(max(1, initial.block_months), self.max_block_months),
+            station_chunk=min(max(1, initial.station_chunk), self.max_station_chunk),
+            tile_scale=min(max(1, initial.tile_scale), self.MAX_TILE_SCALE)
+        )
+
+    def current(self) -> RequestSize:
+        """Size for the next request"""
+        with self._lock:
+            return self._size
+
+    def on_success(self, size: RequestSize, seconds: float) -> None:
+        """
+        Record a successful request
+
+        Only requests issued at the current size count; results of requests
+        sized before a shrink say nothing about the current size.
+        """
+        with self._lock:
+            current = self._size
+            if (size.block_months != current.block_months
+                    or size.station_chunk != current.station_chunk):
+                return
+            if seconds > self.fast_seconds:
+                self._streak = 0
+                return
+
+            self._streak += 1
+            if self._streak < self.grow_after:
+                return
+            self._streak = 0
+
+            if current.station_chunk < self._chunk_limit:
+                self._size = replace(current, station_chunk=min(current.station_chunk * 2,
+                                                                self._chunk_limit))
+            elif current.block_months < self._month_limit:
+                self._size = replace(current, block_months=min(current.block_months * 2,
+                                                               self._month_limit))
+            else:
+                return
+            logger.debug(f"Growing request size to {self._size}")
+
+    def on_size_error(self, size: RequestSize, error: Exception) -> Optional[int]:
+        """
+        Record a request that failed for being too large
+
+        Returns:
+            tileScale to retry the same request with, or None if the request
+            should be split instead
+        """
+        with self._lock:
+            self._streak = 0
+            current = self._size
+
+            if is_memory_error(error) and size.tile_scale < self.MAX_TILE_SCALE:
+                tile_scale = min(size.tile_scale * 2, self.MAX_TILE_SCALE)
+                if tile_scale > current.tile_scale:
+                    self._size = replace(current, tile_scale=tile_scale)
+                    logger.info(f"Raising tileScale to {tile_scale}")
+                return tile_scale
+
+            # Halve the months of the failed request, then its station chunk. Halving
+            # relative to the failed size means concurrent failures only shrink once
+            if size.block_months > 1:
+                self._month_limit = min(self._month_limit, size.block_months - 1)
+                block_months = min(current.block_months, max(1, size.block_months // 2))
+                self._size = replace(current, block_months=block_months)
+            elif size.station_chunk > 1:
+                self._chunk_limit = min(self._chunk_limit, size.station_chunk - 1)
+                station_chunk = min(current.station_chunk, max(1, size.station_chunk // 2))
+                self._size = replace(current, station_chunk=station_chunk)
+            if self._size != current:
+                logger.info(f"Shrinking request size to {self._size}")
+            return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Learned size; a chunk covering every station is stored as None"""
+        size = self.current()
+        return {
+            'block_months': size.block_months,
+            'station_chunk': size.station_chunk if size.station_chunk < self.max_station_chunk else None,
+            'tile_scale': size.tile_scale
+        }
+
+class RequestSizeStore:
+    """
+    Persistent record of the request sizes learned for each dataset.
+
+    Lets the next run start from a size known to work instead of rediscovering
+    memory and time limits through failed requests.
+    """
+
+    FILENAME = "request_sizes.json"
+
+    def __init__(self, data_dir: str):
+        self.path = Path(data_dir) / self.FILENAME
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Invalid request size store {self.path}, ignoring it: {str(e)}")
+            return {}
+
+    def sizer_for(self, dataset_name: str, default_block_months: int, max_block_months: int,
+                  n_stations: int) -> AdaptiveRequestSizer:
+        """Sizer for a dataset, starting from its learned size when there is one"""
+        with self._lock:
+            entry = self._entries.get(dataset_name) or {}
+        initial = RequestSize(
+            block_months=entry.get('block_months') or default_block_months,
+            station_chunk=entry.get('station_chunk') or n_stations,
+            tile_scale=entry.get('tile_scale') or 1
+        )
+        return AdaptiveRequestSizer(initial, max_block_months=max_block_months,
+                                    max_station_chunk=n_stations)
+
+    def put(self, dataset_name: str, sizer: AdaptiveRequestSizer) -> None:
+        """Record the size a dataset's sizer ended on"""
+        with self._lock:
+            self._entries[dataset_name] = sizer.to_dict()
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self._entries, f, indent=2)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import Dict, List, Any, Union, Iterable, Optional
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+class ResultMatrixBuilder:
+    """
+    Assembles a date × station value matrix for gridded fetches.
+
+    Values are written into a NaN-initialised float32 NumPy buffer using
+    precomputed date→row and station→column lookups, and the buffer is only
+    wrapped as a DataFrame once all blocks have been added.
+    """
+
+    def __init__(self, index: pd.DatetimeIndex, columns: Iterable[Any], dtype=np.float32):
+        """
+        Args:
+            index: Dates of the result rows
+            columns: Station IDs of the result columns
+            dtype: NumPy dtype of the value buffer
+        """
+        self.index = pd.DatetimeIndex(index)
+        self.columns = list(columns)
+        self._values = np.full((len(self.index), len(self.columns)), np.nan, dtype=dtype)
+        self._row_lookup = {date: row for row, date in enumerate(self.index.strftime('%Y-%m-%d'))}
+        self._column_lookup = {station_id: col for col, station_id in enumerate(self.columns)}
+        self._month_of_row: Optional[np.ndarray] = None
+
+    @property
+    def values(self) -> np.ndarray:
+        """The underlying value buffer"""
+        return self._values
+
+    def row_for(self, date_str: str) -> int:
+        """Row position of a 'YYYY-MM-DD' date string, or -1 if outside the index"""
+        return self._row_lookup.get(date_str, -1)
+
+    def column_for(self, station_id: Any) -> int:
+        """Column position of a station ID, or -1 if unknown"""
+        return self._column_lookup.get(station_id, -1)
+
+    def add_block(self, block_data: Dict[str, Dict[Any, float]], scale: float = 1.0) -> int:
+        """
+        Write a block of sampled values into the buffer
+
+        Args:
+            block_data: Dict mapping date string to {station_id: value}
+            scale: Factor applied to every value in the block
+
+        Returns:
+            Number of values written
+        """
+        rows: List[int] = []
+        cols: List[int] = []
+        vals: List[float] = []
+
+        for date_str, station_values in block_data.items():
+            row = self._row_lookup.get(date_str)
+            if row is None:
+                continue
+
+            for station_id, value in station_values.items():
+                col = self._column_lookup.get(station_id)
+                if col is None or value is None:
+                    continue
+                rows.append(row)
+                cols.append(col)
+                vals.append(value)
+
+        if not vals:
+            return 0
+
+        values = np.asarray(vals, dtype=np.float64)
+        if scale != 1.0:
+            values *= scale
+        self._values[np.asarray(rows), np.asarray(cols)] = values
+        return len(vals)
+
+    def add_frame(self, frame: pd.DataFrame) -> None:
+        """
+        Write a date-indexed frame (e.g. a restored checkpoint) into the buffer
+
+        Rows and columns that are not part of this matrix are ignored.
+        """
+        rows = self.index.get_indexer(pd.DatetimeIndex(frame.index))
+        cols = np.array([self._column_lookup.get(station_id, -1) for station_id in frame.columns])
+        row_mask = rows >= 0
+        col_mask = cols >= 0
+        if not row_mask.any() or not col_mask.any():
+            return
+
+        values = frame.to_numpy(dtype=np.float64)[np.ix_(row_mask, col_mask)]
+        self._values[np.ix_(rows[row_mask], cols[col_mask])] = values
+
+    def month_keys(self) -> List[str]:
+        """Ordered 'YYYY-MM' keys of the months covered by the index"""
+        return list(dict.fromkeys(self.index.strftime('%Y-%m')))
+
+    def month_rows(self, month_key: str) -> np.ndarray:
+        """Row positions belonging to a 'YYYY-MM' month"""
+        if self._month_of_row is None:
+            self._month_of_row = np.asarray(self.index.strftime('%Y-%m'))
+        return np.flatnonzero(self._month_of_row == month_key)
+
+    def frame_for_rows(self, rows: np.ndarray) -> pd.DataFrame:
+        """Copy a subset of rows out of the buffer as a DataFrame"""
+        return pd.DataFrame(self._values[rows], index=self.index[rows], columns=self.columns)
+
+    def scale(self, factor: Union[float, np.ndarray]) -> None:
+        """
+        Multiply the buffer in place
+
+        Args:
+            factor: Scalar factor, or one factor per row
+        """
+        factor = np.asarray(factor, dtype=np.float64)
+        if factor.ndim == 1:
+            factor = factor[:, np.newaxis]
+        np.multiply(self._values, factor, out=self._values, casting='unsafe')
+
+    def to_frame(self) -> pd.DataFrame:
+        """Wrap the buffer as a typed DataFrame without copying"""
+        return pd.DataFrame(self._values, index=self.index, columns=self.columns, copy=False)
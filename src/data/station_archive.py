@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import gzip
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+from tqdm.auto import tqdm
+
+from config import GroundDataConfig
+from src.data.ground_fetcher import GroundDataFetcher
+from src.data.result_matrix import ResultMatrixBuilder
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+
+# Meteostat bulk daily files ("<station>.csv.gz") have no header; precipitation (mm)
+# is the fifth column after date, tavg, tmin and tmax
+METEOSTAT_DATE_COLUMN = 0
+METEOSTAT_PRCP_COLUMN = 4
+
+# GHCN-Daily .dly records: ID(11) YEAR(4) MONTH(2) ELEMENT(4), then 31 days of
+# VALUE(5) MFLAG(1) QFLAG(1) SFLAG(1). PRCP is in tenths of mm, -9999 is missing.
+GHCN_DAY_OFFSET = 21
+GHCN_DAY_WIDTH = 8
+GHCN_MISSING = -9999
+
+def read_meteostat_daily(path: Path) -> pd.Series:
+    """Daily precipitation (mm) of a Meteostat bulk daily file"""
+    table = pd.read_csv(path, header=None, usecols=[METEOSTAT_DATE_COLUMN, METEOSTAT_PRCP_COLUMN],
+                        names=['date', 'prcp'], compression='infer')
+    return pd.Series(table['prcp'].to_numpy(dtype=np.float32), index=pd.to_datetime(table['date']))
+
+def read_ghcn_dly(path: Path) -> pd.Series:
+    """
+    Daily precipitation (mm) of a GHCN-Daily .dly file
+
+    The file is read as one fixed-width byte matrix, so records are decoded with
+    array slicing rather than per-line parsing. Values that failed a quality
+    check (non-blank QFLAG) are treated as missing.
+    """
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rb') as f:
+        raw = f.read()
+    empty = pd.Series(dtype=np.float32, index=pd.DatetimeIndex([]))
+
+    lines = raw.replace(b'\r', b'').splitlines()
+    if not lines:
+        return empty
+    width = GHCN_DAY_OFFSET + 31 * GHCN_DAY_WIDTH
+    records = np.frombuffer(b''.join(line[:width].ljust(width) for line in lines),
+                            dtype='S1').reshape(len(lines), width)
+    records = records[_field(records, 17, 21) == b'PRCP']
+    if not len(records):
+        return empty
+
+    years = _field(records, 11, 15).astype(int)
+    months = _field(records, 15, 17).astype(int)
+    starts = (years - 1970) * 12 + (months - 1)
+    month_starts = starts.astype('datetime64[M]').astype('datetime64[D]')
+    month_days = ((starts + 1).astype('datetime64[M]').astype('datetime64[D]') - month_starts).astype(int)
+
+    days = np.arange(31)
+    offsets = GHCN_DAY_OFFSET + days * GHCN_DAY_WIDTH
+    values = np.stack([_field(records, o, o + 5).astype(int) for o in offsets], axis=1)
+    qflags = np.stack([records[:, o + 6] for o in offsets], axis=1)
+
+    valid = (values != GHCN_MISSING) & (qflags == b' ') & (days[np.newaxis, :] < month_days[:, np.newaxis])
+    dates = month_starts[:, np.newaxis] + days[np.newaxis, :]
+    series = pd.Series((values[valid] / 10.0).astype(np.float32), index=pd.DatetimeIndex(dates[valid]))
+    return series.sort_index()
+
+def _field(records: np.ndarray, start: int, end: int) -> np.ndarray:
+    """Columns [start, end) of a fixed-width byte matrix as one bytes value per record"""
+    return np.ascontiguousarray(records[:, start:end]).view(f'S{end - start}').ravel()
+
+def read_ghcn_stations(path: Path) -> pd.DataFrame:
+    """GHCN-Daily station list (ghcnd-stations.txt): ID, latitude and longitude"""
+    return pd.read_fwf(path, colspecs=[(0, 11), (12, 20), (21, 30)], header=None,
+                       names=['id', 'latitude', 'longitude'], dtype={'id': str})
+
+def _unit_vectors(latitude: np.ndarray, longitude: np.ndarray) -> np.ndarray:
+    lat, lon = np.radians(latitude), np.radians(longitude)
+    return np.column_stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+
+class ArchiveGroundDataFetcher(GroundDataFetcher):
+    """
+    Builds the ground matrix from bulk station archives on local disk.
+
+    Stations are selected exactly as in GroundDataFetcher, but their records are
+    read from ``config.archive_dir`` instead of the Meteostat API: Meteostat bulk
+    daily files named by station ID, or GHCN-Daily ``.dly`` files matched to the
+    stations by location through ``ghcnd-stations.txt``. Each file is decoded
+    with vectorised parsing and written straight into a preallocated
+    date × station matrix.
+    """
+
+    FORMATS = ('meteostat', 'ghcn')
+    GHCN_STATIONS_FILENAME = "ghcnd-stations.txt"
+
+    def __init__(self, config: GroundDataConfig):
+        super().__init__(config)
+        if config.archive_format not in self.FORMATS:
+            raise ValueError(f"Unknown archive format {config.archive_format!r}, expected one of {self.FORMATS}")
+        self.archive_dir = Path(config.archive_dir)
+        if not self.archive_dir.is_dir():
+            raise FileNotFoundError(f"Station archive directory {self.archive_dir} not found")
+
+    def _archive_files(self, metadata: pd.DataFrame, station_ids: list) -> Dict[Any, Path]:
+        """Archive file of each station that has one"""
+        if self.config.archive_format == 'meteostat':
+            files = {}
+            for station_id in station_ids:
+                for suffix in ('.csv.gz', '.csv'):
+                    path = self.archive_dir / f"{station_id}{suffix}"
+                    if path.exists():
+                        files[station_id] = path
+                        break
+            return files
+        return self._match_ghcn_files(metadata.loc[station_ids])
+
+    def _match_ghcn_files(self, metadata: pd.DataFrame) -> Dict[Any, Path]:
+        """GHCN-Daily file of the nearest GHCN station within ``ghcn_match_km`` of each station"""
+        inventory_path = self.archive_dir / self.GHCN_STATIONS_FILENAME
+        if not inventory_path.exists():
+            raise FileNotFoundError(f"{inventory_path} is needed to match GHCN files to stations")
+
+        available = {path.name.split('.')[0]: path for path in self.archive_dir.glob('*.dly*')}
+        ghcn = read_ghcn_stations(inventory_path)
+        ghcn = ghcn[ghcn['id'].isin(available)].reset_index(drop=True)
+        if ghcn.empty or metadata.empty:
+            return {}
+
+        tree = cKDTree(_unit_vectors(ghcn['latitude'].to_numpy(), ghcn['longitude'].to_numpy()))
+        # Chord length equivalent of the great-circle match distance
+        max_chord = 2 * np.sin(self.config.ghcn_match_km / EARTH_RADIUS_KM / 2)
+        distances, nearest = tree.query(
+            _unit_vectors(metadata['latitude'].to_numpy(), metadata['longitude'].to_numpy()),
+            distance_upper_bound=max_chord
+        )
+
+        files = {}
+        for station_id, distance, index in zip(metadata.index, distances, nearest):
+            if np.isfinite(distance):
+                files[station_id] = available[ghcn['id'].iat[index]]
+        logger.info(f"Matched {len(files)} of {len(metadata)} stations to GHCN-Daily files")
+        return files
+
+    def _fetch_matrix(self, metadata: pd.DataFrame, windows: Dict[Any, Tuple[datetime, datetime]],
+                      progress_range: tuple = (20, 90)) -> pd.DataFrame:
+        """
+        Read every station's archive into one date × station matrix
+
+        Files are decoded on ``config.max_concurrent_downloads`` threads and
+        written into the matrix as they arrive. Stations without an archive file,
+        or whose file cannot be read, are recorded in ``_failed_stations`` so
+        they keep their watermark.
+        """
+        self._failed_stations = set()
+        station_ids = list(windows)
+        if not station_ids:
+            return pd.DataFrame()
+
+        files = self._archive_files(metadata, station_ids)
+        self._failed_stations.update(station_id for station_id in station_ids if station_id not in files)
+        if self._failed_stations:
+            logger.warning(f"No archive file for {len(self._failed_stations)} stations")
+
+        start = min(window_start for window_start, _ in windows.values())
+        end = max(window_end for _, window_end in windows.values())
+        result = ResultMatrixBuilder(pd.date_range(start, end, freq='D'), list(files))
+        reader = read_meteostat_daily if self.config.archive_format == 'meteostat' else read_ghcn_dly
+
+        last_progress = None
+        max_workers = max(1, min(self.config.max_concurrent_downloads, len(files) or 1))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="archive") as pool, \
+                tqdm(total=len(files), desc="Reading station archives",
+                     disable=self.progress_callback is not None) as progress_bar:
+            futures = {pool.submit(reader, path): station_id for station_id, path in files.items()}
+            for done, future in enumerate(as_completed(futures), start=1):
+                station_id = futures[future]
+                try:
+                    series = future.result()
+                except Exception as e:
+                    logger.error(f"Error reading archive of station {station_id}: {e}")
+                    self._failed_stations.add(station_id)
+                else:
+                    window_start, window_end = windows[station_id]
+                    series = series[(series.index >= window_start) & (series.index <= window_end)]
+                    rows = result.index.get_indexer(series.index)
+                    keep = rows >= 0
+                    result.values[rows[keep], result.column_for(station_id)] = series.to_numpy()[keep]
+
+                progress_bar.update(1)
+                progress = int(progress_range[0] + done / len(files) * (progress_range[1] - progress_range[0]))
+                if self.progress_callback and progress != last_progress:
+                    self.progress_callback("Ground", progress)
+                    last_progress = progress
+
+        # Like API downloads, only stations with precipitation records become columns
+        data = result.to_frame()
+        return data.loc[:, data.notna().any()]
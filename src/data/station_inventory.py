@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Meteostat inventory columns bounding each station's daily record
+INVENTORY_START_COLUMN = 'daily_start'
+INVENTORY_END_COLUMN = 'daily_end'
+
+def expected_coverage(metadata: pd.DataFrame, start_year: int, end_year: int) -> pd.Series:
+    """
+    Share of the period's days inside each station's inventoried daily record
+
+    Stations without inventory dates get NaN.
+    """
+    period_start = pd.Timestamp(f"{start_year}-01-01")
+    period_end = pd.Timestamp(f"{end_year}-12-31")
+    record_start = pd.to_datetime(metadata[INVENTORY_START_COLUMN], errors='coerce')
+    record_end = pd.to_datetime(metadata[INVENTORY_END_COLUMN], errors='coerce')
+
+    overlap_start = record_start.clip(lower=period_start)
+    overlap_end = record_end.clip(upper=period_end)
+    overlap_days = ((overlap_end - overlap_start).dt.days + 1).clip(lower=0)
+    coverage = overlap_days / ((period_end - period_start).days + 1)
+    return coverage.where(record_start.notna() & record_end.notna(), np.nan)
+
+def prune_stations(metadata: pd.DataFrame, start_year: int, end_year: int,
+                   min_coverage: float = 0.0) -> pd.DataFrame:
+    """
+    Drop stations whose inventoried daily record cannot cover the period
+
+    A station is dropped when its record ends before ``start_year`` or starts
+    after ``end_year``, or when the record spans less than ``min_coverage`` of
+    the period's days. Stations without inventory dates are kept, and metadata
+    without the inventory columns is returned unchanged.
+
+    Args:
+        metadata: Station metadata with Meteostat's daily_start/daily_end columns
+        start_year: First year of the fetch
+        end_year: Last year of the fetch
+        min_coverage: Share of the period's days the record must span
+    """
+    if INVENTORY_START_COLUMN not in metadata.columns or INVENTORY_END_COLUMN not in metadata.columns:
+        logger.warning("Station metadata has no daily inventory, not pruning stations")
+        return metadata
+
+    coverage = expected_coverage(metadata, start_year, end_year)
+    keep = coverage.isna() | ((coverage > 0) & (coverage >= min_coverage))
+    dropped = int((~keep).sum())
+    if dropped:
+        logger.info(f"Pruned {dropped} of {len(metadata)} stations whose daily record does not cover "
+                    f"{start_year}-{end_year} (minimum expected coverage {min_coverage:.0%})")
+    return metadata.loc[keep.to_numpy()]
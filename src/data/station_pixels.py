@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# CRSs whose transforms map directly from longitude/latitude
+GEOGRAPHIC_CRS = {'EPSG:4326', 'EPSG:4269', 'EPSG:4267', 'EPSG:4258'}
+
+def _grid_cells(points: pd.DataFrame, projection: Dict[str, Any]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Column and row of each point on a north-up geographic grid
+
+    Returns:
+        Tuple of (cols, rows), or None if the projection is not such a grid
+    """
+    crs = projection.get('crs')
+    transform = projection.get('transform')
+    if crs not in GEOGRAPHIC_CRS or not transform or len(transform) < 6:
+        logger.debug(f"Cannot index stations on projection {crs}; sampling every station")
+        return None
+
+    x_scale, x_shear, x_origin, y_shear, y_scale, y_origin = transform[:6]
+    if x_shear != 0 or y_shear != 0 or x_scale == 0 or y_scale == 0:
+        return None
+
+    lon = points['longitude'].to_numpy(dtype=np.float64)
+    lat = points['latitude'].to_numpy(dtype=np.float64)
+    cols = np.floor((lon - x_origin) / x_scale).astype(np.int64)
+    rows = np.floor((lat - y_origin) / y_scale).astype(np.int64)
+    return cols, rows
+
+class StationPixelIndex:
+    """
+    Maps stations onto the pixels of a dataset's native grid.
+
+    Only the unique pixel centres need to be sampled; the sampled values are then
+    broadcast back to every station that falls in the same pixel.
+    """
+
+    def __init__(self, station_ids: List[Any], pixel_of_station: np.ndarray,
+                 pixel_lon: np.ndarray, pixel_lat: np.ndarray):
+        """
+        Args:
+            station_ids: Station IDs in sampling order
+            pixel_of_station: Index into the unique pixels for each station
+            pixel_lon: Longitude of each unique pixel centre
+            pixel_lat: Latitude of each unique pixel centre
+        """
+        self.station_ids = list(station_ids)
+        self.pixel_of_station = np.asarray(pixel_of_station)
+        self.pixel_lon = np.asarray(pixel_lon)
+        self.pixel_lat = np.asarray(pixel_lat)
+
+    @property
+    def n_pixels(self) -> int:
+        return len(self.pixel_lon)
+
+    @classmethod
+    def from_projection(cls, stations: pd.DataFrame,
+                        projection: Dict[str, Any]) -> Optional['StationPixelIndex']:
+        """
+        Build the index from an Earth Engine projection description
+
+        Args:
+            stations: Frame with 'id', 'latitude' and 'longitude' columns
+            projection: Output of ``image.projection().getInfo()``
+
+        Returns:
+            The index, or None if the projection is not a north-up geographic grid
+        """
+        cells = _grid_cells(stations, projection)
+        if cells is None:
+            return None
+        cols, rows = cells
+        x_scale, _, x_origin, _, y_scale, y_origin = projection['transform'][:6]
+
+        pixels, pixel_of_station = np.unique(np.stack([cols, rows], axis=1), axis=0,
+                                             return_inverse=True)
+        pixel_lon = x_origin + (pixels[:, 0] + 0.5) * x_scale
+        pixel_lat = y_origin + (pixels[:, 1] + 0.5) * y_scale
+
+        return cls(stations['id'].tolist(), pixel_of_station.reshape(-1), pixel_lon, pixel_lat)
+
+    def sample_points(self) -> pd.DataFrame:
+        """Unique pixel centres in the station metadata layout (id = pixel number)"""
+        return pd.DataFrame({
+            'id': np.arange(self.n_pixels),
+            'latitude': self.pixel_lat,
+            'longitude': self.pixel_lon
+        })
+
+    def expand(self, pixel_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Broadcast values sampled at pixel centres back to stations
+
+        Args:
+            pixel_data: Date-indexed frame with pixel numbers as columns
+
+        Returns:
+            Date-indexed frame with station IDs as columns
+        """
+        values = pixel_data.reindex(columns=np.arange(self.n_pixels)).to_numpy()
+        return pd.DataFrame(values[:, self.pixel_of_station], index=pixel_data.index,
+                            columns=self.station_ids)
+
+class PixelWindow:
+    """
+    Bounding window of a set of points on a dataset's native grid.
+
+    Whole time-stacked blocks of the window can be downloaded as arrays
+    (``ee.data.computePixels``) and every point sampled locally by indexing,
+    instead of sampling the points server-side.
+    """
+
+    def __init__(self, crs: str, transform: List[float], col_offset: int, row_offset: int,
+                 width: int, height: int, point_cols: np.ndarray, point_rows: np.ndarray):
+        """
+        Args:
+            crs: CRS code of the grid
+            transform: Affine transform of the full grid
+            col_offset: Grid column of the window's first column
+            row_offset: Grid row of the window's first row
+            width: Window width in pixels
+            height: Window height in pixels
+            point_cols: Window column of each point
+            point_rows: Window row of each point
+        """
+        self.crs = crs
+        self.transform = list(transform[:6])
+        self.col_offset = col_offset
+        self.row_offset = row_offset
+        self.width = width
+        self.height = height
+        self.point_cols = np.asarray(point_cols)
+        self.point_rows = np.asarray(point_rows)
+
+    @property
+    def n_pixels(self) -> int:
+        return self.width * self.height
+
+    @classmethod
+    def from_projection(cls, points: pd.DataFrame, projection: Dict[str, Any]) -> Optional['PixelWindow']:
+        """
+        Window covering every point
+
+        Args:
+            points: Frame with 'latitude' and 'longitude' columns
+            projection: Output of ``image.projection().getInfo()``
+
+        Returns:
+            The window, or None if the projection is not a north-up geographic grid
+        """
+        if len(points) == 0:
+            return None
+        cells = _grid_cells(points, projection)
+        if cells is None:
+            return None
+        cols, rows = cells
+
+        col_offset, row_offset = int(cols.min()), int(rows.min())
+        return cls(projection['crs'], projection['transform'], col_offset, row_offset,
+                   width=int(cols.max()) - col_offset + 1, height=int(rows.max()) - row_offset + 1,
+                   point_cols=cols - col_offset, point_rows=rows - row_offset)
+
+    def grid(self) -> Dict[str, Any]:
+        """``computePixels`` grid description of the window"""
+        x_scale, _, x_origin, _, y_scale, y_origin = self.transform
+        return {
+            'dimensions': {'width': self.width, 'height': self.height},
+            'affineTransform': {
+                'scaleX': x_scale,
+                'shearX': 0,
+                'translateX': x_origin + self.col_offset * x_scale,
+                'shearY': 0,
+                'scaleY': y_scale,
+                'translateY': y_origin + self.row_offset * y_scale
+            },
+            'crsCode': self.crs
+        }
+
+    def sample(self, band: np.ndarray) -> np.ndarray:
+        """Values of a (height, width) band array at every point"""
+        return band[self.point_rows, self.point_cols]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Regression tests of the gridded fetch paths against the in-process Earth Engine stand-in.
+
+Each test fetches synthetic rasters through GriddedDataFetcher and compares the
+result with the raster values at the stations, so batching, retries and
+checkpointing are exercised without network access.
+"""
+
+import numpy as np
+import pandas as pd
+
+from config import GriddedDataConfig
+from src.data.fake_ee import FakeEarthEngine, FakeEEException
+from src.data.gridded_fetcher import GriddedDataFetcher
+
+YEAR = 2000
+
+class FlakyEarthEngine(FakeEarthEngine):
+    """Fake backend whose sampling requests fail once ``sampling_budget`` of them succeeded"""
+
+    sampling_budget = None
+
+    def _request(self, evaluate, label):
+        if label == 'sampleRegions' and self.sampling_budget is not None:
+            if self.sampling_budget <= 0:
+                raise FakeEEException("Internal error.")
+            self.sampling_budget -= 1
+        return super()._request(evaluate, label)
+
+def write_stations(data_dir, n_stations, bounds, seed=0):
+    """Random stations inside (west, south, east, north)"""
+    rng = np.random.default_rng(seed)
+    west, south, east, north = bounds
+    stations = pd.DataFrame({
+        'id': [f"S{i:04d}" for i in range(n_stations)],
+        'latitude': rng.uniform(south, north, n_stations),
+        'longitude': rng.uniform(west, east, n_stations)
+    })
+    stations.to_csv(data_dir / "stations_metadata.csv", index=False)
+    return stations
+
+def make_config(data_dir, datasets, **kwargs):
+    config = GriddedDataConfig(start_year=YEAR, end_year=YEAR, data_dir=str(data_dir),
+                               prune_by_inventory=False, max_concurrent_requests=1, **kwargs)
+    for name in datasets:
+        config.datasets[name].enabled = True
+    return config
+
+def make_backend(config, backend_class=FakeEarthEngine, **kwargs):
+    return backend_class.synthetic(config.get_enabled_datasets(), start=f"{YEAR - 1}-01-01",
+                                   end=f"{YEAR + 2}-01-01", **kwargs)
+
+def expected_daily(backend, dataset, stations):
+    """Date × station values of a dataset's raster at the stations over YEAR"""
+    raster = backend.rasters[dataset.collection_name]
+    days = pd.date_range(f"{YEAR}-01-01", f"{YEAR}-12-31", freq='D')
+    times = pd.to_datetime(raster.times, unit='ms')
+    lon = stations['longitude'].to_numpy()
+    lat = stations['latitude'].to_numpy()
+    values = np.stack([raster.sample(times.get_loc(day), lon, lat) for day in days])
+    return pd.DataFrame(values * dataset.conversion_factor, index=days, columns=stations['id'].tolist())
+
+def assert_matches(actual, expected):
+    actual = actual.reindex(index=expected.index, columns=expected.columns)
+    np.testing.assert_allclose(actual.to_numpy(dtype=float), expected.to_numpy(dtype=float), rtol=1e-5)
+
+def test_daily_fetch_matches_raster(tmp_path):
+    stations = write_stations(tmp_path, 20, (-100.0, 35.0, -95.0, 40.0))
+    config = make_config(tmp_path, ['CHIRPS'])
+    backend = make_backend(config)
+
+    data = GriddedDataFetcher(config, ee_backend=backend).fetch_data()
+
+    assert_matches(data['CHIRPS'], expected_daily(backend, config.datasets['CHIRPS'], stations))
+    assert backend.stats.by_label.get('sampleRegions', 0) > 0
+    assert 'computePixels' not in backend.stats.by_label
+
+def test_monthly_composites_match_daily_sums(tmp_path):
+    stations = write_stations(tmp_path, 20, (-100.0, 35.0, -95.0, 40.0))
+    config = make_config(tmp_path, ['CHIRPS'], output_resolution='monthly')
+    backend = make_backend(config)
+
+    data = GriddedDataFetcher(config, ee_backend=backend).fetch_data()
+
+    daily = expected_daily(backend, config.datasets['CHIRPS'], stations)
+    monthly = daily.groupby(daily.index.to_period('M')).sum()
+    monthly.index = monthly.index.to_timestamp()
+    assert_matches(data['CHIRPS'], monthly)
+
+def test_dense_stations_are_downloaded_as_pixel_blocks(tmp_path):
+    stations = write_stations(tmp_path, 200, (-98.0, 36.0, -96.0, 38.0))
+    config = make_config(tmp_path, ['CHIRPS'])
+    backend = make_backend(config)
+
+    data = GriddedDataFetcher(config, ee_backend=backend).fetch_data()
+
+    assert_matches(data['CHIRPS'], expected_daily(backend, config.datasets['CHIRPS'], stations))
+    assert backend.stats.by_label.get('computePixels', 0) > 0
+    assert 'sampleRegions' not in backend.stats.by_label
+
+def test_fetch_resumes_from_checkpoints_after_failures(tmp_path):
+    stations = write_stations(tmp_path, 20, (-100.0, 35.0, -95.0, 40.0))
+    config = make_config(tmp_path, ['CHIRPS'])
+    dataset = config.datasets['CHIRPS']
+
+    # Requests after the first two blocks fail, down to single days
+    flaky = make_backend(config, FlakyEarthEngine)
+    flaky.sampling_budget = 2
+    partial = GriddedDataFetcher(config, ee_backend=flaky).fetch_data()['CHIRPS']
+    assert partial.notna().any().any()
+    assert partial.isna().all(axis=1).any()
+
+    # Failed months were not checkpointed; only they are fetched again
+    backend = make_backend(config)
+    data = GriddedDataFetcher(config, ee_backend=backend).fetch_data()
+
+    assert_matches(data['CHIRPS'], expected_daily(backend, dataset, stations))
+    fresh_dir = tmp_path / "fresh"
+    fresh_dir.mkdir()
+    write_stations(fresh_dir, 20, (-100.0, 35.0, -95.0, 40.0))
+    fresh_config = make_config(fresh_dir, ['CHIRPS'])
+    fresh = make_backend(fresh_config)
+    GriddedDataFetcher(fresh_config, ee_backend=fresh).fetch_data()
+    assert 0 < backend.stats.by_label['sampleRegions'] < fresh.stats.by_label['sampleRegions']
+
+def test_memory_errors_are_retried_with_a_higher_tile_scale(tmp_path):
+    stations = write_stations(tmp_path, 20, (-100.0, 35.0, -95.0, 40.0))
+    config = make_config(tmp_path, ['CHIRPS'])
+    # A three-month block for every station only fits with tileScale=4
+    backend = make_backend(config, max_values=20 * 23)
+    fetcher = GriddedDataFetcher(config, ee_backend=backend)
+
+    data = fetcher.fetch_data()
+
+    assert_matches(data['CHIRPS'], expected_daily(backend, config.datasets['CHIRPS'], stations))
+    assert backend.stats.failures > 0
+    assert fetcher.request_sizes.sizer_for('CHIRPS', 3, 12, 20).current().tile_scale == 4
+
+def test_stacked_datasets_share_sampling_requests(tmp_path):
+    stations = write_stations(tmp_path, 20, (-100.0, 35.0, -95.0, 40.0))
+    config = make_config(tmp_path, ['CHIRPS', 'PRISM'], stack_daily_datasets=True)
+    backend = make_backend(config)
+
+    data = GriddedDataFetcher(config, ee_backend=backend).fetch_data()
+
+    for name in ('CHIRPS', 'PRISM'):
+        assert_matches(data[name], expected_daily(backend, config.datasets[name], stations))
+    # Both datasets come from the same requests
+    samples = backend.stats.by_label['sampleRegions']
+    assert samples <= len(pd.period_range(f"{YEAR}-01", f"{YEAR}-12", freq='M'))
@@ -6,6 +6,8 @@ import os
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+from utils.ee_session import EESession, get_session
+
 logger = logging.getLogger(__name__)
 
 # Try to import Earth Engine
@@ -19,79 +21,70 @@ class EarthEngineUtils:
     """Utility functions for Earth Engine operations"""
     
     @staticmethod
-    def check_ee_initialized(project_id: Optional[str] = None) -> bool:
+    def check_ee_initialized(project_id: Optional[str] = None,
+                             session: Optional[EESession] = None) -> bool:
         """
         Check if Earth Engine is initialized or can be initialized
         
         Args:
             project_id: Optional project ID to use for initialization
+            session: Earth Engine session, defaults to the shared one
             
         Returns:
             bool: True if Earth Engine is or can be initialized, False otherwise
         """
-        if not EARTH_ENGINE_AVAILABLE:
+        session = session or get_session()
+        if not session.available:
             logger.error("Earth Engine API not available. Install with: pip install earthengine-api")
             return False
             
-        try:
-            # Try to use Earth Engine - will fail if not initialized
-            ee.Number(1).getInfo()
-            logger.info("Earth Engine already initialized")
-            return True
-        except Exception:
-            # Not initialized, try to initialize
-            try:
-                if project_id:
-                    logger.info(f"Initializing Earth Engine with project ID: {project_id}")
-                    ee.Initialize(project=project_id)
-                else:
-                    logger.info("Initializing Earth Engine with default credentials")
-                    ee.Initialize()
-                
-                # Test if initialization worked
-                ee.Number(1).getInfo()
-                logger.info("Earth Engine initialized successfully")
-                return True
-            except Exception as e:
-                logger.error(f"Failed to initialize Earth Engine: {str(e)}")
-                return False
+        # Initialisation happens once per process; the probe result is cached
+        return session.initialize(project_id) and session.check_health()
                 
     @staticmethod
-    def check_auth_status() -> Dict[str, Any]:
+    def check_auth_status(session: Optional[EESession] = None) -> Dict[str, Any]:
         """
         Check Earth Engine authentication status
         
+        Args:
+            session: Earth Engine session, defaults to the shared one
+            
         Returns:
             Dict with authentication status information
         """
+        session = session or get_session()
         result = {
-            'available': EARTH_ENGINE_AVAILABLE,
+            'available': session.available,
             'authenticated': False,
             'error': None,
             'project_id': None
         }
         
-        if not EARTH_ENGINE_AVAILABLE:
+        if not session.available:
             result['error'] = "Earth Engine API not available"
             return result
             
         try:
-            # Try to get the initialized status
-            initialized = ee.data._initialized
+            # Use the session state (health probes are cached)
+            initialized = session.initialized and session.check_health()
             result['authenticated'] = initialized
+            result['project_id'] = session.project_id
+            if session.initializing:
+                result['error'] = "Earth Engine is still initializing"
+            elif session.last_error:
+                result['error'] = session.last_error
             
             if initialized:
                 # Try to get project info
                 try:
                     # This might not always work depending on EE version
                     # and authentication method
-                    info = ee.data.getProjectsInfo()
+                    info = session.backend.data.getProjectsInfo()
                     if info:
                         result['project_id'] = info[0]['name']
                 except:
-                    # Fall back to simple test
-                    test = ee.Number(1).getInfo()
-                    result['authenticated'] = test == 1
+                    # Keep the session's project ID
+                    pass
             
             return result
         except Exception as e:
@@ -99,12 +92,14 @@ class EarthEngineUtils:
             return result
             
     @staticmethod
-    def authenticate(project_id: Optional[str] = None) -> bool:
+    def authenticate(project_id: Optional[str] = None,
+                     session: Optional[EESession] = None) -> bool:
         """
         Trigger Earth Engine authentication
         
         Args:
             project_id: Optional project ID to use
+            session: Earth Engine session, defaults to the shared one
             
         Returns:
             bool: True if authentication succeeded, False otherwise
@@ -120,20 +115,26 @@ class EarthEngineUtils:
             else:
                 ee.Authenticate()
                 
-            return EarthEngineUtils.check_ee_initialized(project_id)
+            # New credentials: the session has to initialise again
+            session = session or get_session()
+            session.invalidate()
+            return EarthEngineUtils.check_ee_initialized(project_id, session)
         except Exception as e:
             logger.error(f"Earth Engine authentication failed: {str(e)}")
             return False
             
     @staticmethod
-    def get_available_collections() -> List[str]:
+    def get_available_collections(session: Optional[EESession] = None) -> List[str]:
         """
         Get list of available Earth Engine collections
         
+        Args:
+            session: Earth Engine session, defaults to the shared one
+            
         Returns:
             List of collection names
         """
-        if not EarthEngineUtils.check_ee_initialized():
+        if not EarthEngineUtils.check_ee_initialized(session=session):
             return []
             
         try:
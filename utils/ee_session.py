@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from src.data.ee_backend import EEBackend, get_default_backend
+
+logger = logging.getLogger(__name__)
+
+class EESession:
+    """
+    Process-wide Earth Engine session.
+
+    Initialisation happens once (optionally in a background thread started at
+    application startup) and is shared by every caller; callers that need
+    Earth Engine simply wait for it. Health probes are cached for
+    ``health_ttl`` seconds so repeated status checks cost no network round trip.
+    """
+
+    def __init__(self, backend: Optional[EEBackend] = None, health_ttl: float = 300.0):
+        """
+        Args:
+            backend: Earth Engine backend, defaults to the earthengine-api module
+            health_ttl: Seconds a health probe result is reused
+        """
+        self.backend = backend if backend is not None else get_default_backend()
+        self.health_ttl = health_ttl
+        self.project_id: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._init_thread: Optional[threading.Thread] = None
+        self._health: Optional[bool] = None
+        self._health_checked = 0.0
+
+    @property
+    def available(self) -> bool:
+        """Whether an Earth Engine backend is installed"""
+        return self.backend is not None
+
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+
+    @property
+    def initializing(self) -> bool:
+        """Whether a background initialisation is still running"""
+        return self._init_thread is not None and self._init_thread.is_alive()
+
+    def start_background(self, project_id: Optional[str] = None) -> None:
+        """Start initialising in a daemon thread; later initialize() calls wait for it"""
+        if not self.available or self._initialized:
+            return
+        with self._lock:
+            if self._init_thread is not None and self._init_thread.is_alive():
+                return
+            self._init_thread = threading.Thread(target=self.initialize, args=(project_id,),
+                                                 name="ee-session-init", daemon=True)
+            self._init_thread.start()
+
+    def initialize(self, project_id: Optional[str] = None) -> bool:
+        """
+        Initialise Earth Engine once for the process
+
+        Args:
+            project_id: Cloud project to use; a different project than the one
+                the session was initialised with triggers a re-initialisation
+
+        Returns:
+            bool: True if Earth Engine is ready
+        """
+        if not self.available:
+            self.last_error = "Earth Engine API not available"
+            logger.warning("Earth Engine API not available. Install with: pip install earthengine-api")
+            return False
+
+        # Wait for a background initialisation started at startup
+        init_thread = self._init_thread
+        if init_thread is not None and init_thread is not threading.current_thread():
+            init_thread.join()
+
+        with self._lock:
+            if self._initialized and (project_id is None or project_id == self.project_id):
+                return True
+
+            try:
+                logger.info(f"Initializing Earth Engine with project ID: {project_id}")
+                started = time.perf_counter()
+                self.backend.initialize(project_id)
+                self._initialized = True
+                self.project_id = project_id
+                self.last_error = None
+                self._health = None
+                logger.info(f"Earth Engine initialized successfully in {time.perf_counter() - started:.1f}s")
+                return True
+            except Exception as e:
+                self.last_error = str(e)
+                logger.error(f"Failed to initialize Earth Engine: {str(e)}")
+                return False
+
+    def check_health(self, force: bool = False) -> bool:
+        """
+        Check that Earth Engine answers requests, reusing recent results
+
+        Args:
+            force: Probe even if a cached result is still fresh
+        """
+        if not self._initialized:
+            return False
+
+        now = time.time()
+        if not force and self._health is not None and now - self._health_checked < self.health_ttl:
+            return self._health
+
+        try:
+            healthy = self.backend.Number(1).getInfo() == 1
+            self.last_error = None
+        except Exception as e:
+            healthy = False
+            self.last_error = str(e)
+            logger.warning(f"Earth Engine health check failed: {str(e)}")
+
+        self._health = healthy
+        self._health_checked = now
+        return healthy
+
+    def invalidate(self) -> None:
+        """Forget the session state, e.g. after re-authenticating"""
+        with self._lock:
+            self._initialized = False
+            self._health = None
+
+_session: Optional[EESession] = None
+_session_lock = threading.Lock()
+
+def get_session() -> EESession:
+    """The process-wide Earth Engine session"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = EESession()
+        return _session
+
+def set_session(session: EESession) -> None:
+    """Replace the process-wide session (e.g. with one using an offline backend)"""
+    global _session
+    with _session_lock:
+        _session = session
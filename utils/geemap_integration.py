@@ -6,6 +6,7 @@ import sys
 import json
 import tempfile
 import logging
+from typing import Optional
 from pathlib import Path
 import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
@@ -13,14 +14,9 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QTabWidget, QFormLayout, QLineEdit, QGroupBox)
 from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
 
-logger = logging.getLogger(__name__)
+from utils.ee_session import EESession, get_session
 
-try:
-    import ee
-    GEEMAP_AVAILABLE = True
-except ImportError:
-    GEEMAP_AVAILABLE = False
-    logger.warning("ee is not available. Install with: pip install earthengine-api")
+logger = logging.getLogger(__name__)
 
 # Define CONUS (Continental US) bounding box
 CONUS_BOUNDS = {
@@ -36,11 +32,13 @@ class DrawMapWidget(QWidget):
     # Signal emitted when a valid polygon is defined
     polygon_drawn = pyqtSignal(object)  # Emits the GeoJSON of the defined polygon
     
-    def __init__(self, parent=None, project_id=None):
+    def __init__(self, parent=None, project_id=None, session: Optional[EESession] = None):
         super().__init__(parent)
         
         # Store the Earth Engine project ID
         self.project_id = project_id
+        # Earth Engine session, the shared one unless injected
+        self.session = session or get_session()
         self.ee_initialized = False
         self.drawn_features = None
         
@@ -51,28 +49,15 @@ class DrawMapWidget(QWidget):
         self.project_id = project_id
     
     def initialize_earth_engine(self):
-        """Initialize Earth Engine with the project ID"""
-        if not GEEMAP_AVAILABLE:
+        """Initialize Earth Engine with the project ID through the shared session"""
+        if not self.session.available:
+            logger.warning("ee is not available. Install with: pip install earthengine-api")
             return False
             
-        if self.ee_initialized:
-            return True
-            
-        try:
-            # Initialize Earth Engine with the project ID
-            if self.project_id:
-                logger.info(f"Initializing Earth Engine with project ID: {self.project_id}")
-                ee.Initialize(project=self.project_id)
-            else:
-                logger.info("Initializing Earth Engine with default credentials")
-                ee.Initialize()
-                
-            self.ee_initialized = True
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize Earth Engine: {str(e)}")
-            self.status_label.setText(f"Error initializing Earth Engine: {str(e)}")
-            return False
+        self.ee_initialized = self.session.initialize(self.project_id)
+        if not self.ee_initialized:
+            self.status_label.setText(f"Error initializing Earth Engine: {self.session.last_error}")
+        return self.ee_initialized
         
     def init_ui(self):
         """Initialize the UI components"""
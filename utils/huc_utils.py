@@ -1,6 +1,5 @@
 # Add this to utils/huc_utils.py
 
-import ee
 import geopandas as gpd
 import pandas as pd
 from shapely.geometry import Polygon, Point
@@ -9,17 +8,32 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from src.data.ee_memo import GetInfoMemo
+from utils.ee_session import EESession, get_session
+
 logger = logging.getLogger(__name__)
 
 class HUCDataProvider:
     """Provider for HUC watershed data from Earth Engine"""
     
-    def __init__(self, cache_dir: str = "Data/HUC", project_id: str = None):
+    def __init__(self, cache_dir: str = "Data/HUC", project_id: str = None,
+                 session: Optional[EESession] = None):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.huc_metadata = None
         self.huc_boundaries = None
         self.project_id = project_id
+        # Shared Earth Engine session, initialised once per process; its backend
+        # builds every request
+        self.session = session or get_session()
+        self.ee = self.session.backend
+        # HUC features are static; memoize their getInfo responses
+        self.memo = GetInfoMemo(self.cache_dir / "ee_memo")
+        
+    def _ensure_earth_engine(self) -> None:
+        """Make sure the shared Earth Engine session is initialised"""
+        if not self.session.initialize(self.project_id):
+            raise RuntimeError(f"Earth Engine initialization failed: {self.session.last_error}")
         
     def fetch_huc_metadata(self, force_refresh: bool = False) -> pd.DataFrame:
         """Fetch HUC metadata from Earth Engine or load from cache"""
@@ -31,18 +45,15 @@ class HUCDataProvider:
             return pd.read_csv(cache_file, dtype={'huc_id': str})
         
         try:
-            # Initialize Earth Engine
-            import ee
-            if self.project_id:
-                ee.Initialize(project=self.project_id)
-            else:
-                ee.Initialize()
+            # Initialize Earth Engine (no-op once the session is up)
+            self._ensure_earth_engine()
             
             # Get HUC data
-            huc_collection = ee.FeatureCollection("USGS/WBD/2017/HUC04")
+            huc_collection = self.ee.FeatureCollection("USGS/WBD/2017/HUC04")
             
             # Get metadata: HUC ID, name, state, etc.
-            huc_list = huc_collection.getInfo()['features']
+            huc_list = self.memo.get_info(huc_collection, bypass=force_refresh)['features']
+            self.memo.flush()
             
             # Extract relevant properties
             metadata = []
@@ -77,18 +88,14 @@ class HUCDataProvider:
             return gpd.read_file(cache_file)
         
         try:
-            # Initialize Earth Engine with project ID
-            import ee
-            if self.project_id:
-                ee.Initialize(project=self.project_id)
-            else:
-                ee.Initialize()
+            # Initialize Earth Engine (no-op once the session is up)
+            self._ensure_earth_engine()
             
             # Use the same HUC04 collection as in fetch_huc_metadata
-            huc_collection = ee.FeatureCollection("USGS/WBD/2017/HUC04")
+            huc_collection = self.ee.FeatureCollection("USGS/WBD/2017/HUC04")
             
             # Use 'huc4' property for filtering instead of 'huc8'
-            huc_feature = huc_collection.filter(ee.Filter.eq('huc4', huc_id)).first()
+            huc_feature = huc_collection.filter(self.ee.Filter.eq('huc4', huc_id)).first()
             
             # Get the geometry
             huc_geom = huc_feature.geometry()
@@ -97,7 +104,8 @@ class HUCDataProvider:
             simplified_geom = huc_geom.simplify(maxError=simplify_tolerance)
             
             # Get GeoJSON representation
-            geojson = simplified_geom.getInfo()
+            geojson = self.memo.get_info(simplified_geom)
+            self.memo.flush()
             
             # Convert to GeoDataFrame
             geometry = Polygon(geojson['coordinates'][0])